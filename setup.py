@@ -37,6 +37,7 @@ REQUIRES = [
 
 
 TESTS_REQUIRE = [
+    'numpy',
     'zope.i18nmessageid',
     'zope.testing',
     'zope.testrunner',
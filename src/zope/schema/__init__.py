@@ -46,6 +46,7 @@ from zope.schema._field import MutableSequence
 from zope.schema._field import NativeString
 from zope.schema._field import NativeStringLine
 from zope.schema._field import Number
+from zope.schema._field import NumericArray
 from zope.schema._field import Object
 from zope.schema._field import Orderable
 from zope.schema._field import Password
@@ -61,12 +62,14 @@ from zope.schema._field import Time
 from zope.schema._field import Timedelta
 from zope.schema._field import Tuple
 # Schema APIs
+from zope.schema._schema import compileSchema
 from zope.schema._schema import getFieldNames
 from zope.schema._schema import getFieldNamesInOrder
 from zope.schema._schema import getFields
 from zope.schema._schema import getFieldsInOrder
 from zope.schema._schema import getSchemaValidationErrors
 from zope.schema._schema import getValidationErrors
+from zope.schema._schema import setStrictBinding
 # Acessor API
 from zope.schema.accessors import accessors
 # Error API
@@ -104,6 +107,7 @@ __all__ = [
     'NativeString',
     'NativeStringLine',
     'Number',
+    'NumericArray',
     'Object',
     'Orderable',
     'PythonIdentifier',
@@ -119,6 +123,8 @@ __all__ = [
     'Timedelta',
     'Tuple',
     'URI',
+    'compileSchema',
+    'setStrictBinding',
     'getFields',
     'getFieldsInOrder',
     'getFieldNames',
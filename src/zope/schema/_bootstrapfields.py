@@ -15,12 +15,17 @@
 """
 __docformat__ = 'restructuredtext'
 
+import array
 import decimal
 import fractions
 import numbers
 import sys
 import threading
+import types
 import unicodedata
+import weakref
+from collections import abc
+from functools import cached_property
 from math import isinf
 
 from zope.event import notify
@@ -55,6 +60,13 @@ from zope.schema._bootstrapinterfaces import ValidationError
 from zope.schema._bootstrapinterfaces import WrongType
 
 
+try:
+    import numpy
+except ModuleNotFoundError:  # pragma: no cover
+    # Arrays are then validated without it.
+    numpy = None
+
+
 class _NotGiven:
 
     def __repr__(self):  # pragma: no cover
@@ -114,13 +126,16 @@ class DefaultProperty(ValidatedProperty):
 
 def getFields(schema):
     """Return a dictionary containing all the Fields in a schema.
+
+    .. versionchanged:: 7.2
+       The fields are cached by `compileSchema`; a new dictionary is
+       returned each time.
     """
-    fields = {}
-    for name in schema:
-        attr = schema[name]
-        if IValidatable.providedBy(attr):
-            fields[name] = attr
-    return fields
+    return dict(compileSchema(schema).fields)
+
+
+# See Field.__get_property_names_to_compare
+_property_names_by_declaration = weakref.WeakKeyDictionary()
 
 
 class _DocStringHelpers:
@@ -207,6 +222,14 @@ class Field(Attribute):
 
     default = DefaultProperty('default')
 
+    # Whether the behaviour of the field can depend on the context it is
+    # bound to. When None, this is inferred by _isContextSensitive.
+    # Internal callers (schema validation, FieldProperty, collections)
+    # skip ``bind`` for fields that are not context sensitive, unless
+    # strict binding is enabled with ``setStrictBinding``. Subclasses that
+    # read ``self.context`` in unexpected places can set this to True.
+    context_sensitive = None
+
     # These were declared as slots in zope.interface, we override them here to
     # get rid of the descriptors so they don't break .bind()
     __name__ = None
@@ -284,37 +307,117 @@ class Field(Attribute):
         clone.context = context
         return clone
 
+    # Keys of the instance dictionary that hold state derived from the
+    # other attributes of the field. They are discarded whenever an
+    # attribute (other than ``context``) is set or deleted, and are never
+    # pickled or copied.
+    _derived_state_keys = (
+        '_v_validation_plan',
+        '_v_context_sensitive',
+        '_v_hash',
+        '_v_static_default',
+    )
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Discard *after* setting: validated properties may compile a
+        # new plan while checking the value, based on the old state.
+        if name != 'context':
+            self._discardDerivedState()
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        self._discardDerivedState()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in self._derived_state_keys:
+            state.pop(key, None)
+        return state
+
+    def _discardDerivedState(self):
+        d = self.__dict__
+        for key in self._derived_state_keys:
+            if key in d:
+                del d[key]
+
+    def _isContextSensitive(self):
+        # Unless declared otherwise, a field is context sensitive if it
+        # has a context aware default factory, if any of the methods
+        # involved in binding and validation comes from outside of
+        # zope.schema (and might use the context), or if a class from
+        # outside of zope.schema computes attributes (such as ``max``)
+        # with a descriptor.
+        if self.context_sensitive is not None:
+            return bool(self.context_sensitive)
+        if IContextAwareDefaultFactory.providedBy(self.defaultFactory):
+            return True
+        cls = type(self)
+        for name in ('bind', 'validate', '_validate', 'constraint'):
+            module = getattr(getattr(cls, name), '__module__', None)
+            if module not in _CONTEXT_FREE_MODULES:
+                return True
+        for klass in cls.__mro__:
+            if (klass.__module__ in _CONTEXT_FREE_MODULES
+                    or klass in Field.__mro__):
+                continue
+            for name, value in vars(klass).items():
+                if (hasattr(type(value), '__get__')
+                        and not isinstance(value, (types.FunctionType,
+                                                   ValidatedProperty))
+                        and not (name.startswith('__')
+                                 and name.endswith('__'))):
+                    return True
+        return False
+
     def validate(self, value):
-        if value == self.missing_value:
-            if self.required:
-                raise RequiredMissing(
-                    self.__name__
-                ).with_field_and_value(self, value)
-        else:
-            try:
-                self._validate(value)
-            except StopValidation:
-                pass
+        try:
+            plan = self.__dict__['_v_validation_plan']
+        except KeyError:
+            plan = self.__dict__['_v_validation_plan'] = (
+                _compile_validation_plan(self))
+        try:
+            plan(self, value)
+        except StopValidation:
+            pass
 
     def __get_property_names_to_compare(self):
-        # Return the set of property names to compare, ignoring
-        # order
+        # Return the tuple of property names to compare, ignoring
+        # order. They only depend on the interfaces we provide, so they
+        # are cached for each declaration, for as long as its resolution
+        # order (replaced by zope.interface on any change) is the same.
+        declaration = providedBy(self)
+        sro = declaration.__sro__
+        cached = _property_names_by_declaration.get(declaration)
+        if cached is not None and cached[0] is sro:
+            return cached[1]
+
         names = {}  # used as set of property names, ignoring values
-        for interface in providedBy(self):
-            names.update(getFields(interface))
+        for interface in declaration:
+            names.update(compileSchema(interface).fields)
 
         # order will be different always, don't compare it
         names.pop('order', None)
+        names = tuple(names)
+        _property_names_by_declaration[declaration] = (sro, names)
         return names
 
     def __hash__(self):
         # Equal objects should have equal hashes;
         # equal hashes does not imply equal objects.
-        value = (
+        # The hash is cached until an attribute is set (which includes
+        # changes to ``interface`` and directly provided interfaces) or
+        # the interfaces we implement change.
+        sro = providedBy(self).__sro__
+        cached = self.__dict__.get('_v_hash')
+        if cached is not None and cached[0] is sro:
+            return cached[1]
+        value = hash(
             (type(self), self.interface) +
-            tuple(self.__get_property_names_to_compare())
+            self.__get_property_names_to_compare()
         )
-        return hash(value)
+        self.__dict__['_v_hash'] = (sro, value)
+        return value
 
     def __eq__(self, other):
         # should be the same type and in the same interface (or no interface
@@ -345,18 +448,7 @@ class Field(Attribute):
                 value, self._type, self.__name__
             ).with_field_and_value(self, value)
 
-        try:
-            constraint = self.constraint(value)
-        except ValidationError as e:
-            if e.field is None:
-                e.field = self
-            if e.value is None:
-                e.value = value
-            raise
-        if not constraint:
-            raise ConstraintNotSatisfied(
-                value, self.__name__
-            ).with_field_and_value(self, value)
+        _check_constraint(self, value)
 
     def get(self, object):
         return getattr(object, self.__name__)
@@ -428,6 +520,66 @@ class Field(Attribute):
         return '\n'.join(lines)
 
 
+# Modules whose field implementations are known not to use the context,
+# except where they say so (see Field._isContextSensitive).
+_CONTEXT_FREE_MODULES = frozenset((
+    'zope.schema._bootstrapfields',
+    'zope.schema._field',
+))
+
+_strict_binding = False
+
+
+def setStrictBinding(strict):
+    """
+    Control whether fields are always bound before use.
+
+    By default, schema validation, `~zope.schema.fieldproperty.FieldProperty`
+    and collection fields only ``bind`` fields whose behaviour can
+    depend on the context (see ``Field.context_sensitive``). Passing a
+    true value restores binding every field, every time.
+
+    .. versionadded:: 7.2
+    """
+    global _strict_binding
+    _strict_binding = bool(strict)
+
+
+def _is_context_sensitive(field):
+    if _strict_binding or not isinstance(field, Field):
+        return True
+    try:
+        return field.__dict__['_v_context_sensitive']
+    except KeyError:
+        sensitive = field.__dict__['_v_context_sensitive'] = (
+            field._isContextSensitive())
+        return sensitive
+
+
+def _bind_if_needed(field, context):
+    # Return *field* bound to *context*, or *field* itself when binding
+    # could not change its behaviour.
+    if _is_context_sensitive(field):
+        return field.bind(context)
+    return field
+
+
+def _static_default(field):
+    # Return the default of *field* if it is a plain value, which can be
+    # read without binding the field or calling a factory, or _NotGiven.
+    if _strict_binding or not isinstance(field, Field):
+        return _NotGiven
+    try:
+        return field.__dict__['_v_static_default']
+    except KeyError:
+        default = _NotGiven
+        if (field.defaultFactory is None
+                and type(field).default is Field.default):
+            default = field.__dict__.get('default', _NotGiven)
+        field.__dict__['_v_static_default'] = default
+        return default
+
+
 class Container(Field):
 
     def _validate(self, value):
@@ -492,6 +644,36 @@ class Orderable:
         if self.max is not None and value > self.max:
             raise TooBig(value, self.max).with_field_and_value(self, value)
 
+    def validate_many(self, values, max_errors=None):
+        """
+        Validate each of *values* like `validate` would, returning the
+        list of validation errors (empty if all of them are valid).
+
+        If *max_errors* is given, validation stops once that many
+        errors have been collected.
+
+        When this field has no custom validation, collections of values
+        are first checked all at once: the type of each distinct value
+        class is checked once, and ``array.array`` and NumPy arrays of
+        numbers are compared against ``min`` and ``max`` as a whole
+        (using NumPy when it is installed). Only if that finds a problem
+        are the values validated one by one to report the errors.
+
+        .. versionadded:: 7.2
+        """
+        if _all_valid_in_bulk(self, values):
+            return []
+        errors = []
+        validate = self.validate
+        for value in values:
+            try:
+                validate(value)
+            except ValidationError as error:
+                errors.append(error)
+                if max_errors is not None and len(errors) >= max_errors:
+                    break
+        return errors
+
 
 class MinMaxLen:
     """Expresses constraints on the length of a field.
@@ -518,6 +700,229 @@ class MinMaxLen:
                 self, value)
 
 
+def _check_constraint(field, value):
+    try:
+        constraint = field.constraint(value)
+    except ValidationError as e:
+        if e.field is None:
+            e.field = field
+        if e.value is None:
+            e.value = value
+        raise
+    if not constraint:
+        raise ConstraintNotSatisfied(
+            value, field.__name__
+        ).with_field_and_value(field, value)
+
+
+def _validate_through_chain(field, value):
+    # The validation plan for fields we cannot flatten: the
+    # cooperative ``_validate`` chain.
+    if value == field.missing_value:
+        if field.required:
+            raise RequiredMissing(
+                field.__name__
+            ).with_field_and_value(field, value)
+    else:
+        field._validate(value)
+
+
+def _compile_validation_plan(field):
+    """
+    Return a callable ``plan(field, value)`` that validates exactly like
+    ``field.validate`` would, given the current state of *field*.
+
+    When the ``_validate`` methods in the class hierarchy of *field* are
+    only those of `Field` and one of the `MinMaxLen` or `Orderable`
+    mixins, the checks are flattened into a single function: the
+    attribute values are read once, the type and bounds checks are
+    inlined, and checks that cannot fail (an empty constraint, a zero
+    minimum length) are skipped. Anything else is validated through the
+    ``_validate`` chain.
+
+    The plan can be shared by clones created with ``bind``; values that
+    may depend on the context (the constraint, the field name used in
+    errors) are looked up on the *field* argument at validation time.
+    Fields whose other attributes are computed, for example by a
+    property using the context, are validated through the chain too.
+    """
+    cls = type(field)
+    if not _has_flat_validation(cls) or not _has_stored_attributes(cls):
+        return _validate_through_chain
+
+    missing_value = field.missing_value
+    required = field.required
+    type_ = field._type
+    check_constraint = (
+        'constraint' in field.__dict__
+        or cls.constraint is not Field.constraint
+    )
+    min_length = max_length = min_ = max_ = None
+    if issubclass(cls, MinMaxLen):
+        min_length = field.min_length
+        max_length = field.max_length
+        if min_length == 0 and type_ is not None:
+            # Only sized values pass the type check; no need to
+            # call ``len`` for a bound that cannot be violated.
+            min_length = None
+    elif issubclass(cls, Orderable):
+        min_ = field.min
+        max_ = field.max
+    check_length = min_length is not None or max_length is not None
+
+    def plan(field, value):
+        if value == missing_value:
+            if required:
+                raise RequiredMissing(
+                    field.__name__
+                ).with_field_and_value(field, value)
+            return
+        if type_ is not None and not isinstance(value, type_):
+            raise WrongType(
+                value, type_, field.__name__
+            ).with_field_and_value(field, value)
+        if check_constraint:
+            _check_constraint(field, value)
+        if check_length:
+            length = len(value)
+            if min_length is not None and length < min_length:
+                raise TooShort(value, min_length).with_field_and_value(
+                    field, value)
+            if max_length is not None and length > max_length:
+                raise TooLong(value, max_length).with_field_and_value(
+                    field, value)
+        if min_ is not None and value < min_:
+            raise TooSmall(value, min_).with_field_and_value(field, value)
+        if max_ is not None and value > max_:
+            raise TooBig(value, max_).with_field_and_value(field, value)
+
+    return plan
+
+
+def _has_flat_validation(cls):
+    # Are the ``_validate`` methods of *cls* only those of `Field`
+    # and one of the `MinMaxLen` or `Orderable` mixins?
+    implementations = {
+        klass.__dict__['_validate']
+        for klass in cls.__mro__
+        if '_validate' in klass.__dict__
+    }
+    return (implementations <= _FLATTENABLE_VALIDATORS
+            and not (issubclass(cls, MinMaxLen)
+                     and issubclass(cls, Orderable)))
+
+
+# The attributes read once by flattened validation plans.
+_PLAN_ATTRIBUTES = (
+    'missing_value',
+    'required',
+    '_type',
+    'min_length',
+    'max_length',
+    'min',
+    'max',
+)
+
+
+def _has_stored_attributes(cls):
+    # Are the attributes read by flattened validation plans stored
+    # values, rather than computed by a descriptor of a subclass (for
+    # example from the context of a bound field)? The descriptors of
+    # `Field` and the mixins, and `ValidatedProperty`, store values.
+    for name in _PLAN_ATTRIBUTES:
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                value = klass.__dict__[name]
+                if (hasattr(type(value), '__get__')
+                        and not isinstance(value, ValidatedProperty)
+                        and klass not in (Field, MinMaxLen, Orderable)):
+                    return False
+                break
+    return True
+
+
+_FLATTENABLE_VALIDATORS = frozenset((
+    Field.__dict__['_validate'],
+    MinMaxLen.__dict__['_validate'],
+    Orderable.__dict__['_validate'],
+))
+
+# Integer item formats of ``array.array`` and the buffer protocol:
+# their items can be compared with the builtin ``min`` and ``max``
+# (no NaN).
+_INTEGER_TYPECODES = frozenset('bBhHiIlLqQnN')
+
+
+def _all_valid_in_bulk(field, values):
+    # Return True if all *values* are known to pass ``field.validate``
+    # (an `Orderable` field) without validating them one by one, False
+    # if they have to be.
+    cls = type(field)
+    if (cls.validate is not Field.validate
+            or not _has_flat_validation(cls)
+            or field.missing_value is not None
+            or field._type is None
+            or 'constraint' in field.__dict__
+            or cls.constraint is not Field.constraint):
+        return False
+    type_ = field._type
+    min_ = field.min
+    max_ = field.max
+
+    try:
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.ndim != 1 or values.dtype.kind not in 'iuf':
+                return False
+            return (not len(values)
+                    or (isinstance(values[0], type_)
+                        and _array_in_bounds(values, min_, max_)))
+
+        if isinstance(values, array.array):
+            if not len(values):
+                return True
+            if (values.typecode in 'uw'
+                    or not isinstance(values[0], type_)):
+                return False
+            return _buffer_in_bounds(memoryview(values), min_, max_)
+
+        if isinstance(values, abc.Collection):
+            classes = set(map(type, values))
+            if not all(issubclass(klass, type_) for klass in classes):
+                return False
+            if classes and classes <= {int}:
+                return ((min_ is None or min(values) >= min_)
+                        and (max_ is None or max(values) <= max_))
+            return _items_in_bounds(values, min_, max_)
+    except (TypeError, OverflowError):
+        # Bounds that cannot be compared in bulk.
+        pass
+    return False
+
+
+def _array_in_bounds(values, min_, max_):
+    # NaN compares false, like in ``Orderable._validate``.
+    return ((min_ is None or not (values < min_).any())
+            and (max_ is None or not (values > max_).any()))
+
+
+def _buffer_in_bounds(view, min_, max_):
+    # *view* is a one-dimensional memoryview of numbers.
+    if not len(view):
+        return True
+    if numpy is not None:
+        return _array_in_bounds(numpy.asarray(view), min_, max_)
+    if view.format.lstrip('@') in _INTEGER_TYPECODES:
+        return ((min_ is None or min(view) >= min_)
+                and (max_ is None or max(view) <= max_))
+    return _items_in_bounds(view, min_, max_)
+
+
+def _items_in_bounds(values, min_, max_):
+    if min_ is not None and any(value < min_ for value in values):
+        return False
+    return max_ is None or not any(value > max_ for value in values)
+
+
 @implementer(IFromUnicode)
 class Text(MinMaxLen, Field):
     """A field containing text used for human discourse."""
@@ -569,6 +974,9 @@ class Password(TextLine):
 
     UNCHANGED_PASSWORD = object()
 
+    # validate() looks at the existing value on the context
+    context_sensitive = True
+
     def set(self, context, value):
         """Update the password.
 
@@ -998,14 +1406,93 @@ class _ObjectsBeingValidated(threading.local):
         self.ids_being_validated = set()
 
 
+class SchemaValidationPlan:
+    """
+    The fields of a schema that take part in validation.
+
+    Instances are created and cached by `compileSchema`; they should not
+    be created directly. All the attributes are immutable, they must not
+    be changed.
+
+    .. versionadded:: 7.2
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        fields = []
+        for name in schema.names(all=True):
+            attribute = schema[name]
+            if IMethod.providedBy(attribute):
+                continue
+            if IValidatable.providedBy(attribute):
+                fields.append((name, attribute))
+        #: A tuple of ``(name, field)`` pairs, in the order of
+        #: ``schema.names(all=True)``.
+        self.fields = tuple(fields)
+
+    @cached_property
+    def fields_in_order(self):
+        """
+        A tuple of ``(name, field)`` pairs, in native schema order
+        (the ``order`` of the fields).
+        """
+        return tuple(sorted(self.fields, key=_field_order))
+
+    @cached_property
+    def field_names_in_order(self):
+        """A tuple of the names in `fields_in_order`."""
+        return tuple(name for name, field in self.fields_in_order)
+
+    def changed(self, originally_changed):
+        # The schema, or one of its bases, changed (we are subscribed
+        # as a dependent); the next call to compileSchema starts over.
+        schema = self.schema
+        if schema.__dict__.get('_v_schema_validation_plan') is self:
+            del schema._v_schema_validation_plan
+        schema.unsubscribe(self)
+
+    def __repr__(self):
+        return '<{} for {} ({} fields)>'.format(
+            type(self).__name__, self.schema.__identifier__,
+            len(self.fields))
+
+
+def _field_order(item):
+    return item[1].order
+
+
+def compileSchema(schema):
+    """
+    Return the `SchemaValidationPlan` for the interface *schema*.
+
+    The plan is computed on first use and cached on *schema* until the
+    interface changes (for example, because its ``__bases__`` are
+    replaced).
+
+    .. versionadded:: 7.2
+    """
+    try:
+        return schema.__dict__['_v_schema_validation_plan']
+    except KeyError:
+        pass
+    plan = SchemaValidationPlan(schema)
+    schema.subscribe(plan)
+    schema._v_schema_validation_plan = plan
+    return plan
+
+
 def get_schema_validation_errors(schema, value,
                                  _validating_objects=_ObjectsBeingValidated()):
     """
     Validate that *value* conforms to the schema interface *schema*.
 
     All :class:`zope.schema.interfaces.IField` members of the *schema*
-    are validated after being bound to *value*. (Note that we do not check for
-    arbitrary :class:`zope.interface.Attribute` members being present.)
+    are validated after being bound to *value*, if they are context
+    sensitive. (Note that we do not check for arbitrary
+    :class:`zope.interface.Attribute` members being present.)
+
+    The fields to validate are taken from the cached plan returned by
+    `compileSchema`.
 
     :return: A `dict` mapping field names to `ValidationError` subclasses.
        A non-empty return value means that validation failed.
@@ -1032,18 +1519,16 @@ def get_schema_validation_errors(schema, value,
     # that supports attribute assignment.)
 
     try:
-        for name in schema.names(all=True):
-            attribute = schema[name]
-            if IMethod.providedBy(attribute):
-                continue  # pragma: no cover
-
+        for name, attribute in compileSchema(schema).fields:
             try:
-                if IValidatable.providedBy(attribute):
-                    # validate attributes that are fields
-                    field_value = getattr(value, name)
-                    attribute = attribute.bind(value)
-                    attribute.validate(field_value)
+                field_value = getattr(value, name)
+                attribute = _bind_if_needed(attribute, value)
+                attribute.validate(field_value)
             except ValidationError as error:
+                if error.field is attribute and attribute.context is None:
+                    # Report the error with a field bound to the value,
+                    # as if it had been bound to validate.
+                    error.field = attribute.bind(value)
                 errors[name] = error
             except AttributeError as error:
                 # property for the given name is not implemented
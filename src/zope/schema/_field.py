@@ -15,6 +15,7 @@
 __docformat__ = 'restructuredtext'
 
 import re
+import struct
 from collections import abc
 from datetime import date
 from datetime import datetime
@@ -46,6 +47,9 @@ from zope.schema._bootstrapfields import Rational
 from zope.schema._bootstrapfields import Real
 from zope.schema._bootstrapfields import Text
 from zope.schema._bootstrapfields import TextLine
+from zope.schema._bootstrapfields import _bind_if_needed
+from zope.schema._bootstrapfields import _buffer_in_bounds
+from zope.schema._bootstrapfields import _is_context_sensitive
 from zope.schema._bootstrapfields import _NotGiven
 from zope.schema.fieldproperty import FieldProperty
 from zope.schema.interfaces import IASCII
@@ -84,6 +88,7 @@ from zope.schema.interfaces import IMutableSequence
 from zope.schema.interfaces import INativeString
 from zope.schema.interfaces import INativeStringLine
 from zope.schema.interfaces import INumber
+from zope.schema.interfaces import INumericArray
 from zope.schema.interfaces import InvalidDottedName
 from zope.schema.interfaces import InvalidId
 from zope.schema.interfaces import InvalidURI
@@ -104,7 +109,12 @@ from zope.schema.interfaces import ITimedelta
 from zope.schema.interfaces import ITuple
 from zope.schema.interfaces import NotAnInterface
 from zope.schema.interfaces import NotUnique
+from zope.schema.interfaces import RequiredMissing
+from zope.schema.interfaces import StopValidation
+from zope.schema.interfaces import TooBig
+from zope.schema.interfaces import TooSmall
 from zope.schema.interfaces import ValidationError
+from zope.schema.interfaces import WrongArrayFormat
 from zope.schema.interfaces import WrongContainedType
 from zope.schema.interfaces import WrongType
 from zope.schema.vocabulary import SimpleVocabulary
@@ -448,6 +458,13 @@ class Choice(Field):
         clone._resolve_vocabulary = lambda value: vocabulary
         return clone
 
+    def _isContextSensitive(self):
+        # Named vocabularies and source binders are resolved using
+        # the context.
+        return (self.vocabularyName is not None
+                or IContextSourceBinder.providedBy(self.vocabulary)
+                or super()._isContextSensitive())
+
     def fromUnicode(self, value):
         """ See IFromUnicode.
         """
@@ -656,7 +673,18 @@ class InterfaceField(Field):
                 self, value)
 
 
-def _validate_sequence(value_type, value, errors=None):
+def _check_max_errors(max_errors):
+    # ``max_errors`` must be None or a positive integer; zero or less
+    # would stop validation before the first member.
+    if max_errors is not None and (
+            not isinstance(max_errors, int)
+            or isinstance(max_errors, bool)
+            or max_errors < 1):
+        raise ValueError("'max_errors' must be None or an integer >= 1.")
+    return max_errors
+
+
+def _validate_sequence(value_type, value, errors=None, max_errors=None):
     """Validates a sequence value.
 
     Returns a list of validation errors generated during the validation. If
@@ -664,6 +692,8 @@ def _validate_sequence(value_type, value, errors=None):
 
     value_type is a field. value is the sequence being validated. errors is
     an optional list of errors that will be prepended to the return value.
+    max_errors is an optional number of errors (including those passed in)
+    after which validation stops.
 
     To illustrate, we'll use a text value type. All values must be unicode.
 
@@ -687,27 +717,60 @@ def _validate_sequence(value_type, value, errors=None):
         WrongType(1, <...>, ''),
         WrongType(2, <...>, '')]
 
+    With max_errors, the remaining items are not validated once that many
+    errors have been collected:
+
+       >>> _validate_sequence(field, (1, 2, u'baz', 3), max_errors=1)
+       [WrongType(1, <...>, '')]
+       >>> _validate_sequence(field, (3,), errors, max_errors=3)
+       ... # doctest: +NORMALIZE_WHITESPACE
+       [WrongType(bytearray(b'foo'), <...>, ''),
+        WrongType(1, <...>, ''),
+        WrongType(2, <...>, '')]
+
     """
     if errors is None:
         errors = []
     if value_type is None:
         return errors
+    if max_errors is not None and len(errors) >= max_errors:
+        return errors
+    validate_many = getattr(value_type, 'validate_many', None)
+    if validate_many is not None:
+        if max_errors is not None:
+            max_errors -= len(errors)
+        errors.extend(validate_many(value, max_errors))
+        return errors
     for item in value:
         try:
             value_type.validate(item)
         except ValidationError as error:
             errors.append(error)
+            if max_errors is not None and len(errors) >= max_errors:
+                break
     return errors
 
 
 def _validate_uniqueness(self, value):
-    temp_values = []
+    if isinstance(value, (set, frozenset)):
+        # Unique by construction
+        return
+    hashable = set()
+    # Items that cannot be hashed are compared by equality, and only
+    # against each other.
+    unhashable = []
     for item in value:
-        if item in temp_values:
+        try:
+            duplicate = item in hashable
+            if not duplicate:
+                hashable.add(item)
+        except TypeError:
+            duplicate = item in unhashable
+            if not duplicate:
+                unhashable.append(item)
+        if duplicate:
             raise NotUnique(item).with_field_and_value(self, value)
 
-        temp_values.append(item)
-
 
 @implementer(ICollection)
 class Collection(MinMaxLen, Iterable):
@@ -726,12 +789,23 @@ class Collection(MinMaxLen, Iterable):
     .. versionchanged:: 4.6.0
        Add the ability for subclasses to specify ``value_type``
        and ``unique``, and allow eliding them from the constructor.
+    .. versionchanged:: 7.2
+       Add ``max_errors``, the number of invalid members after which
+       validation stops (by default, all of them are reported), and the
+       ``fail_fast`` constructor argument, a shortcut for
+       ``max_errors=1``.
     """
     value_type = None
     unique = False
+    max_errors = None
 
-    def __init__(self, value_type=_NotGiven, unique=_NotGiven, **kw):
+    def __init__(self, value_type=_NotGiven, unique=_NotGiven,
+                 max_errors=_NotGiven, fail_fast=False, **kw):
         super().__init__(**kw)
+        if fail_fast:
+            max_errors = 1
+        if max_errors is not _NotGiven:
+            self.max_errors = _check_max_errors(max_errors)
         # whine if value_type is not a field
         if value_type is not _NotGiven:
             self.value_type = value_type
@@ -748,12 +822,18 @@ class Collection(MinMaxLen, Iterable):
         # binding value_type is necessary for choices with named vocabularies,
         # and possibly also for other fields.
         if clone.value_type is not None:
-            clone.value_type = clone.value_type.bind(context)
+            clone.value_type = _bind_if_needed(clone.value_type, context)
         return clone
 
+    def _isContextSensitive(self):
+        return (super()._isContextSensitive()
+                or (self.value_type is not None
+                    and _is_context_sensitive(self.value_type)))
+
     def _validate(self, value):
         super()._validate(value)
-        errors = _validate_sequence(self.value_type, value)
+        errors = _validate_sequence(self.value_type, value,
+                                    max_errors=self.max_errors)
         if errors:
             try:
                 raise WrongContainedType(errors,
@@ -805,6 +885,107 @@ class List(MutableSequence):
     _type = list
 
 
+# The kind and size of the numeric item formats of the buffer protocol.
+_NUMERIC_FORMATS = {
+    code: (kind, struct.calcsize(code))
+    for kind, codes in (('i', 'bhilqn'), ('u', 'BHILQN'), ('f', 'fd'))
+    for code in codes
+}
+
+
+def _numeric_format(format):
+    # Native formats may be prefixed with '@'; others are not numbers
+    # we can compare.
+    if format.startswith('@'):
+        format = format[1:]
+    return _NUMERIC_FORMATS.get(format)
+
+
+@implementer(INumericArray)
+class NumericArray(MinMaxLen, Field):
+    """
+    A field representing a one-dimensional array of numbers: any object
+    supporting the buffer protocol with a numeric item format, such as
+    an `array.array`, a `memoryview` or a NumPy array.
+
+    The array is validated through a `memoryview`, without copying it
+    or converting its items: its item format must match *dtype* (a
+    `struct` format character such as ``'d'``, or ``None`` for any
+    numeric format), and its items must lie between *min* and *max*.
+    The bounds are checked for all the items at once, using NumPy if
+    it is installed. Out of bounds items are reported as the `TooSmall`
+    or `TooBig` errors of a `WrongContainedType`.
+
+    Because arrays may compare element-wise, the value is compared to
+    the ``missing_value`` by identity.
+
+    .. versionadded:: 7.2
+    """
+    dtype = None
+    min = None
+    max = None
+
+    def __init__(self, dtype=None, min=None, max=None, **kw):
+        if dtype is not None and (not isinstance(dtype, str)
+                                  or _numeric_format(dtype) is None):
+            raise ValueError("'dtype' must be a numeric struct format.")
+        self.dtype = dtype
+        self.min = min
+        self.max = max
+        super().__init__(**kw)
+
+    def validate(self, value):
+        if value is self.missing_value:
+            if self.required:
+                raise RequiredMissing(
+                    self.__name__
+                ).with_field_and_value(self, value)
+            return
+        try:
+            self._validate(value)
+        except StopValidation:
+            pass
+
+    def _validate(self, value):
+        try:
+            view = memoryview(value)
+        except TypeError:
+            raise WrongType(
+                value, memoryview, self.__name__
+            ).with_field_and_value(self, value)
+        with view:
+            format = _numeric_format(view.format)
+            if (format is None
+                    or view.ndim != 1
+                    or (self.dtype is not None
+                        and format != _numeric_format(self.dtype))):
+                raise WrongArrayFormat(
+                    value, self.dtype, self.__name__
+                ).with_field_and_value(self, value)
+            super()._validate(value)
+            errors = self._bound_errors(view)
+        if errors:
+            raise WrongContainedType(
+                errors, self.__name__
+            ).with_field_and_value(self, value)
+
+    def _bound_errors(self, view):
+        min_ = self.min
+        max_ = self.max
+        if ((min_ is None and max_ is None)
+                or _buffer_in_bounds(view, min_, max_)):
+            return []
+        errors = []
+        for item in view:
+            if min_ is not None and item < min_:
+                errors.append(
+                    TooSmall(item, min_).with_field_and_value(self, item))
+            elif max_ is not None and item > max_:
+                errors.append(
+                    TooBig(item, max_).with_field_and_value(self, item))
+        return errors
+
+
 class _AbstractSet(Collection):
     unique = True
 
@@ -832,13 +1013,21 @@ class Mapping(MinMaxLen, Iterable):
     A field representing a mapping.
 
     .. versionadded:: 4.6.0
+    .. versionchanged:: 7.2
+       Add ``max_errors`` and ``fail_fast``, as for `Collection`.
     """
     _type = abc.Mapping
     key_type = None
     value_type = None
+    max_errors = None
 
-    def __init__(self, key_type=None, value_type=None, **kw):
+    def __init__(self, key_type=None, value_type=None,
+                 max_errors=_NotGiven, fail_fast=False, **kw):
         super().__init__(**kw)
+        if fail_fast:
+            max_errors = 1
+        if max_errors is not _NotGiven:
+            self.max_errors = _check_max_errors(max_errors)
         # whine if key_type or value_type is not a field
         if key_type is not None and not IField.providedBy(key_type):
             raise ValueError("'key_type' must be field instance.")
@@ -850,10 +1039,11 @@ class Mapping(MinMaxLen, Iterable):
     def _validate(self, value):
         super()._validate(value)
         errors = []
+        max_errors = self.max_errors
         if self.value_type:
             errors = _validate_sequence(self.value_type, value.values(),
-                                        errors)
-        errors = _validate_sequence(self.key_type, value, errors)
+                                        errors, max_errors)
+        errors = _validate_sequence(self.key_type, value, errors, max_errors)
 
         if errors:
             try:
@@ -870,11 +1060,16 @@ class Mapping(MinMaxLen, Iterable):
         # binding value_type is necessary for choices with named vocabularies,
         # and possibly also for other fields.
         if clone.key_type is not None:
-            clone.key_type = clone.key_type.bind(object)
+            clone.key_type = _bind_if_needed(clone.key_type, object)
         if clone.value_type is not None:
-            clone.value_type = clone.value_type.bind(object)
+            clone.value_type = _bind_if_needed(clone.value_type, object)
         return clone
 
+    def _isContextSensitive(self):
+        return (super()._isContextSensitive()
+                or any(field is not None and _is_context_sensitive(field)
+                       for field in (self.key_type, self.value_type)))
+
 
 @implementer(IMutableMapping)
 class MutableMapping(Mapping):
@@ -14,37 +14,51 @@
 """Schema convenience functions
 """
 
+from zope.schema._bootstrapfields import compileSchema
 from zope.schema._bootstrapfields import get_schema_validation_errors
 from zope.schema._bootstrapfields import get_validation_errors
 from zope.schema._bootstrapfields import getFields
+from zope.schema._bootstrapfields import setStrictBinding
 
 
 __all__ = [
+    'compileSchema',
     'getFieldNames',
     'getFields',
     'getFieldsInOrder',
     'getFieldNamesInOrder',
     'getValidationErrors',
     'getSchemaValidationErrors',
+    'setStrictBinding',
 ]
 
 
 def getFieldNames(schema):
     """Return a list of all the Field names in a schema.
     """
-    return list(getFields(schema).keys())
+    return [name for name, field in compileSchema(schema).fields]
 
 
-def getFieldsInOrder(schema, _field_key=lambda x: x[1].order):
+def getFieldsInOrder(schema, _field_key=None):
     """Return a list of (name, value) tuples in native schema order.
+
+    .. versionchanged:: 7.2
+       The order is cached by `compileSchema`; a new list is returned
+       each time.
     """
-    return sorted(getFields(schema).items(), key=_field_key)
+    if _field_key is not None:
+        return sorted(compileSchema(schema).fields, key=_field_key)
+    return list(compileSchema(schema).fields_in_order)
 
 
 def getFieldNamesInOrder(schema):
     """Return a list of all the Field names in a schema in schema order.
+
+    .. versionchanged:: 7.2
+       The order is cached by `compileSchema`; a new list is returned
+       each time.
     """
-    return [name for name, field in getFieldsInOrder(schema)]
+    return list(compileSchema(schema).field_names_in_order)
 
 
 def getValidationErrors(schema, value):
@@ -21,12 +21,28 @@ import zope.schema
 from zope import event
 from zope import interface
 from zope.schema import interfaces
+from zope.schema._bootstrapfields import _bind_if_needed
+from zope.schema._bootstrapfields import _is_context_sensitive
+from zope.schema._bootstrapfields import _NotGiven
+from zope.schema._bootstrapfields import _static_default
 from zope.schema._bootstrapinterfaces import NO_VALUE
 
 
 _marker = object()
 
 
+def _validate(field, inst, value):
+    # Validate *value* with *field*, which is not bound to *inst* if it
+    # isn't context sensitive. Report errors with a field bound to
+    # *inst*, as if it had been bound to validate.
+    try:
+        field.validate(value)
+    except interfaces.ValidationError as error:
+        if error.field is field and field.context is None:
+            error.field = field.bind(inst)
+        raise
+
+
 @interface.implementer(interfaces.IFieldUpdatedEvent)
 class FieldUpdatedEvent:
 
@@ -50,66 +66,272 @@ class FieldProperty:
     Field properties provide default values, data validation and error messages
     based on data found in field meta-data.
 
-    Note that FieldProperties cannot be used with slots. They can only
-    be used for attributes stored in instance dictionaries.
+    By default, values are stored in the instance dictionary, under
+    *name*. To store them elsewhere, for example in a slot, pass as
+    *storage* the name of the attribute to store them in (which must
+    differ from the name of the field property), or a descriptor whose
+    ``__get__`` raises `AttributeError` while no value is stored.
+
+    A `FieldUpdatedEvent` is notified when a value is set, unless
+    *notify* is false. When there are no `zope.event` subscribers, the
+    event, and the previous value it carries, are not computed.
+
+    .. versionchanged:: 7.2
+       Add *storage* and *notify*.
     """
 
-    def __init__(self, field, name=None):
+    def __init__(self, field, name=None, storage=None, notify=True):
         if name is None:
             name = field.__name__
+        if storage == name:
+            raise ValueError(
+                "'storage' must differ from the name of the field property.")
 
         self.__field = field
         self.__name = name
+        self.__storage = storage
+        self.__notify = notify
+
+    def _notifies(self):
+        # Whether setting a value should notify an event.
+        return self.__notify and bool(event.subscribers)
+
+    def _getStored(self, inst, default):
+        # Return the stored value, or *default* if there is none.
+        storage = self.__storage
+        if storage is None:
+            return inst.__dict__.get(self.__name, default)
+        try:
+            if isinstance(storage, str):
+                return getattr(inst, storage)
+            return storage.__get__(inst, type(inst))
+        except AttributeError:
+            return default
+
+    def _store(self, inst, value):
+        storage = self.__storage
+        if storage is None:
+            inst.__dict__[self.__name] = value
+        elif isinstance(storage, str):
+            setattr(inst, storage, value)
+        else:
+            storage.__set__(inst, value)
+
+    def _unstore(self, inst):
+        storage = self.__storage
+        if storage is None:
+            inst.__dict__.pop(self.__name, None)
+        elif isinstance(storage, str):
+            try:
+                delattr(inst, storage)
+            except AttributeError:  # pragma: no cover
+                pass
+        else:
+            storage.__delete__(inst)
+
+    def _boundField(self, field, inst):
+        # Event subscribers expect the field to be bound to the instance,
+        # even if it wasn't bound to validate the value.
+        if field is self.__field:
+            field = field.bind(inst)
+        return field
+
+    def _check(self, inst, value):
+        # Validate *value* for *inst*, returning the field to use.
+        field = _bind_if_needed(self.__field, inst)
+        _validate(field, inst, value)
+        if field.readonly and self._getStored(inst, _marker) is not _marker:
+            raise ValueError(self.__name, 'field is readonly')
+        return field
 
     def __get__(self, inst, klass):
         if inst is None:
             return self
 
-        value = inst.__dict__.get(self.__name, _marker)
+        value = self._getStored(inst, _marker)
         if value is _marker:
-            field = self.__field.bind(inst)
-            value = getattr(field, 'default', _marker)
+            value = self._getDefault(inst, _marker)
             if value is _marker:
                 raise AttributeError(self.__name)
 
         return value
 
     def queryValue(self, inst, default):
-        value = inst.__dict__.get(self.__name, default)
+        value = self._getStored(inst, default)
         if value is default:
-            field = self.__field.bind(inst)
+            value = self._getDefault(inst, default)
+        return value
+
+    def _getDefault(self, inst, default):
+        # Fields whose default is a plain value don't need to be bound
+        # to the instance to read it, even if they are context sensitive.
+        value = _static_default(self.__field)
+        if value is _NotGiven:
+            field = _bind_if_needed(self.__field, inst)
             value = getattr(field, 'default', default)
         return value
 
     def __set__(self, inst, value):
-        field = self.__field.bind(inst)
-        field.validate(value)
-        if field.readonly and self.__name in inst.__dict__:
-            raise ValueError(self.__name, 'field is readonly')
+        field = self._check(inst, value)
+        if not self._notifies():
+            self._store(inst, value)
+            return
         oldvalue = self.queryValue(inst, NO_VALUE)
-        inst.__dict__[self.__name] = value
-        event.notify(FieldUpdatedEvent(inst, field, oldvalue, value))
+        self._store(inst, value)
+        event.notify(FieldUpdatedEvent(
+            inst, self._boundField(field, inst), oldvalue, value))
 
     def __getattr__(self, name):
         return getattr(self.__field, name)
 
 
-def createFieldProperties(schema, omit=[]):
+def _specializedFieldProperty(field, notify):
+    """
+    Return a `FieldProperty` for *field*, whose class is created for it.
+
+    Its ``__get__`` and ``__set__`` methods access the instance
+    dictionary and the field directly, without the lookups and checks
+    that a generic `FieldProperty` makes on each access. The field must
+    not be context sensitive, since it is never bound.
+    """
+    name = field.__name__
+
+    def __get__(self, inst, klass):
+        if inst is None:
+            return self
+        try:
+            return inst.__dict__[name]
+        except KeyError:
+            pass
+        value = _static_default(field)
+        if value is _NotGiven:
+            value = getattr(field, 'default', _marker)
+            if value is _marker:
+                raise AttributeError(name)
+        return value
+
+    def __set__(self, inst, value):
+        _validate(field, inst, value)
+        d = inst.__dict__
+        if field.readonly and name in d:
+            raise ValueError(name, 'field is readonly')
+        if notify and event.subscribers:
+            oldvalue = d.get(name, _marker)
+            if oldvalue is _marker:
+                oldvalue = self._getDefault(inst, NO_VALUE)
+            d[name] = value
+            event.notify(FieldUpdatedEvent(
+                inst, field.bind(inst), oldvalue, value))
+        else:
+            d[name] = value
+
+    cls = type(FieldProperty.__name__, (FieldProperty,), {
+        '__module__': __name__,
+        '__qualname__': '{}[{!r}]'.format(FieldProperty.__qualname__, name),
+        '__get__': __get__,
+        '__set__': __set__,
+    })
+    return cls(field, notify=notify)
+
+
+def createFieldProperties(schema, omit=[], notify=True, specialize=False):
     """For each fields in `schema` create a FieldProperty on the class.
 
     schema ... interface those fields should be added to class
     omit ... list of field names to be omitted in creation
+    notify ... whether the properties notify a FieldUpdatedEvent
+    specialize ... whether to create a FieldProperty subclass for each
+        field that is not context sensitive (when the class is created),
+        with faster attribute access
 
     Usage::
 
         class A(object):
             zope.schema.fieldproperty.createFieldProperties(IMySchema)
+
+    .. versionchanged:: 7.2
+       Add *notify* and *specialize*.
     """
     frame = sys._getframe(1)
-    for name in zope.schema.getFieldNamesInOrder(schema):
+    for name in zope.schema.compileSchema(schema).field_names_in_order:
         if name in omit:
             continue
-        frame.f_locals[name] = FieldProperty(schema[name])
+        field = schema[name]
+        if specialize and not _is_context_sensitive(field):
+            prop = _specializedFieldProperty(field, notify)
+        else:
+            prop = FieldProperty(field, notify=notify)
+        frame.f_locals[name] = prop
+
+
+def update(obj, values, schema=None, invariants=False):
+    """Set several attributes of *obj* at once.
+
+    *values* maps attribute names to their new values. All the values
+    are validated before any is set, so that *obj* is left unchanged if
+    one of them is invalid; the first error is raised.
+
+    Attributes that are `FieldProperty` objects are validated and set
+    as they would be one at a time, and a `FieldUpdatedEvent` is
+    notified for each of them once all the values are set. Other
+    attributes must be fields of *schema*; they are validated by those
+    fields and then set with `setattr`. A `KeyError` is raised for
+    other names.
+
+    If *invariants* is true, the invariants of *schema* are checked
+    once the values are set; if they fail, the previous values are
+    restored and the `~zope.interface.Invalid` error is raised. A
+    `ValueError` is raised if *invariants* is true but no *schema* is
+    given.
+
+    .. versionadded:: 7.2
+    """
+    if invariants and schema is None:
+        raise ValueError("'invariants' requires a 'schema'.")
+    klass = type(obj)
+    changes = []
+    for name, value in values.items():
+        prop = getattr(klass, name, None)
+        if isinstance(prop, FieldProperty):
+            field = prop._check(obj, value)
+            stored = old = prop._getStored(obj, _marker)
+            if old is _marker and prop._notifies():
+                old = prop._getDefault(obj, NO_VALUE)
+        elif schema is not None and name in schema:
+            field = _bind_if_needed(schema[name], obj)
+            _validate(field, obj, value)
+            prop = None
+            stored = old = getattr(obj, name, _marker)
+        else:
+            raise KeyError(name)
+        changes.append((name, prop, field, stored, old, value))
+
+    for name, prop, field, stored, old, value in changes:
+        if prop is None:
+            setattr(obj, name, value)
+        else:
+            prop._store(obj, value)
+
+    if invariants:
+        try:
+            schema.validateInvariants(obj)
+        except interface.Invalid:
+            for name, prop, field, stored, old, value in reversed(changes):
+                if prop is None:
+                    if stored is _marker:
+                        delattr(obj, name)
+                    else:
+                        setattr(obj, name, stored)
+                elif stored is _marker:
+                    prop._unstore(obj)
+                else:
+                    prop._store(obj, stored)
+            raise
+
+    for name, prop, field, stored, old, value in changes:
+        if prop is not None and prop._notifies():
+            event.notify(FieldUpdatedEvent(
+                obj, prop._boundField(field, obj), old, value))
 
 
 class FieldPropertyStoredThroughField:
@@ -158,6 +380,9 @@ class FieldPropertyStoredThroughField:
                 return
             else:
                 raise ValueError(self.__name, 'field is readonly')
+        if not event.subscribers:
+            self.setValue(inst, field, value)
+            return
         oldvalue = self.queryValue(inst, field, NO_VALUE)
         self.setValue(inst, field, value)
         event.notify(FieldUpdatedEvent(inst, self.field, oldvalue, value))
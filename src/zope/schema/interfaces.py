@@ -87,6 +87,7 @@ __all__ = [
     'TooSmall',
     'Unbound',
     'ValidationError',
+    'WrongArrayFormat',
     'WrongContainedType',
     'WrongType',
 
@@ -136,12 +137,14 @@ __all__ = [
     'INativeString',
     'INativeStringLine',
     'INumber',
+    'INumericArray',
     'IObject',
     'IOrderable',
     'IPassword',
     'IPythonIdentifier',
     'IRational',
     'IReal',
+    'ISearchableVocabulary',
     'ISequence',
     'ISet',
     'ISource',
@@ -169,6 +172,10 @@ class NotUnique(ValidationError):
     __doc__ = _("""One or more entries of sequence are not unique.""")
 
 
+class WrongArrayFormat(WrongType):
+    __doc__ = _("""The items of the array are not of the expected format.""")
+
+
 class InvalidURI(ValidationError):
     __doc__ = _("""The specified URI is not valid.""")
 
@@ -387,6 +394,37 @@ class IMinMaxLen(ILen):
         default=None)
 
 
+class INumericArray(IMinMaxLen):
+    """Field containing a one-dimensional array of numbers.
+
+    The value is any object supporting the buffer protocol with a
+    numeric item format, such as an `array.array`, a `memoryview` or a
+    NumPy array.
+
+    .. versionadded:: 7.2
+    """
+
+    dtype = TextLine(
+        title=_("Item format"),
+        description=_("""
+        The `struct` format character of the items, such as ``d`` for
+        double precision floats. Formats of the same kind and size are
+        equivalent. If `dtype` is ``None``, any numeric format is
+        allowed."""),
+        required=False,
+        default=None)
+
+    min = Real(
+        title=_("Minimum item"),
+        required=False,
+        default=None)
+
+    max = Real(
+        title=_("Maximum item"),
+        required=False,
+        default=None)
+
+
 class IInterfaceField(IField):
     """Fields with a value that is an interface (implementing
     zope.interface.Interface)."""
@@ -772,6 +810,9 @@ class ICollection(IMinMaxLen, IIterable, IContainer):
     """Abstract interface containing a collection value.
 
     The Value must be iterable and may have a min_length/max_length.
+
+    .. versionchanged:: 7.2
+       Add *max_errors*.
     """
 
     value_type = Object(
@@ -786,6 +827,15 @@ class ICollection(IMinMaxLen, IIterable, IContainer):
                       'must be unique.'),
         default=False)
 
+    max_errors = Int(
+        title=_('Maximum Errors'),
+        description=_('The number of invalid members after which '
+                      'validation stops. By default, all members are '
+                      'validated and all their errors are reported.'),
+        required=False,
+        min=1,
+        default=None)
+
 
 class ISequence(ICollection):
     """Abstract interface specifying that the value is ordered"""
@@ -874,6 +924,8 @@ class IMapping(IMinMaxLen, IIterable, IContainer):
     The *key_type* and *value_type* fields allow specification
     of restrictions for keys and values contained in the dict.
 
+    .. versionchanged:: 7.2
+       Add *max_errors*.
     """
     key_type = Object(
         IField,
@@ -887,6 +939,15 @@ class IMapping(IMinMaxLen, IIterable, IContainer):
                       "via a Field.")
     )
 
+    max_errors = Int(
+        title=_('Maximum Errors'),
+        description=_('The number of invalid keys and values after which '
+                      'validation stops. By default, all keys and values '
+                      'are validated and all their errors are reported.'),
+        required=False,
+        min=1,
+        default=None)
+
 
 class IMutableMapping(IMapping):
     """
@@ -1044,6 +1105,21 @@ class ITreeVocabulary(IVocabularyTokenized, IEnumerableMapping):
     """
 
 
+class ISearchableVocabulary(IVocabularyTokenized):
+    """A tokenized vocabulary whose terms can be searched by prefix.
+
+    .. versionadded:: 7.2
+    """
+
+    def search(query, limit=None):
+        """Return a list of the terms matching *query*.
+
+        A term matches if its token, its title, or a word of its title
+        starts with *query*, ignoring case. At most *limit* terms are
+        returned, if it is not None.
+        """
+
+
 class IVocabularyRegistry(Interface):
     """
     Registry that provides `IBaseVocabulary` objects for specific
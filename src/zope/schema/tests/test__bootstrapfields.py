@@ -11,12 +11,20 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
+import array
 import decimal
 import doctest
+import fractions
 import unicodedata
 import unittest
 
 
+try:
+    import numpy
+except ModuleNotFoundError:  # pragma: no cover
+    numpy = None
+
+
 # pylint:disable=protected-access,inherit-non-class,blacklisted-name
 # pylint:disable=attribute-defined-outside-init
 
@@ -504,6 +512,60 @@ class FieldTests(EqualityTestsMixin,
             """)
         )
 
+    def test___hash___cached(self):
+        field = self._makeOne()
+        value = hash(field)
+        self.assertEqual(field.__dict__['_v_hash'][1], value)
+        self.assertEqual(hash(field), value)
+        field.interface = self._getTargetInterface()
+        self.assertNotIn('_v_hash', field.__dict__)
+        self.assertNotEqual(hash(field), value)
+
+    def test_compared_names_follow_directly_provided_interfaces(self):
+        from zope.interface import Interface
+        from zope.interface import alsoProvides
+
+        from zope.schema._bootstrapfields import Field
+
+        class IExtra(Interface):
+            extra = Field()
+
+        left = self._makeOne()
+        right = self._makeOne()
+        self.assertEqual(left, right)
+        before = hash(left)
+
+        left.extra = 1
+        right.extra = 2
+        self.assertEqual(left, right)
+        alsoProvides(left, IExtra)
+        self.assertNotEqual(hash(left), before)
+        self.assertNotEqual(left, right)
+        right.extra = 1
+        self.assertEqual(left, right)
+
+    def test_compared_names_follow_class_declarations(self):
+        from zope.interface import Interface
+        from zope.interface import classImplements
+
+        from zope.schema._bootstrapfields import Field
+
+        class IExtra(Interface):
+            extra = Field()
+
+        class Derived(self._getTargetClass()):
+            extra = None
+
+        left = self._makeOneFromClass(Derived)
+        right = self._makeOneFromClass(Derived)
+        right.extra = 1
+        before = hash(left)
+        self.assertEqual(left, right)
+
+        classImplements(Derived, IExtra)
+        self.assertNotEqual(hash(left), before)
+        self.assertNotEqual(left, right)
+
     def test_ctor_description_preserved(self):
         # The exact value of the description is preserved,
         # allowing for MessageID objects.
@@ -900,6 +962,189 @@ class OrderableTests(unittest.TestCase):
         self.assertRaises(TooBig, self._makeOne, max=10, default=11)
 
 
+class ValidateManyTests(unittest.TestCase):
+
+    def _makeOne(self, cls_name='Int', **kw):
+        import zope.schema
+        return getattr(zope.schema, cls_name)(**kw)
+
+    def _inBulk(self, field, values):
+        from zope.schema._bootstrapfields import _all_valid_in_bulk
+        return _all_valid_in_bulk(field, values)
+
+    def test_all_valid(self):
+        field = self._makeOne(min=0, max=10)
+        for values in ([], [0, 5, 10], (1, 2), {3, 4}, range(11)):
+            self.assertEqual(field.validate_many(values), [])
+            self.assertTrue(self._inBulk(field, values))
+
+    def test_reports_errors_in_order(self):
+        from zope.schema._bootstrapinterfaces import TooBig
+        from zope.schema._bootstrapinterfaces import TooSmall
+        from zope.schema._bootstrapinterfaces import WrongType
+        field = self._makeOne(min=0, max=10)
+        errors = field.validate_many([1, -1, 'a', 11, 2])
+        self.assertEqual([type(e) for e in errors],
+                         [TooSmall, WrongType, TooBig])
+        self.assertEqual([e.value for e in errors], [-1, 'a', 11])
+        for error in errors:
+            self.assertIs(error.field, field)
+
+    def test_max_errors(self):
+        field = self._makeOne(min=0)
+        self.assertEqual(len(field.validate_many([-1, -2, -3])), 3)
+        self.assertEqual(len(field.validate_many([-1, -2, -3], 2)), 2)
+
+    def test_missing_value(self):
+        from zope.schema._bootstrapinterfaces import RequiredMissing
+        field = self._makeOne(required=False)
+        self.assertEqual(field.validate_many([None, 1]), [])
+        field = self._makeOne()
+        errors = field.validate_many([None, 1])
+        self.assertEqual([type(e) for e in errors], [RequiredMissing])
+
+    def test_nan_is_not_out_of_bounds(self):
+        # Like ``validate``, which compares values with the bounds.
+        field = self._makeOne('Float', min=0.0, max=1.0)
+        nan = float('nan')
+        for values in ([nan, 0.5], array.array('d', [nan, 0.5])):
+            self.assertEqual(field.validate_many(values), [])
+        errors = field.validate_many(array.array('d', [nan, -1.0]))
+        self.assertEqual([e.value for e in errors], [-1.0])
+
+    def test_subclass_types(self):
+        field = self._makeOne('Integral', max=5)
+        self.assertTrue(self._inBulk(field, [True, 5]))
+        self.assertFalse(self._inBulk(field, [True, 6]))
+        self.assertFalse(self._inBulk(field, [1.0]))
+
+    def test_array(self):
+        from zope.schema._bootstrapinterfaces import TooBig
+        from zope.schema._bootstrapinterfaces import WrongType
+        field = self._makeOne(min=0, max=100)
+        self.assertEqual(field.validate_many(array.array('l')), [])
+        values = array.array('l', range(101))
+        self.assertEqual(field.validate_many(values), [])
+        self.assertTrue(self._inBulk(field, values))
+        values.append(101)
+        errors = field.validate_many(values)
+        self.assertEqual([type(e) for e in errors], [TooBig])
+        errors = field.validate_many(array.array('d', [1.0, 2.0]))
+        self.assertEqual([type(e) for e in errors], [WrongType, WrongType])
+
+    def test_array_without_numpy(self):
+        from zope.schema import _bootstrapfields
+        field = self._makeOne(min=0, max=100)
+        float_field = self._makeOne('Float', min=0.0, max=100.0)
+        numpy = _bootstrapfields.numpy
+        _bootstrapfields.numpy = None
+        try:
+            self.assertTrue(self._inBulk(field, array.array('b', [0, 100])))
+            self.assertFalse(self._inBulk(field, array.array('b', [-1])))
+            self.assertTrue(
+                self._inBulk(float_field, array.array('d', [0.0, 100.0])))
+            self.assertFalse(
+                self._inBulk(float_field, array.array('d', [100.5])))
+        finally:
+            _bootstrapfields.numpy = numpy
+
+    def test_custom_validation_is_not_bypassed(self):
+        from zope.schema._bootstrapinterfaces import ConstraintNotSatisfied
+        field = self._makeOne(constraint=lambda value: value % 2 == 0)
+        self.assertFalse(self._inBulk(field, [2, 4]))
+        errors = field.validate_many([2, 3])
+        self.assertEqual([type(e) for e in errors], [ConstraintNotSatisfied])
+
+        from zope.schema._bootstrapfields import Int
+
+        class Odd(Int):
+            def _validate(self, value):
+                super()._validate(value)
+                if not value % 2:
+                    raise ConstraintNotSatisfied(value)
+        field = Odd()
+        self.assertFalse(self._inBulk(field, [1, 2]))
+        self.assertEqual(len(field.validate_many([1, 2])), 1)
+
+    def test_mixed_types(self):
+        from zope.schema._bootstrapinterfaces import TooSmall
+        field = self._makeOne('Number', min=decimal.Decimal(0))
+        self.assertEqual(field.validate_many([1, 2.5]), [])
+        errors = field.validate_many([1, decimal.Decimal(-1)])
+        self.assertEqual([type(e) for e in errors], [TooSmall])
+
+    def test_bounds_cannot_compare(self):
+        field = self._makeOne('Number', min=0)
+        self.assertFalse(self._inBulk(field, [1j]))
+        self.assertRaises(TypeError, field.validate_many, [1j])
+
+    def test_iterator_is_validated_once(self):
+        field = self._makeOne(min=0)
+        self.assertFalse(self._inBulk(field, iter([1])))
+        self.assertEqual(len(field.validate_many(iter([1, -1, -2]))), 2)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateManyNumPyTests(unittest.TestCase):
+
+    def _makeOne(self, cls_name='Integral', **kw):
+        import zope.schema
+        return getattr(zope.schema, cls_name)(**kw)
+
+    def test_ndarray(self):
+        from zope.schema._bootstrapinterfaces import TooBig
+        from zope.schema._bootstrapinterfaces import TooSmall
+        field = self._makeOne(min=0, max=100)
+        values = numpy.arange(101)
+        self.assertEqual(field.validate_many(values), [])
+        values[3] = -1
+        values[7] = 101
+        errors = field.validate_many(values)
+        self.assertEqual([type(e) for e in errors], [TooSmall, TooBig])
+        self.assertEqual(field.validate_many(values, 1)[0].value, -1)
+
+    def test_ndarray_wrong_type(self):
+        # NumPy integers are not ``int``.
+        from zope.schema._bootstrapinterfaces import WrongType
+        field = self._makeOne('Int')
+        errors = field.validate_many(numpy.arange(2))
+        self.assertEqual([type(e) for e in errors], [WrongType, WrongType])
+        field = self._makeOne('Integral')
+        errors = field.validate_many(numpy.zeros(2))
+        self.assertEqual([type(e) for e in errors], [WrongType, WrongType])
+
+    def test_ndarray_float(self):
+        field = self._makeOne('Real', min=0, max=1)
+        values = numpy.array([0.0, numpy.nan, 1.0])
+        self.assertEqual(field.validate_many(values), [])
+        values[1] = 1.5
+        self.assertEqual(
+            [e.value for e in field.validate_many(values)], [1.5])
+
+    def test_other_ndarrays_are_validated_by_item(self):
+        from zope.schema._bootstrapfields import _all_valid_in_bulk
+        field = self._makeOne()
+        self.assertTrue(_all_valid_in_bulk(field, numpy.arange(0)))
+        self.assertFalse(
+            _all_valid_in_bulk(field, numpy.zeros((2, 2), dtype=int)))
+        self.assertFalse(
+            _all_valid_in_bulk(field, numpy.array([1, 2], dtype=object)))
+        self.assertEqual(
+            field.validate_many(numpy.array([1, 2], dtype=object)), [])
+
+    def test_bounds_numpy_cannot_compare(self):
+        field = self._makeOne('Real', max=fractions.Fraction(1, 2))
+        self.assertEqual(field.validate_many(numpy.array([0.25, 0.5])), [])
+        self.assertEqual(len(field.validate_many(numpy.array([0.75]))), 1)
+
+    def test_array_uses_numpy(self):
+        field = self._makeOne('Int', min=0, max=10)
+        self.assertEqual(field.validate_many(array.array('i', [0, 10])), [])
+        self.assertEqual(
+            [e.value for e in field.validate_many(array.array('i', [11]))],
+            [11])
+
+
 class MinMaxLenTests(LenTestsMixin,
                      unittest.TestCase):
 
@@ -929,6 +1174,314 @@ class MinMaxLenTests(LenTestsMixin,
         self.assertRaisesTooLong(mml, (0, 1, 2))
 
 
+class ValidationPlanTests(unittest.TestCase):
+
+    def _callFUT(self, field):
+        from zope.schema._bootstrapfields import _compile_validation_plan
+        return _compile_validation_plan(field)
+
+    def test_flattened_for_text_and_numbers(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapfields import _validate_through_chain
+        self.assertIsNot(self._callFUT(TextLine()), _validate_through_chain)
+        self.assertIsNot(self._callFUT(Int()), _validate_through_chain)
+
+    def test_chain_for_custom_validate(self):
+        from zope.schema._bootstrapfields import Bool
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapfields import _validate_through_chain
+
+        class Custom(TextLine):
+            def _validate(self, value):
+                super()._validate(value)
+
+        self.assertIs(self._callFUT(Custom()), _validate_through_chain)
+        self.assertIs(self._callFUT(Bool()), _validate_through_chain)
+        Custom().validate('a')
+
+    def test_chain_for_computed_attributes(self):
+        from zope.schema._bootstrapfields import Text
+        from zope.schema._bootstrapfields import _validate_through_chain
+        from zope.schema._bootstrapinterfaces import RequiredMissing
+
+        class ContextRequired(Text):
+            @property
+            def required(self):
+                return self.context is not None
+
+            @required.setter
+            def required(self, value):
+                pass
+
+        field = ContextRequired()
+        self.assertIs(self._callFUT(field), _validate_through_chain)
+        field.validate('x')
+        field.validate(None)
+        bound = field.bind(object())
+        self.assertRaises(RequiredMissing, bound.validate, None)
+
+    def test_plan_cached_and_shared_with_bound_clones(self):
+        from zope.schema._bootstrapfields import TextLine
+        field = TextLine()
+        field.validate('abc')
+        plan = field.__dict__['_v_validation_plan']
+        field.validate('def')
+        self.assertIs(field.__dict__['_v_validation_plan'], plan)
+        bound = field.bind(object())
+        self.assertIs(bound.__dict__['_v_validation_plan'], plan)
+
+    def test_plan_discarded_when_attribute_changes(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapinterfaces import ConstraintNotSatisfied
+        from zope.schema._bootstrapinterfaces import TooBig
+        from zope.schema._bootstrapinterfaces import TooLong
+        field = TextLine(max_length=5)
+        field.validate('abcde')
+        field.max_length = 2
+        self.assertNotIn('_v_validation_plan', field.__dict__)
+        self.assertRaises(TooLong, field.validate, 'abcde')
+
+        field = Int()
+        field.validate(11)
+        field.max = 10
+        self.assertRaises(TooBig, field.validate, 11)
+
+        field.constraint = lambda value: value != 5
+        self.assertRaises(ConstraintNotSatisfied, field.validate, 5)
+        del field.constraint
+        field.validate(5)
+
+    def test_constraint_sees_bound_context(self):
+        from zope.schema._bootstrapfields import TextLine
+        seen = []
+
+        class Contextual(TextLine):
+            def constraint(self, value):
+                seen.append(self.context)
+                return True
+
+        field = Contextual()
+        field.validate('a')
+        context = object()
+        field.bind(context).validate('a')
+        self.assertEqual(seen, [None, context])
+
+    def test_stop_validation_from_constraint(self):
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapinterfaces import StopValidation
+
+        def _fail(value):
+            raise StopValidation
+
+        field = TextLine(constraint=_fail, min_length=5)
+        field.validate('a')
+
+    def test_plan_not_pickled(self):
+        import copy
+        import pickle
+
+        from zope.schema._bootstrapfields import TextLine
+        field = TextLine(max_length=3)
+        field.validate('abc')
+        self.assertNotIn('_v_validation_plan', field.__getstate__())
+        unpickled = pickle.loads(pickle.dumps(field))
+        self.assertNotIn('_v_validation_plan', unpickled.__dict__)
+        self.assertNotIn('_v_validation_plan', copy.copy(field).__dict__)
+        self.assertEqual(unpickled, field)
+
+
+class ContextSensitivityTests(unittest.TestCase):
+
+    def tearDown(self):
+        from zope.schema._bootstrapfields import setStrictBinding
+        setStrictBinding(False)
+
+    def _callFUT(self, field):
+        from zope.schema._bootstrapfields import _is_context_sensitive
+        return _is_context_sensitive(field)
+
+    def test_builtin_fields(self):
+        from zope.interface import Interface
+
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapfields import Object
+        from zope.schema._bootstrapfields import Password
+        from zope.schema._bootstrapfields import TextLine
+        self.assertFalse(self._callFUT(TextLine()))
+        self.assertFalse(self._callFUT(Int()))
+        self.assertFalse(self._callFUT(Object(schema=Interface)))
+        self.assertTrue(self._callFUT(Password()))
+
+    def test_not_a_field(self):
+        self.assertTrue(self._callFUT(object()))
+
+    def test_context_aware_default_factory(self):
+        from zope.interface import provider
+
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapinterfaces import \
+            IContextAwareDefaultFactory
+
+        @provider(IContextAwareDefaultFactory)
+        def _factory(context):  # pragma: no cover
+            return 1
+
+        field = Int()
+        self.assertFalse(self._callFUT(field))
+        field.defaultFactory = _factory
+        self.assertTrue(self._callFUT(field))
+
+    def test_methods_from_other_modules(self):
+        from zope.schema._bootstrapfields import TextLine
+
+        class Validating(TextLine):
+            def _validate(self, value):  # pragma: no cover
+                super()._validate(value)
+
+        class Constrained(TextLine):
+            def constraint(self, value):  # pragma: no cover
+                return True
+
+        class Binding(TextLine):
+            def bind(self, context):  # pragma: no cover
+                return super().bind(context)
+
+        for cls in Validating, Constrained, Binding:
+            self.assertTrue(self._callFUT(cls()), cls)
+        # A constraint passed in doesn't have access to the field
+        self.assertFalse(self._callFUT(TextLine(constraint=bool)))
+
+    def test_computed_attributes_from_other_modules(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapfields import ValidatedProperty
+
+        class Computed(Int):
+            max = property(lambda self: self.context.limit,
+                           lambda self, value: None)
+
+        class Stored(Int):
+            limit = 5
+            other = ValidatedProperty('other')
+
+            def helper(self):  # pragma: no cover
+                pass
+
+        self.assertTrue(self._callFUT(Computed()))
+        self.assertFalse(self._callFUT(Stored()))
+
+    def test_computed_bound_is_checked_with_context(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+
+        from zope.schema import getValidationErrors
+        from zope.schema._bootstrapfields import Int
+        from zope.schema._bootstrapinterfaces import TooBig
+        from zope.schema.fieldproperty import FieldProperty
+
+        class LimitedInt(Int):
+            @property
+            def max(self):
+                return self.context.limit if self.context else None
+
+            @max.setter
+            def max(self, value):
+                pass
+
+        class IObj(Interface):
+            n = LimitedInt()
+
+        @implementer(IObj)
+        class Obj:
+            limit = 5
+            n = FieldProperty(IObj['n'])
+
+        obj = Obj()
+        with self.assertRaises(TooBig) as exc:
+            obj.n = 10
+        self.assertEqual(exc.exception.args, (10, 5))
+        obj.__dict__['n'] = 10
+        errors = getValidationErrors(IObj, obj)
+        self.assertEqual([type(e) for name, e in errors], [TooBig])
+
+    def test_declared(self):
+        from zope.schema._bootstrapfields import Password
+        from zope.schema._bootstrapfields import TextLine
+
+        class Validating(TextLine):
+            context_sensitive = False
+
+            def _validate(self, value):  # pragma: no cover
+                super()._validate(value)
+
+        self.assertFalse(self._callFUT(Validating()))
+        field = TextLine()
+        field.context_sensitive = True
+        self.assertTrue(self._callFUT(field))
+        field = Password()
+        field.context_sensitive = False
+        self.assertFalse(self._callFUT(field))
+
+    def test_strict_binding(self):
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapfields import setStrictBinding
+        field = TextLine()
+        setStrictBinding(True)
+        self.assertTrue(self._callFUT(field))
+        setStrictBinding(False)
+        self.assertFalse(self._callFUT(field))
+
+    def test_schema_validation_skips_bind(self):
+        from zope.interface import Interface
+
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapfields import get_schema_validation_errors
+        from zope.schema._bootstrapfields import setStrictBinding
+        bound = []
+
+        class Recording(TextLine):
+            context_sensitive = False
+
+            def bind(self, context):
+                bound.append(context)
+                return super().bind(context)
+
+        class ISchema(Interface):
+            text = Recording()
+
+        class Obj:
+            text = 'text'
+
+        self.assertEqual(get_schema_validation_errors(ISchema, Obj()), {})
+        self.assertEqual(bound, [])
+
+        setStrictBinding(True)
+        self.addCleanup(setStrictBinding, False)
+        inst = Obj()
+        self.assertEqual(get_schema_validation_errors(ISchema, inst), {})
+        self.assertEqual(bound, [inst])
+
+    def test_schema_validation_errors_have_bound_fields(self):
+        from zope.interface import Interface
+
+        from zope.schema._bootstrapfields import TextLine
+        from zope.schema._bootstrapfields import get_schema_validation_errors
+
+        class ISchema(Interface):
+            text = TextLine()
+
+        class Obj:
+            text = b'bytes'
+
+        inst = Obj()
+        errors = get_schema_validation_errors(ISchema, inst)
+        field = errors['text'].field
+        self.assertIsNot(field, ISchema['text'])
+        self.assertIs(field.context, inst)
+        self.assertIsNone(ISchema['text'].context)
+
+
 class TextTests(EqualityTestsMixin,
                 WrongTypeTestsMixin,
                 unittest.TestCase):
@@ -11,6 +11,7 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
+import array
 import datetime
 import doctest
 import unittest
@@ -21,6 +22,7 @@ from zope.schema.tests.test__bootstrapfields import NumberTests
 from zope.schema.tests.test__bootstrapfields import OrderableMissingValueMixin
 from zope.schema.tests.test__bootstrapfields import OrderableTestsMixin
 from zope.schema.tests.test__bootstrapfields import WrongTypeTestsMixin
+from zope.schema.tests.test__bootstrapfields import numpy
 
 
 # pylint:disable=protected-access
@@ -643,6 +645,22 @@ class ChoiceTests(EqualityTestsMixin,
         instance = object()
         self.assertRaises(ValueError, source.bind, instance)
 
+    def test__isContextSensitive(self):
+        from zope.interface import implementer
+
+        from zope.schema.interfaces import IContextSourceBinder
+
+        @implementer(IContextSourceBinder)
+        class Binder:
+            def __call__(self, context):
+                raise AssertionError("Not called")
+
+        self.assertFalse(self._makeOne(values=(1, 2))._isContextSensitive())
+        self.assertTrue(
+            self._makeOne(vocabulary='temp')._isContextSensitive())
+        self.assertTrue(
+            self._makeOne(source=Binder())._isContextSensitive())
+
     def test_fromUnicode_miss(self):
         from zope.schema.interfaces import ConstraintNotSatisfied
 
@@ -1172,6 +1190,36 @@ class InterfaceFieldTests(EqualityTestsMixin,
         self.assertRaises(RequiredMissing, field.validate, None)
 
 
+class ValidateUniquenessTests(unittest.TestCase):
+
+    def _callFUT(self, value):
+        from zope.schema._field import _validate_uniqueness
+        return _validate_uniqueness(self, value)
+
+    def assertRaisesNotUnique(self, value, item):
+        from zope.schema.interfaces import NotUnique
+        with self.assertRaises(NotUnique) as exc:
+            self._callFUT(value)
+        self.assertEqual(exc.exception.args, (item,))
+        self.assertIs(exc.exception.field, self)
+        self.assertIs(exc.exception.value, value)
+
+    def test_unique(self):
+        self._callFUT([])
+        self._callFUT([1, 2, 'a', (1,), [1], [2], {'a': 1}])
+        self._callFUT({1, 2})
+        self._callFUT(range(20000))
+
+    def test_hashable_duplicate(self):
+        self.assertRaisesNotUnique([1, 2, 3, 2, 1], 2)
+        # Equal values with different types are duplicates, as before
+        self.assertRaisesNotUnique([1, 1.0], 1.0)
+
+    def test_unhashable_duplicate(self):
+        self.assertRaisesNotUnique([[1], 1, [2], [1]], [1])
+        self.assertRaisesNotUnique([{'a': 1}, {'a': 1}], {'a': 1})
+
+
 class CollectionTests(EqualityTestsMixin,
                       LenTestsMixin,
                       unittest.TestCase):
@@ -1252,14 +1300,33 @@ class CollectionTests(EqualityTestsMixin,
 
     def test_bind_w_value_Type(self):
         from zope.schema._bootstrapfields import Text
+        from zope.schema._bootstrapfields import setStrictBinding
         text = Text()
         absc = self._makeOne(text, True)
         context = object()
         bound = absc.bind(context)
         self.assertEqual(bound.context, context)
+        # Text does not use the context; it is not cloned.
+        self.assertIs(bound.value_type, text)
+        self.assertEqual(bound.unique, True)
+
+        setStrictBinding(True)
+        self.addCleanup(setStrictBinding, False)
+        bound = absc.bind(context)
         self.assertEqual(isinstance(bound.value_type, Text), True)
         self.assertEqual(bound.value_type.context, context)
-        self.assertEqual(bound.unique, True)
+
+    def test_bind_w_context_sensitive_value_Type(self):
+        from zope.schema._bootstrapfields import Text
+
+        class ContextText(Text):
+            context_sensitive = True
+
+        absc = self._makeOne(ContextText(), True)
+        self.assertTrue(absc._isContextSensitive())
+        context = object()
+        bound = absc.bind(context)
+        self.assertEqual(bound.value_type.context, context)
 
     def test__validate_wrong_contained_type(self):
         from zope.schema._bootstrapfields import Text
@@ -1278,6 +1345,59 @@ class CollectionTests(EqualityTestsMixin,
         self.assertIsInstance(wct.errors[0], WrongType)
         self.assertIs(wct.errors[0].expected_type, text._type)
 
+    def test__validate_wrong_contained_type_reports_all_errors(self):
+        from zope.schema._bootstrapfields import Text
+        from zope.schema.interfaces import WrongContainedType
+        absc = self._makeOne(Text())
+        self.assertIsNone(absc.max_errors)
+        with self.assertRaises(WrongContainedType) as exc:
+            absc.validate(self._makeCollection([1, 2, 3]))
+        self.assertEqual(3, len(exc.exception.errors))
+
+    def test__validate_wrong_contained_type_w_max_errors(self):
+        from zope.schema._bootstrapfields import Text
+        from zope.schema.interfaces import WrongContainedType
+        absc = self._makeOne(Text(), max_errors=2)
+        self.assertEqual(absc.max_errors, 2)
+        with self.assertRaises(WrongContainedType) as exc:
+            absc.validate(self._makeCollection([1, 2, 3]))
+        self.assertEqual(2, len(exc.exception.errors))
+
+    def test_ctor_w_invalid_max_errors(self):
+        from zope.schema._bootstrapfields import Text
+        for max_errors in (0, -1, 1.5, '2', True):
+            self.assertRaises(ValueError, self._makeOne, Text(),
+                              max_errors=max_errors)
+        self.assertIsNone(self._makeOne(Text(), max_errors=None).max_errors)
+
+    def test__validate_wrong_contained_type_w_fail_fast(self):
+        from zope.schema._bootstrapfields import Text
+        from zope.schema.interfaces import WrongContainedType
+        absc = self._makeOne(Text(), fail_fast=True)
+        self.assertEqual(absc.max_errors, 1)
+        with self.assertRaises(WrongContainedType) as exc:
+            absc.validate(self._makeCollection([1, 2, 3]))
+        self.assertEqual(1, len(exc.exception.errors))
+
+    def test__validate_uses_validate_many(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema.interfaces import TooSmall
+        from zope.schema.interfaces import WrongContainedType
+        calls = []
+
+        class RecordingInt(Int):
+            def validate_many(self, values, max_errors=None):
+                calls.append(max_errors)
+                return super().validate_many(values, max_errors)
+
+        absc = self._makeOne(RecordingInt(min=0), max_errors=2)
+        absc.validate(self._makeCollection([0, 1]))
+        with self.assertRaises(WrongContainedType) as exc:
+            absc.validate(self._makeCollection([-1, -2, -3]))
+        self.assertEqual(calls, [2, 2])
+        self.assertEqual(2, len(exc.exception.errors))
+        self.assertIsInstance(exc.exception.errors[0], TooSmall)
+
     def test__validate_miss_uniqueness(self):
         from zope.schema._bootstrapfields import Text
         from zope.schema.interfaces import NotUnique
@@ -1472,6 +1592,168 @@ class ListTests(MutableSequenceTests):
             super().test_mutable_sequence()
 
 
+class NumericArrayTests(EqualityTestsMixin,
+                        LenTestsMixin,
+                        unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema._field import NumericArray
+        return NumericArray
+
+    def _getTargetInterface(self):
+        from zope.schema.interfaces import INumericArray
+        return INumericArray
+
+    def test_ctor_defaults(self):
+        field = self._makeOne()
+        self.assertIsNone(field.dtype)
+        self.assertIsNone(field.min)
+        self.assertIsNone(field.max)
+
+    def test_ctor_invalid_dtype(self):
+        for dtype in ('?', 'x', 's', 'dd', '<d', b'd', float):
+            self.assertRaises(ValueError, self._makeOne, dtype=dtype)
+
+    def test_ctor_validates_default(self):
+        from zope.schema.interfaces import WrongContainedType
+        self._makeOne(max=1, default=array.array('b', [1]))
+        self.assertRaises(WrongContainedType,
+                          self._makeOne, max=1, default=array.array('b', [2]))
+
+    def test_validate_buffers(self):
+        field = self._makeOne()
+        field.validate(array.array('d', [1.5]))
+        field.validate(array.array('L', [1, 2]))
+        field.validate(memoryview(array.array('i', [1])))
+        field.validate(memoryview(b'abc'))
+        field.validate(bytearray(b'abc'))
+
+    def test_validate_not_a_buffer(self):
+        from zope.schema.interfaces import WrongType
+        field = self._makeOne()
+        for value in ([1.0], (1, 2), 'abc', 1, object()):
+            with self.assertRaises(WrongType) as exc:
+                field.validate(value)
+            self.assertIs(exc.exception.expected_type, memoryview)
+            self.assertIs(exc.exception.field, field)
+
+    def test_validate_wrong_format(self):
+        from zope.schema.interfaces import WrongArrayFormat
+        field = self._makeOne(dtype='d')
+        field.validate(array.array('d'))
+        for value in (array.array('f'), array.array('q'), b'abc',
+                      memoryview(b'\0').cast('?')):
+            with self.assertRaises(WrongArrayFormat) as exc:
+                field.validate(value)
+            self.assertEqual(exc.exception.expected_type, 'd')
+            self.assertIs(exc.exception.value, value)
+
+    def test_validate_equivalent_formats(self):
+        import struct
+        field = self._makeOne(dtype='q')
+        field.validate(memoryview(array.array('q', [1])).cast('B').cast('q'))
+        if struct.calcsize('l') == struct.calcsize('q'):  # pragma: no branch
+            field.validate(array.array('l', [1]))
+        field = self._makeOne(dtype='@d')
+        field.validate(array.array('d', [1.5]))
+        view = memoryview(array.array('d', [1.5])).cast('B').cast('@d')
+        self.assertEqual(view.format, '@d')
+        field.validate(view)
+
+    def test_validate_not_one_dimensional(self):
+        from zope.schema.interfaces import WrongArrayFormat
+        field = self._makeOne()
+        value = memoryview(bytes(4)).cast('B', (2, 2))
+        self.assertRaises(WrongArrayFormat, field.validate, value)
+
+    def test_validate_missing(self):
+        from zope.schema.interfaces import RequiredMissing
+        self._makeOne(required=False).validate(None)
+        self.assertRaises(RequiredMissing, self._makeOne().validate, None)
+
+    def test_validate_min_length(self):
+        field = self._makeOne(min_length=2)
+        field.validate(array.array('i', [1, 2]))
+        self.assertRaisesTooShort(field, array.array('i', [1]))
+
+    def test_validate_max_length(self):
+        field = self._makeOne(max_length=1)
+        field.validate(array.array('i', [1]))
+        self.assertRaisesTooLong(field, array.array('i', [1, 2]))
+
+    def test_validate_bounds(self):
+        from zope.schema.interfaces import TooBig
+        from zope.schema.interfaces import TooSmall
+        from zope.schema.interfaces import WrongContainedType
+        field = self._makeOne(min=0, max=1)
+        field.validate(array.array('d'))
+        field.validate(array.array('d', [0.0, 0.5, 1.0, float('nan')]))
+        value = array.array('d', [2.0, 0.5, -1.0])
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate(value)
+        wct = exc.exception
+        self.assertIs(wct.field, field)
+        self.assertIs(wct.value, value)
+        self.assertEqual([type(e) for e in wct.errors], [TooBig, TooSmall])
+        self.assertEqual([e.value for e in wct.errors], [2.0, -1.0])
+        self.assertEqual([e.bound for e in wct.errors], [1, 0])
+
+    def test_validate_bounds_without_numpy(self):
+        from zope.schema import _bootstrapfields
+        from zope.schema.interfaces import WrongContainedType
+        field = self._makeOne(min=0, max=10)
+        numpy = _bootstrapfields.numpy
+        _bootstrapfields.numpy = None
+        try:
+            field.validate(array.array('b'))
+            field.validate(array.array('b', [0, 10]))
+            field.validate(array.array('f', [0.5, float('nan')]))
+            for value in (array.array('b', [11]), array.array('f', [-1])):
+                self.assertRaises(WrongContainedType, field.validate, value)
+        finally:
+            _bootstrapfields.numpy = numpy
+
+    def test_validate_constraint(self):
+        from zope.schema.interfaces import ConstraintNotSatisfied
+        field = self._makeOne(constraint=lambda value: len(value) % 2 == 0)
+        field.validate(array.array('d', [1, 2]))
+        self.assertRaises(ConstraintNotSatisfied, field.validate,
+                          array.array('d', [1]))
+
+    def test_validate_constraint_stops_validation(self):
+        from zope.schema.interfaces import StopValidation
+
+        def _constraint(value):
+            raise StopValidation
+
+        field = self._makeOne(max=1, constraint=_constraint)
+        field.validate(array.array('d', [2]))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_ctor_numpy_dtype(self):
+        self.assertRaises(ValueError, self._makeOne, dtype=numpy.float64)
+        self.assertRaises(ValueError, self._makeOne,
+                          dtype=numpy.dtype('d'))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_validate_ndarray(self):
+        from zope.schema.interfaces import TooBig
+        from zope.schema.interfaces import WrongArrayFormat
+        from zope.schema.interfaces import WrongContainedType
+        field = self._makeOne(dtype='d', min=0, max=1)
+        field.validate(numpy.linspace(0, 1, 11))
+        field.validate(numpy.linspace(0, 2, 11)[:6])
+        field.validate(numpy.linspace(0, 1, 11)[::2])
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate(numpy.array([0.5, 1.5]))
+        self.assertEqual([type(e) for e in exc.exception.errors], [TooBig])
+        self.assertEqual(exc.exception.errors[0].value, 1.5)
+        for value in (numpy.zeros(2, dtype=numpy.float32),
+                      numpy.zeros(2, dtype='>f8'),
+                      numpy.zeros((2, 2))):
+            self.assertRaises(WrongArrayFormat, field.validate, value)
+
+
 class SetTests(WrongTypeTestsMixin,
                CollectionTests):
 
@@ -1609,6 +1891,44 @@ class MappingTests(EqualityTestsMixin,
         self.assertIsInstance(wct.errors[0], WrongType)
         self.assertIs(field.value_type._type, wct.errors[0].expected_type)
 
+    def test_validate_invalid_keys_and_values_reports_all_errors(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema.interfaces import WrongContainedType
+        field = self._makeOne(key_type=Int(), value_type=Int())
+        self.assertIsNone(field.max_errors)
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate({'a': 'b', 'c': 'd'})
+        self.assertEqual(4, len(exc.exception.errors))
+
+    def test_validate_invalid_keys_and_values_w_max_errors(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema.interfaces import WrongContainedType
+        from zope.schema.interfaces import WrongType
+        field = self._makeOne(key_type=Int(), value_type=Int(), max_errors=3)
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate({'a': 'b', 'c': 'd'})
+        errors = exc.exception.errors
+        self.assertEqual(3, len(errors))
+        # Values are checked first, then keys.
+        self.assertEqual([e.value for e in errors], ['b', 'd', 'a'])
+        self.assertIsInstance(errors[2], WrongType)
+
+    def test_ctor_w_invalid_max_errors(self):
+        from zope.schema._bootstrapfields import Int
+        for max_errors in (0, -1, 1.5, '2', True):
+            self.assertRaises(ValueError, self._makeOne, key_type=Int(),
+                              value_type=Int(), max_errors=max_errors)
+
+    def test_validate_invalid_value_type_w_fail_fast(self):
+        from zope.schema._bootstrapfields import Int
+        from zope.schema.interfaces import WrongContainedType
+        field = self._makeOne(key_type=Int(), value_type=Int(),
+                              fail_fast=True)
+        self.assertEqual(field.max_errors, 1)
+        with self.assertRaises(WrongContainedType) as exc:
+            field.validate({'a': 'b', 'c': 'd'})
+        self.assertEqual(['b'], [e.value for e in exc.exception.errors])
+
     def test_validate_min_length(self):
         field = self._makeOne(min_length=1)
         field.validate({1: 'a'})
@@ -1638,11 +1958,21 @@ class MappingTests(EqualityTestsMixin,
 
     def test_bind_binds_key_and_value_types(self):
         from zope.schema import Int
-        field = self._makeOne(key_type=Int(), value_type=Int())
+        from zope.schema import Text
+        field = self._makeOne(key_type=Text(), value_type=Int())
         context = object()
         field2 = field.bind(context)
+        # Neither uses the context; they are not cloned.
+        self.assertIs(field2.key_type, field.key_type)
+        self.assertIs(field2.value_type, field.value_type)
+
+        Text.context_sensitive = True
+        self.addCleanup(delattr, Text, 'context_sensitive')
+        field = self._makeOne(key_type=Text(), value_type=Int())
+        self.assertTrue(field._isContextSensitive())
+        field2 = field.bind(context)
         self.assertEqual(field2.key_type.context, context)
-        self.assertEqual(field2.value_type.context, context)
+        self.assertIs(field2.value_type, field.value_type)
 
     def test_mapping(self):
         from zope.schema._field import abc
@@ -203,6 +203,142 @@ class FieldPropertyTests(_Base, _Integration):
         foo = Foo()
         self.assertEqual(foo.testing, '456')
 
+    def _makeBindCountingField(self, **kw):
+        from zope.schema import Text
+
+        class _BindCounting(Text):
+            binds = 0
+
+            def bind(self, context):
+                type(self).binds += 1
+                return super().bind(context)
+
+        return _BindCounting(__name__='testing', **kw)
+
+    def test___get___static_default_does_not_bind(self):
+        field = self._makeBindCountingField(default='DEFAULT')
+        prop = self._makeOne(field)
+
+        class Foo:
+            testing = prop
+
+        foo = Foo()
+        self.assertEqual(foo.testing, 'DEFAULT')
+        self.assertEqual(foo.testing, 'DEFAULT')
+        self.assertEqual(prop.queryValue(foo, None), 'DEFAULT')
+        self.assertEqual(type(field).binds, 0)
+        # Changing the default is seen.
+        field.default = 'OTHER'
+        self.assertEqual(foo.testing, 'OTHER')
+        self.assertEqual(type(field).binds, 0)
+
+    def test___get___context_aware_default_binds(self):
+        from zope.interface import provider
+
+        from zope.schema.interfaces import IContextAwareDefaultFactory
+
+        @provider(IContextAwareDefaultFactory)
+        def factory(context):
+            return context.name
+
+        field = self._makeBindCountingField(defaultFactory=factory)
+        prop = self._makeOne(field)
+
+        class Foo:
+            testing = prop
+            name = 'FOO'
+
+        self.assertEqual(Foo().testing, 'FOO')
+        self.assertEqual(type(field).binds, 1)
+
+    def test___get___static_default_with_strict_binding(self):
+        from zope.schema import setStrictBinding
+        field = self._makeBindCountingField(default='DEFAULT')
+        prop = self._makeOne(field)
+
+        class Foo:
+            testing = prop
+
+        setStrictBinding(True)
+        self.addCleanup(setStrictBinding, False)
+        self.assertEqual(Foo().testing, 'DEFAULT')
+        self.assertEqual(type(field).binds, 1)
+
+    def test_ctor_storage_is_name(self):
+        from zope.schema import Int
+        field = Int(__name__='x')
+        self.assertRaises(ValueError, self._getTargetClass(),
+                          field, storage='x')
+        self.assertRaises(ValueError, self._getTargetClass(),
+                          field, name='y', storage='y')
+        self._getTargetClass()(field, storage='_x')
+
+    def _makeSlotted(self, readonly=False):
+        from zope.schema import Int
+
+        class Point:
+            __slots__ = ('_x',)
+            x = self._getTargetClass()(
+                Int(__name__='x', default=0, min=0, readonly=readonly),
+                storage='_x')
+
+        return Point()
+
+    def test_slot_storage(self):
+        from zope.schema.interfaces import TooSmall
+        point = self._makeSlotted()
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(point.x, 0)
+        self.assertEqual(type(point).x.queryValue(point, None), 0)
+        point.x = 3
+        self.assertEqual(point.x, 3)
+        self.assertEqual(point._x, 3)
+        self.assertRaises(TooSmall, setattr, point, 'x', -1)
+        self.assertEqual(point.x, 3)
+
+    def test_slot_storage_readonly(self):
+        point = self._makeSlotted(readonly=True)
+        point.x = 3
+        self.assertRaises(ValueError, setattr, point, 'x', 4)
+        self.assertEqual(point.x, 3)
+
+    def test_slot_storage_event(self):
+        from zope.event import subscribers
+        point = self._makeSlotted()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        point.x = 3
+        point.x = 4
+        self.assertEqual([(e.old_value, e.new_value) for e in log],
+                         [(0, 3), (3, 4)])
+
+    def test_descriptor_storage(self):
+        from zope.schema import Text
+        stored = {}
+
+        class _Storage:
+            def __get__(self, inst, klass):
+                try:
+                    return stored[id(inst)]
+                except KeyError:
+                    raise AttributeError('testing')
+
+            def __set__(self, inst, value):
+                stored[id(inst)] = value
+
+        class Foo:
+            testing = self._getTargetClass()(
+                Text(__name__='testing', default='DEFAULT'),
+                storage=_Storage())
+
+        foo = Foo()
+        self.assertEqual(foo.testing, 'DEFAULT')
+        foo.testing = 'VALUE'
+        self.assertEqual(foo.testing, 'VALUE')
+        self.assertEqual(stored, {id(foo): 'VALUE'})
+        self.assertEqual(foo.__dict__, {})
+
     def test___set___not_readonly(self):
         class _Faux:
             readonly = False
@@ -338,6 +474,82 @@ class FieldPropertyTests(_Base, _Integration):
         self.assertEqual(event.inst, marker)
         self.assertEqual(event.object, marker)
 
+    def test___set___without_subscribers_skips_old_value(self):
+        _clearSubscribers(self)
+        prop = self._makeOne()
+        prop.queryValue = None  # would fail if called
+
+        class Foo:
+            testing = prop
+
+        foo = Foo()
+        foo.testing = 'Bar'
+        self.assertEqual(foo.testing, 'Bar')
+
+    def test_field_event_has_bound_field(self):
+        from zope.event import subscribers
+
+        from zope.schema import Text
+        field = Text(__name__='testing')
+
+        class Foo:
+            testing = self._makeOne(field)
+
+        foo = Foo()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        foo.testing = 'Bar'
+        self.assertIs(log[0].field.context, foo)
+        self.assertIsNone(field.context)
+
+    def test_field_event_reuses_bound_field(self):
+        from zope.event import subscribers
+        field = self._makeBindCountingField()
+
+        class Foo:
+            testing = self._makeOne(field)
+
+        foo = Foo()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        foo.testing = 'Bar'
+        self.assertIs(log[0].field.context, foo)
+        self.assertEqual(type(field).binds, 1)
+
+    def test_error_has_bound_field(self):
+        from zope.schema import Int
+        from zope.schema.interfaces import TooSmall
+        field = Int(__name__='testing', min=0)
+
+        class Foo:
+            testing = self._makeOne(field)
+
+        foo = Foo()
+        with self.assertRaises(TooSmall) as exc:
+            foo.testing = -1
+        self.assertIs(exc.exception.field.context, foo)
+        self.assertIsNone(field.context)
+
+    def test___set___notify_false(self):
+        from zope.event import subscribers
+
+        from zope.schema import Text
+        prop = self._getTargetClass()(Text(__name__='testing'),
+                                      notify=False)
+
+        class Foo:
+            testing = prop
+
+        foo = Foo()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        foo.testing = 'Bar'
+        self.assertEqual(foo.testing, 'Bar')
+        self.assertEqual(log, [])
+
     def test_field_Bool_is_required(self):
         # the Bool field is required by default
         from zope.schema import Bool
@@ -508,6 +720,10 @@ class FieldPropertyStoredThroughFieldTests(_Base, _Integration):
         self.assertEqual(foo.testing, '456')
 
     def test___set___not_readonly(self):
+        from zope.event import subscribers
+
+        from zope.schema.fieldproperty import NO_VALUE
+
         class _Faux:
             __name__ = 'Faux'
             readonly = False
@@ -531,9 +747,14 @@ class FieldPropertyStoredThroughFieldTests(_Base, _Integration):
             testing = prop
 
         foo = Foo()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
         foo.testing = '123'
         self.assertEqual(foo.__dict__['faux'], '123')
         self.assertEqual(_validated, ['123'])
+        self.assertEqual([(e.old_value, e.new_value) for e in log],
+                         [(NO_VALUE, '123')])
 
     def test___set___w_readonly_not_already_set(self):
         class _Faux:
@@ -589,6 +810,17 @@ class FieldPropertyStoredThroughFieldTests(_Base, _Integration):
         foo.__dict__['testing'] = '789'
         self.assertRaises(ValueError, setattr, foo, 'testing', '123')
 
+    def test___set___without_subscribers_skips_old_value(self):
+        _clearSubscribers(self)
+
+        class Foo:
+            testing = self._makeOne()
+
+        Foo.testing.queryValue = None  # would fail if called
+        foo = Foo()
+        foo.testing = 'Bar'
+        self.assertEqual(foo.testing, 'Bar')
+
     def test_field_event_update(self):
         from zope.event import subscribers
 
@@ -648,6 +880,14 @@ class FieldPropertyStoredThroughFieldTests(_Base, _Integration):
         self.assertEqual(event.new_value, 0)
 
 
+def _clearSubscribers(test):
+    # Remove the zope.event subscribers for the duration of *test*.
+    from zope.event import subscribers
+    saved = subscribers[:]
+    del subscribers[:]
+    test.addCleanup(subscribers.extend, saved)
+
+
 def _getSchema():
     from zope.interface import Interface
 
@@ -665,6 +905,234 @@ def _getSchema():
     return Schema
 
 
+class UpdateTests(unittest.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from zope.schema.fieldproperty import update
+        return update(*args, **kw)
+
+    def _makeSchema(self):
+        from zope.interface import Interface
+        from zope.interface import Invalid
+        from zope.interface import invariant
+
+        from zope.schema import Int
+
+        class IRange(Interface):
+            start = Int(min=0, default=0)
+            stop = Int(min=0, default=10)
+            step = Int(min=1, default=1, readonly=True)
+            label = Int(required=False)
+
+            @invariant
+            def ordered(obj):
+                if obj.start > obj.stop:
+                    raise Invalid('start after stop')
+
+        return IRange
+
+    def _makeOne(self, schema):
+        from zope.schema.fieldproperty import createFieldProperties
+
+        class Range:
+            createFieldProperties(schema, omit=['label'])
+
+        return Range()
+
+    def _subscribe(self):
+        from zope.event import subscribers
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        return log
+
+    def test_sets_values_then_notifies(self):
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        log = []
+
+        def subscriber(event):
+            log.append((event.field.__name__, event.old_value,
+                        event.new_value, obj.start, obj.stop))
+
+        from zope.event import subscribers
+        subscribers.append(subscriber)
+        self.addCleanup(subscribers.remove, subscriber)
+        self._callFUT(obj, {'start': 2, 'stop': 5})
+        self.assertEqual((obj.start, obj.stop), (2, 5))
+        self.assertEqual(log, [('start', 0, 2, 2, 5), ('stop', 10, 5, 2, 5)])
+
+    def test_events_have_bound_fields(self):
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        log = self._subscribe()
+        self._callFUT(obj, {'start': 2, 'stop': 5})
+        self.assertEqual([e.field.context for e in log], [obj, obj])
+
+    def test_invalid_value_changes_nothing(self):
+        from zope.schema.interfaces import TooSmall
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        log = self._subscribe()
+        self.assertRaises(TooSmall, self._callFUT,
+                          obj, {'start': 2, 'stop': -1})
+        self.assertEqual(obj.__dict__, {})
+        self.assertEqual(log, [])
+
+    def test_without_subscribers_skips_old_values(self):
+        _clearSubscribers(self)
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        type(obj).start._getDefault = None  # would fail if called
+        self._callFUT(obj, {'start': 2})
+        self.assertEqual(obj.start, 2)
+
+    def test_readonly(self):
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        self._callFUT(obj, {'step': 2})
+        self.assertRaises(ValueError, self._callFUT,
+                          obj, {'start': 1, 'step': 3})
+        self.assertEqual(obj.__dict__, {'step': 2})
+
+    def test_schema_fields_for_other_attributes(self):
+        from zope.schema.interfaces import WrongType
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        log = self._subscribe()
+        self._callFUT(obj, {'start': 1, 'label': 7}, schema)
+        self.assertEqual(obj.label, 7)
+        self.assertEqual([e.field.__name__ for e in log], ['start'])
+        self.assertRaises(WrongType, self._callFUT,
+                          obj, {'label': 'seven'}, schema)
+        self.assertRaises(KeyError, self._callFUT, obj, {'label': 8})
+        self.assertRaises(KeyError, self._callFUT,
+                          obj, {'missing': 8}, schema)
+        self.assertEqual(obj.label, 7)
+
+    def test_errors_have_bound_fields(self):
+        from zope.schema.interfaces import TooSmall
+        from zope.schema.interfaces import WrongType
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        with self.assertRaises(TooSmall) as exc:
+            self._callFUT(obj, {'start': -1})
+        self.assertIs(exc.exception.field.context, obj)
+        with self.assertRaises(WrongType) as exc:
+            self._callFUT(obj, {'label': 'seven'}, schema)
+        self.assertIs(exc.exception.field.context, obj)
+
+    def test_invariants(self):
+        from zope.interface import Invalid
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        obj.stop = 5
+        log = self._subscribe()
+        # Without invariants, nothing is checked.
+        self._callFUT(obj, {'start': 6}, schema)
+        self._callFUT(obj, {'start': 0}, schema)
+        del log[:]
+        self.assertRaises(Invalid, self._callFUT,
+                          obj, {'start': 3, 'stop': 2, 'label': 1},
+                          schema, invariants=True)
+        self.assertEqual(obj.__dict__, {'start': 0, 'stop': 5})
+        self.assertEqual(log, [])
+        self._callFUT(obj, {'start': 3}, schema, invariants=True)
+        self.assertEqual(obj.start, 3)
+        self.assertEqual(len(log), 1)
+
+    def test_invariants_other_attributes_restored(self):
+        from zope.interface import Invalid
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        obj.label = 1
+        self.assertRaises(Invalid, self._callFUT,
+                          obj, {'start': 11, 'label': 2}, schema,
+                          invariants=True)
+        self.assertEqual(obj.label, 1)
+        self.assertEqual(obj.__dict__, {'label': 1})
+
+    def test_invariants_without_schema(self):
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        self.assertRaises(ValueError, self._callFUT,
+                          obj, {'start': 1}, invariants=True)
+        self.assertEqual(obj.__dict__, {})
+
+    def test_unset_values_restored(self):
+        from zope.interface import Invalid
+        schema = self._makeSchema()
+        obj = self._makeOne(schema)
+        self.assertRaises(Invalid, self._callFUT,
+                          obj, {'start': 3, 'stop': 2}, schema,
+                          invariants=True)
+        self.assertEqual(obj.__dict__, {})
+        self.assertEqual((obj.start, obj.stop), (0, 10))
+
+    def test_slot_storage_restored(self):
+        from zope.interface import Interface
+        from zope.interface import Invalid
+        from zope.interface import invariant
+
+        from zope.schema import Int
+        from zope.schema.fieldproperty import FieldProperty
+
+        class IPoint(Interface):
+            x = Int()
+
+            @invariant
+            def positive(obj):
+                if obj.x < 0:
+                    raise Invalid('negative')
+
+        class Point:
+            __slots__ = ('_x',)
+            x = FieldProperty(IPoint['x'], storage='_x')
+
+        point = Point()
+        self.assertRaises(Invalid, self._callFUT,
+                          point, {'x': -1}, IPoint, invariants=True)
+        self.assertFalse(hasattr(point, '_x'))
+        self._callFUT(point, {'x': 1}, IPoint, invariants=True)
+        self.assertRaises(Invalid, self._callFUT,
+                          point, {'x': -1}, IPoint, invariants=True)
+        self.assertEqual(point.x, 1)
+
+    def test_descriptor_storage_restored(self):
+        from zope.interface import Invalid
+
+        from zope.schema.fieldproperty import FieldProperty
+        stored = {}
+
+        class _Storage:
+            def __get__(self, inst, klass):
+                try:
+                    return stored[id(inst)]
+                except KeyError:
+                    raise AttributeError('start')
+
+            def __set__(self, inst, value):
+                stored[id(inst)] = value
+
+            def __delete__(self, inst):
+                del stored[id(inst)]
+
+        schema = self._makeSchema()
+
+        class Range:
+            start = FieldProperty(schema['start'], storage=_Storage())
+            stop = FieldProperty(schema['stop'])
+
+        obj = Range()
+        self.assertRaises(Invalid, self._callFUT,
+                          obj, {'start': 11}, schema, invariants=True)
+        self.assertEqual(stored, {})
+        self._callFUT(obj, {'start': 5}, schema, invariants=True)
+        self.assertRaises(Invalid, self._callFUT,
+                          obj, {'start': 11}, schema, invariants=True)
+        self.assertEqual(stored, {id(obj): 5})
+
+
 class CreateFieldPropertiesTests(unittest.TestCase):
     """Testing ..fieldproperty.createFieldProperties."""
 
@@ -680,6 +1148,159 @@ class CreateFieldPropertiesTests(unittest.TestCase):
         self.assertIsInstance(Dummy.date, FieldProperty)
         self.assertIs(Dummy.date._FieldProperty__field, schema['date'])
 
+    def test_notify_false(self):
+        from zope.event import subscribers
+
+        from zope.schema.fieldproperty import createFieldProperties
+
+        class Dummy:
+            createFieldProperties(_getSchema(), notify=False)
+
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        dummy = Dummy()
+        dummy.title = 'title'
+        self.assertEqual(dummy.title, 'title')
+        self.assertEqual(log, [])
+
+    def _makeSpecialized(self):
+        from zope.schema.fieldproperty import createFieldProperties
+
+        class Dummy:
+            createFieldProperties(_getSchema(), specialize=True)
+
+        return Dummy
+
+    def test_specialize(self):
+        from zope.schema.fieldproperty import FieldProperty
+        Dummy = self._makeSpecialized()
+        for name in ('title', 'weight', 'code', 'date'):
+            prop = Dummy.__dict__[name]
+            self.assertIsInstance(prop, FieldProperty)
+            self.assertIsNot(type(prop), FieldProperty)
+            self.assertEqual(prop.__name__, name)
+        self.assertIsNot(type(Dummy.title), type(Dummy.weight))
+
+    def test_specialize_behaves_like_field_property(self):
+        from zope.schema.interfaces import ValidationError
+        Dummy = self._makeSpecialized()
+        dummy = Dummy()
+        self.assertEqual(dummy.title, 'say something')
+        self.assertEqual(dummy.weight, None)
+        self.assertEqual(Dummy.code.queryValue(dummy, None), b'xxxxxx')
+        self.assertRaises(ValidationError, setattr, dummy, 'title', b'foo')
+        self.assertRaises(ValidationError, setattr, dummy, 'weight', -1.0)
+        self.assertRaises(ValidationError, setattr, dummy, 'code', b'xxxx')
+        dummy.title = 'good'
+        dummy.weight = 10.0
+        self.assertEqual((dummy.title, dummy.weight), ('good', 10.0))
+        dummy.date = 0.0
+        self.assertRaises(ValueError, setattr, dummy, 'date', 1.0)
+        self.assertEqual(dummy.__dict__,
+                         {'title': 'good', 'weight': 10.0, 'date': 0.0})
+
+    def test_specialize_without_default(self):
+        from zope.schema import Text
+        from zope.schema.fieldproperty import _specializedFieldProperty
+
+        class _NoDefault(Text):
+            @property
+            def default(self):
+                raise AttributeError('default')
+
+            @default.setter
+            def default(self, value):
+                pass
+
+        class Dummy:
+            testing = _specializedFieldProperty(
+                _NoDefault(__name__='testing'), True)
+
+        self.assertRaises(AttributeError, getattr, Dummy(), 'testing')
+
+    def test_specialize_default_factory(self):
+        from zope.schema import Text
+        from zope.schema.fieldproperty import _specializedFieldProperty
+        made = []
+
+        def _factory():
+            made.append(1)
+            return 'MADE'
+
+        class Dummy:
+            testing = _specializedFieldProperty(
+                Text(__name__='testing', defaultFactory=_factory), True)
+
+        self.assertEqual(Dummy().testing, 'MADE')
+        self.assertEqual(Dummy().testing, 'MADE')
+        self.assertEqual(len(made), 2)
+
+    def test_specialize_events(self):
+        from zope.event import subscribers
+        Dummy = self._makeSpecialized()
+        dummy = Dummy()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        dummy.title = 'one'
+        dummy.title = 'two'
+        self.assertEqual(
+            [(e.field.__name__, e.old_value, e.new_value) for e in log],
+            [('title', 'say something', 'one'), ('title', 'one', 'two')])
+
+    def test_specialize_event_has_bound_field(self):
+        from zope.event import subscribers
+        Dummy = self._makeSpecialized()
+        dummy = Dummy()
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        dummy.title = 'one'
+        self.assertIs(log[0].field.context, dummy)
+
+    def test_specialize_error_has_bound_field(self):
+        from zope.schema.interfaces import TooSmall
+        Dummy = self._makeSpecialized()
+        dummy = Dummy()
+        with self.assertRaises(TooSmall) as exc:
+            dummy.weight = -1.0
+        self.assertIs(exc.exception.field.context, dummy)
+        self.assertIsNone(Dummy.weight.context)
+
+    def test_specialize_without_notify(self):
+        from zope.event import subscribers
+
+        from zope.schema.fieldproperty import createFieldProperties
+
+        class Dummy:
+            createFieldProperties(_getSchema(), notify=False,
+                                  specialize=True)
+
+        log = []
+        subscribers.append(log.append)
+        self.addCleanup(subscribers.remove, log.append)
+        Dummy().title = 'one'
+        self.assertEqual(log, [])
+
+    def test_specialize_skips_context_sensitive_fields(self):
+        from zope.interface import Interface
+
+        from zope.schema import Choice
+        from zope.schema import Int
+        from zope.schema.fieldproperty import FieldProperty
+        from zope.schema.fieldproperty import createFieldProperties
+
+        class ISchema(Interface):
+            choice = Choice(vocabulary='named')
+            number = Int()
+
+        class Dummy:
+            createFieldProperties(ISchema, specialize=True)
+
+        self.assertIs(type(Dummy.choice), FieldProperty)
+        self.assertIsNot(type(Dummy.number), FieldProperty)
+
     def test_fields_in_omit_are_not_created_on_class(self):
         from zope.schema.fieldproperty import createFieldProperties
 
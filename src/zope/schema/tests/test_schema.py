@@ -85,6 +85,14 @@ class Test_getFields(unittest.TestCase):
         for key, value in fields.items():
             self.assertEqual(key, value.getName())
 
+    def test_result_is_a_copy(self):
+        schema = _makeSchema()
+        fields = self._callFUT(schema)
+        del fields['title']
+        fields['extra'] = None
+        self.assertEqual(sorted(self._callFUT(schema)),
+                         ['description', 'spam', 'title'])
+
 
 class Test_getFieldsInOrder(unittest.TestCase):
 
@@ -106,6 +114,19 @@ class Test_getFieldsInOrder(unittest.TestCase):
         for key, value in fields:
             self.assertEqual(key, value.getName())
 
+    def test_result_is_a_copy(self):
+        schema = _makeSchema()
+        fields = self._callFUT(schema)
+        del fields[0]
+        self.assertEqual([name for name, field in self._callFUT(schema)],
+                         ['title', 'description', 'spam'])
+
+    def test_custom_key(self):
+        from zope.schema import getFieldsInOrder
+        fields = getFieldsInOrder(_makeSchema(), lambda item: item[0])
+        self.assertEqual([name for name, field in fields],
+                         ['description', 'spam', 'title'])
+
 
 class Test_getFieldNames(unittest.TestCase):
 
@@ -143,6 +164,134 @@ class Test_getFieldNamesInOrder(unittest.TestCase):
         names = self._callFUT(_makeDerivedSchema())
         self.assertEqual(names, ['title', 'description', 'spam', 'foo'])
 
+    def test_result_is_a_copy(self):
+        schema = _makeSchema()
+        names = self._callFUT(schema)
+        names.append('extra')
+        names.reverse()
+        self.assertEqual(self._callFUT(schema),
+                         ['title', 'description', 'spam'])
+
+    def test_follows_changed_bases(self):
+        from zope.interface import Interface
+
+        from zope.schema import Text
+
+        class IBase(Interface):
+            base = Text()
+
+        class ISchema(Interface):
+            own = Text()
+
+        self.assertEqual(self._callFUT(ISchema), ['own'])
+        ISchema.__bases__ = (IBase,)
+        self.assertEqual(self._callFUT(ISchema), ['base', 'own'])
+
+
+class Test_compileSchema(unittest.TestCase):
+
+    def _callFUT(self, schema):
+        from zope.schema import compileSchema
+        return compileSchema(schema)
+
+    def test_fields_only(self):
+        from zope.interface import Attribute
+        from zope.interface import Interface
+
+        from zope.schema import Text
+
+        class ISchema(Interface):
+            foo = Text()
+            attr = Attribute('ignored')
+
+            def method():
+                "Ignored."
+            bar = Text()
+
+        plan = self._callFUT(ISchema)
+        self.assertIs(plan.schema, ISchema)
+        self.assertIsInstance(plan.fields, tuple)
+        self.assertEqual(plan.fields_in_order,
+                         (('foo', ISchema['foo']), ('bar', ISchema['bar'])))
+        self.assertEqual(plan.field_names_in_order, ('foo', 'bar'))
+        self.assertEqual(sorted(name for name, field in plan.fields),
+                         ['bar', 'foo'])
+        for name, field in plan.fields:
+            self.assertIs(field, ISchema[name])
+        self.assertIn('2 fields', repr(plan))
+
+    def test_derived(self):
+        schema = _makeDerivedSchema()
+        plan = self._callFUT(schema)
+        self.assertEqual(sorted(name for name, field in plan.fields),
+                         ['description', 'foo', 'spam', 'title'])
+
+    def test_cached(self):
+        schema = _makeSchema()
+        self.assertIs(self._callFUT(schema), self._callFUT(schema))
+
+    def test_stale_plan_keeps_current_plan(self):
+        schema = _makeSchema()
+        stale = self._callFUT(schema)
+        del schema._v_schema_validation_plan
+        plan = self._callFUT(schema)
+        stale.changed(schema)
+        self.assertIs(self._callFUT(schema), plan)
+
+    def test_distinct_for_equal_interfaces(self):
+        # Interfaces compare equal by name and module; the plan
+        # must still belong to each interface object.
+        first = _makeSchema()
+        second = _makeDerivedSchema()
+        second.__name__ = first.__name__
+        self.assertEqual(len(self._callFUT(first).fields), 3)
+        self.assertEqual(len(self._callFUT(second).fields), 4)
+
+    def test_invalidated_when_bases_change(self):
+        from zope.interface import Interface
+
+        from zope.schema import Text
+
+        class IBase(Interface):
+            base = Text()
+
+        class IOther(Interface):
+            other = Text()
+
+        class ISchema(IBase):
+            own = Text()
+
+        plan = self._callFUT(ISchema)
+        self.assertEqual(sorted(name for name, field in plan.fields),
+                         ['base', 'own'])
+
+        ISchema.__bases__ = (IOther,)
+        new_plan = self._callFUT(ISchema)
+        self.assertIsNot(new_plan, plan)
+        self.assertEqual(sorted(name for name, field in new_plan.fields),
+                         ['other', 'own'])
+
+    def test_invalidated_when_base_of_base_changes(self):
+        from zope.interface import Interface
+
+        from zope.schema import Text
+
+        class IRoot(Interface):
+            root = Text()
+
+        class IBase(Interface):
+            pass
+
+        class ISchema(IBase):
+            pass
+
+        plan = self._callFUT(ISchema)
+        self.assertEqual(plan.fields, ())
+        IBase.__bases__ = (IRoot,)
+        self.assertEqual([name for name, field
+                          in self._callFUT(ISchema).fields],
+                         ['root'])
+
 
 class Test_getValidationErrors(unittest.TestCase):
 
@@ -106,6 +106,93 @@ class SimpleTermTests(unittest.TestCase):
         self.assertEqual(term, term2)
         self.assertEqual(hash(term), hash(term2))
 
+    def test_titled_class(self):
+        from zope.interface import directlyProvidedBy
+
+        from zope.schema.vocabulary import TitledSimpleTerm
+        self.assertIs(type(self._makeOne('value')), self._getTargetClass())
+        for term in (self._makeOne('value', 'token', 'title'),
+                     self._makeOne('value', title='title')):
+            self.assertIsInstance(term, TitledSimpleTerm)
+            self.assertEqual(list(directlyProvidedBy(term)), [])
+            self.assertEqual(term.title, 'title')
+
+    def test_slots(self):
+        term = self._makeOne('value', 'token', 'title')
+        self.assertNotIn('value', term.__dict__)
+        self.assertNotIn('title', term.__dict__)
+        # Other attributes are still possible.
+        term.description = 'description'
+        self.assertEqual(term.description, 'description')
+
+    def test_subclass_w_title(self):
+        from zope.interface import directlyProvidedBy
+
+        from zope.schema.interfaces import ITitledTokenizedTerm
+
+        class Term(self._getTargetClass()):
+            pass
+        term = Term('value', title='title')
+        self.assertIs(type(term), Term)
+        self.assertTrue(ITitledTokenizedTerm.providedBy(term))
+        self.assertEqual(list(directlyProvidedBy(term)),
+                         [ITitledTokenizedTerm])
+
+    def test_directly_provided_interfaces(self):
+        from zope.interface import Interface
+        from zope.interface import alsoProvides
+
+        class IExtra(Interface):
+            pass
+        term = self._makeOne('value', 'token', 'title')
+        alsoProvides(term, IExtra)
+        self.assertTrue(IExtra.providedBy(term))
+
+    def test_pickle_and_copy(self):
+        import copy
+        import pickle
+
+        from zope.interface import alsoProvides
+
+        from zope.schema.interfaces import ISource as IExtra
+        from zope.schema.interfaces import ITitledTokenizedTerm
+
+        untitled = self._makeOne('value')
+        titled = self._makeOne('value', 'token', 'title')
+        extra = self._makeOne('value', 'token')
+        alsoProvides(extra, IExtra)
+        for term in (untitled, titled, extra):
+            copies = [copy.copy(term), copy.deepcopy(term)]
+            copies.extend(
+                pickle.loads(pickle.dumps(term, protocol))
+                for protocol in range(pickle.HIGHEST_PROTOCOL + 1))
+            for clone in copies:
+                self.assertIs(type(clone), type(term))
+                self.assertEqual(clone, term)
+                self.assertEqual(
+                    ITitledTokenizedTerm.providedBy(clone),
+                    ITitledTokenizedTerm.providedBy(term))
+                self.assertEqual(IExtra.providedBy(clone),
+                                 IExtra.providedBy(term))
+
+    def test_unpickle_instance_dict_state(self):
+        # The state of terms pickled before SimpleTerm used __slots__.
+        import pickle
+
+        from zope.schema.interfaces import ITitledTokenizedTerm
+        data = (
+            b'\x80\x02czope.schema.vocabulary\nSimpleTerm\nq\x00)\x81q'
+            b'\x01}q\x02(X\x05\x00\x00\x00valueq\x03K\x01X\x05\x00\x00'
+            b'\x00tokenq\x04X\x03\x00\x00\x00oneq\x05X\x05\x00\x00\x00'
+            b'titleq\x06X\x03\x00\x00\x00Oneq\x07X\x0c\x00\x00\x00'
+            b'__provides__q\x08czope.interface.declarations\nProvides\nq'
+            b'\th\x00czope.schema.interfaces\nITitledTokenizedTerm\nq\n'
+            b'\x86q\x0bRq\x0cub.'
+        )
+        term = pickle.loads(data)
+        self.assertEqual(term, self._makeOne(1, 'one', 'One'))
+        self.assertTrue(ITitledTokenizedTerm.providedBy(term))
+
 
 class SimpleVocabularyTests(unittest.TestCase):
 
@@ -307,6 +394,548 @@ class SimpleVocabularyTests(unittest.TestCase):
         self.assertEqual(hash(vocabulary), hash(vocabulary2))
 
 
+class ColumnarVocabularyTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema.vocabulary import ColumnarVocabulary
+        return ColumnarVocabulary
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_class_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyClass(IVocabularyTokenized, self._getTargetClass())
+
+    def test_instance_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyObject
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyObject(IVocabularyTokenized, self._makeOne(()))
+
+    def test_ctor_additional_interfaces(self):
+        from zope.interface import Interface
+
+        class IStupid(Interface):
+            pass
+
+        vocabulary = self._makeOne([1, 4, 2, 9], IStupid)
+        self.assertTrue(IStupid.providedBy(vocabulary))
+        self.assertEqual(len(vocabulary), 4)
+
+    def test_ctor_columns(self):
+        from zope.schema.interfaces import ITitledTokenizedTerm
+        vocabulary = self._makeOne([1, 2, 3],
+                                   tokens=['one', b'two', 'dr\xeai'],
+                                   titles=['One', None, 'Three'])
+        terms = list(vocabulary)
+        self.assertEqual([t.value for t in terms], [1, 2, 3])
+        self.assertEqual([t.token for t in terms],
+                         ['one', 'two', 'dr\\xeai'])
+        self.assertEqual([t.title for t in terms], ['One', None, 'Three'])
+        self.assertEqual([ITitledTokenizedTerm.providedBy(t) for t in terms],
+                         [True, False, True])
+
+    def test_ctor_mismatched_columns(self):
+        self.assertRaises(ValueError, self._makeOne, [1, 2], tokens=['a'])
+        self.assertRaises(ValueError, self._makeOne, [1, 2], titles=['a'])
+
+    def test_terms_match_simple_vocabulary(self):
+        from zope.schema.vocabulary import SimpleVocabulary
+        items = [('one', 1), ('two', 2, 'Two'), (b'snow\xe2', 'snow\u2603')]
+        simple = SimpleVocabulary.fromItems(items)
+        vocabulary = self._getTargetClass().fromItems(items)
+        self.assertEqual(list(vocabulary), list(simple))
+        self.assertEqual(len(vocabulary), len(simple))
+        for term in simple:
+            self.assertIn(term.value, vocabulary)
+            self.assertEqual(vocabulary.getTerm(term.value), term)
+            self.assertEqual(vocabulary.getTermByToken(term.token), term)
+        values = [1, 'a', b'b', 2.5]
+        self.assertEqual(
+            list(self._getTargetClass().fromValues(values)),
+            list(SimpleVocabulary.fromValues(values)))
+
+    def test_fromItems_pairs_have_no_titles(self):
+        vocabulary = self._getTargetClass().fromItems([('one', 1)])
+        self.assertIsNone(vocabulary._titles)
+
+    def test_getTerm_miss(self):
+        vocabulary = self._makeOne(())
+        self.assertRaises(LookupError, vocabulary.getTerm, 'nonesuch')
+        self.assertRaises(LookupError, vocabulary.getTerm, [])
+        self.assertNotIn([], vocabulary)
+
+    def test_getTermByToken_miss(self):
+        vocabulary = self._makeOne(())
+        self.assertRaises(LookupError, vocabulary.getTermByToken, 'nonesuch')
+        self.assertRaises(LookupError, vocabulary.getTermByToken, [])
+
+    def test_nonunique_token_message(self):
+        with self.assertRaises(ValueError) as exc:
+            self._getTargetClass().fromValues([2, '2'])
+        self.assertEqual(str(exc.exception),
+                         "term tokens must be unique: '2'")
+
+    def test_nonunique_value_message(self):
+        with self.assertRaises(ValueError) as exc:
+            self._getTargetClass().fromItems([(0, 'one'), (1, 'one')])
+        self.assertEqual(str(exc.exception),
+                         "term values must be unique: 'one'")
+
+    def test_nonunique_swallow(self):
+        vocabulary = self._makeOne(['one', 'one'], tokens=[0, 1],
+                                   swallow_duplicates=True)
+        self.assertEqual(vocabulary.getTerm('one').token, '1')
+        self.assertEqual(len(vocabulary), 1)
+        self.assertEqual(len(list(vocabulary)), 2)
+
+    def test_choice(self):
+        from zope.schema import Choice
+        from zope.schema.interfaces import ConstraintNotSatisfied
+        choice = Choice(vocabulary=self._getTargetClass().fromValues([1, 2]))
+        choice.validate(1)
+        self.assertRaises(ConstraintNotSatisfied, choice.validate, 3)
+
+    def test__eq__and__hash__(self):
+        from zope import interface
+
+        values = [1, 4, 2, 9]
+        vocabulary = self._getTargetClass().fromValues(values)
+        self.assertEqual(vocabulary, vocabulary)
+        self.assertNotEqual(vocabulary, object())
+        self.assertNotEqual(object(), vocabulary)
+
+        vocabulary2 = self._getTargetClass().fromValues(values)
+        self.assertEqual(vocabulary, vocabulary2)
+        self.assertEqual(hash(vocabulary), hash(vocabulary2))
+        self.assertNotEqual(
+            vocabulary, self._getTargetClass().fromValues(values[:-1]))
+        self.assertNotEqual(
+            vocabulary, self._makeOne(values, titles=values))
+
+        class IFoo(interface.Interface):
+            "an interface"
+
+        vocabulary = self._getTargetClass().fromValues(values, IFoo)
+        self.assertNotEqual(vocabulary, vocabulary2)
+        vocabulary2 = self._getTargetClass().fromValues(values, IFoo)
+        self.assertEqual(vocabulary, vocabulary2)
+
+
+class LazyVocabularyTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema.vocabulary import LazyVocabulary
+        return LazyVocabulary
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _makeTerms(self, values, calls):
+        from zope.schema.vocabulary import SimpleTerm
+
+        def terms():
+            calls.append(None)
+            for value in values:
+                yield SimpleTerm(value)
+        return terms
+
+    def test_class_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyClass(IVocabularyTokenized, self._getTargetClass())
+
+    def test_instance_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyObject
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyObject(IVocabularyTokenized, self._makeOne(tuple))
+
+    def test_ctor_additional_interfaces(self):
+        from zope.interface import Interface
+
+        class IStupid(Interface):
+            pass
+
+        vocabulary = self._makeOne(tuple, IStupid)
+        self.assertTrue(IStupid.providedBy(vocabulary))
+
+    def test_without_callables_enumerates_once(self):
+        calls = []
+        vocabulary = self._makeOne(self._makeTerms([1, 2, 3], calls))
+        self.assertEqual(calls, [])
+        self.assertIn(2, vocabulary)
+        self.assertNotIn(4, vocabulary)
+        self.assertNotIn([], vocabulary)
+        self.assertEqual(vocabulary.getTerm(3).token, '3')
+        self.assertEqual(vocabulary.getTermByToken('1').value, 1)
+        self.assertRaises(LookupError, vocabulary.getTerm, 4)
+        self.assertRaises(LookupError, vocabulary.getTermByToken, '4')
+        self.assertEqual(len(vocabulary), 3)
+        self.assertEqual([t.value for t in vocabulary], [1, 2, 3])
+        self.assertEqual(calls, [None])
+
+    def test_duplicate_tokens_raise_when_enumerated(self):
+        vocabulary = self._makeOne(self._makeTerms([1, '1'], []))
+        self.assertRaises(ValueError, len, vocabulary)
+
+    def test_contains_does_not_enumerate(self):
+        calls = []
+        vocabulary = self._makeOne(self._makeTerms(range(5), calls),
+                                   contains=lambda value: value in range(5))
+        self.assertIn(2, vocabulary)
+        self.assertNotIn(7, vocabulary)
+        self.assertNotIn([], vocabulary)
+        self.assertEqual(calls, [])
+        self.assertEqual(len(vocabulary), 5)
+        self.assertEqual(calls, [None])
+        # Once enumerated, the terms are used instead.
+        self.assertIn(4, vocabulary)
+        self.assertEqual(calls, [None])
+
+    def test_lookup_creates_terms_on_demand(self):
+        from zope.schema.vocabulary import SimpleTerm
+        calls = []
+        looked_up = []
+
+        def lookup(value):
+            looked_up.append(value)
+            if not isinstance(value, int):
+                raise LookupError(value)
+            return SimpleTerm(value)
+
+        vocabulary = self._makeOne(self._makeTerms([1, 2], calls),
+                                   lookup=lookup)
+        term = vocabulary.getTerm(1)
+        self.assertEqual(term.value, 1)
+        self.assertIs(vocabulary.getTerm(1), term)
+        self.assertIn(5, vocabulary)
+        self.assertNotIn('a', vocabulary)
+        self.assertNotIn([], vocabulary)
+        self.assertRaises(LookupError, vocabulary.getTerm, 'a')
+        self.assertEqual(looked_up, [1, 5, 'a', 'a'])
+        self.assertEqual(calls, [])
+        # Tokens of looked up terms are known, others need all the terms.
+        self.assertIs(vocabulary.getTermByToken('1'), term)
+        self.assertEqual(calls, [])
+        self.assertEqual(vocabulary.getTermByToken('2').value, 2)
+        self.assertEqual(calls, [None])
+
+    def test_lookup_token(self):
+        from zope.schema.vocabulary import SimpleTerm
+        calls = []
+
+        def lookup_token(token):
+            return SimpleTerm(int(token))
+
+        vocabulary = self._makeOne(self._makeTerms([1], calls),
+                                   lookup_token=lookup_token)
+        term = vocabulary.getTermByToken('3')
+        self.assertEqual(term.value, 3)
+        self.assertIs(vocabulary.getTermByToken('3'), term)
+        self.assertEqual(calls, [])
+        self.assertIs(vocabulary.getTerm(3), term)
+        self.assertEqual(calls, [])
+        # Other values need all the terms without a lookup.
+        self.assertRaises(LookupError, vocabulary.getTerm, 4)
+        self.assertEqual(calls, [None])
+
+    def test_lookup_while_enumerating(self):
+        # Another thread may enumerate the terms while a lookup is
+        # under way.
+        from zope.schema.vocabulary import SimpleTerm
+        calls = []
+
+        def lookup(value):
+            list(vocab)
+            return SimpleTerm(value)
+
+        def lookup_token(token):
+            list(vocab)
+            return SimpleTerm(int(token))
+
+        vocab = self._makeOne(self._makeTerms([1, 2], calls), lookup=lookup)
+        self.assertIn(1, vocab)
+        vocab = self._makeOne(self._makeTerms([1, 2], calls),
+                              lookup_token=lookup_token)
+        self.assertEqual(vocab.getTermByToken('2').value, 2)
+        self.assertEqual(len(calls), 2)
+
+    def test_fromValues_container(self):
+        vocabulary = self._getTargetClass().fromValues(range(10 ** 9))
+        self.assertIn(123456789, vocabulary)
+        self.assertNotIn(-1, vocabulary)
+        self.assertNotIn('a', vocabulary)
+        self.assertEqual(vocabulary.getTerm(42).token, '42')
+        self.assertRaises(LookupError, vocabulary.getTerm, -1)
+
+    def test_fromValues_iterable(self):
+        from zope.interface import Interface
+
+        class IStupid(Interface):
+            pass
+
+        vocabulary = self._getTargetClass().fromValues(
+            iter(['a', 'b']), IStupid)
+        self.assertTrue(IStupid.providedBy(vocabulary))
+        self.assertIn('b', vocabulary)
+        self.assertEqual(vocabulary.getTermByToken('a').value, 'a')
+        self.assertEqual([t.value for t in vocabulary], ['a', 'b'])
+
+    def test_choice_validation(self):
+        from zope.schema import Choice
+        from zope.schema.interfaces import ConstraintNotSatisfied
+        choice = Choice(
+            vocabulary=self._getTargetClass().fromValues(range(100)))
+        choice.validate(42)
+        self.assertRaises(ConstraintNotSatisfied, choice.validate, 100)
+
+
+class SearchableVocabularyTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema.vocabulary import SearchableVocabulary
+        return SearchableVocabulary
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _makeCities(self):
+        return self._getTargetClass().fromItems([
+            ('nyc', 1, 'New York'),
+            ('york', 2, 'York'),
+            ('newark', 3, 'Newark'),
+            ('paris', 4, 'Paris'),
+            ('stras', 5, '\xc9tang-sur-Arroux'),
+            ('ber', 6),
+        ])
+
+    def test_class_conforms_to_ISearchableVocabulary(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import ISearchableVocabulary
+        from zope.schema.interfaces import ISourceQueriables
+        verifyClass(ISearchableVocabulary, self._getTargetClass())
+        verifyClass(ISourceQueriables, self._getTargetClass())
+
+    def test_instance_conforms_to_ISearchableVocabulary(self):
+        from zope.interface.verify import verifyObject
+
+        from zope.schema.interfaces import ISearchableVocabulary
+        verifyObject(ISearchableVocabulary, self._makeOne(()))
+
+    def test_search_empty(self):
+        self.assertEqual(self._makeOne(()).search('a'), [])
+
+    def test_search_title_prefix_ignores_case(self):
+        vocabulary = self._makeCities()
+        self.assertEqual([t.value for t in vocabulary.search('NEW')],
+                         [1, 3])
+        self.assertEqual([t.value for t in vocabulary.search('new y')],
+                         [1])
+
+    def test_search_title_words(self):
+        vocabulary = self._makeCities()
+        self.assertEqual([t.value for t in vocabulary.search('york')],
+                         [1, 2])
+        self.assertEqual([t.value for t in vocabulary.search('arr')], [5])
+        self.assertEqual([t.value for t in vocabulary.search('\xe9tang')],
+                         [5])
+
+    def test_search_tokens(self):
+        vocabulary = self._makeCities()
+        self.assertEqual([t.value for t in vocabulary.search('Be')], [6])
+        self.assertEqual([t.value for t in vocabulary.search('ny')], [1])
+        self.assertEqual(vocabulary.search('z'), [])
+
+    def test_search_limit(self):
+        vocabulary = self._makeCities()
+        self.assertEqual(len(vocabulary.search('', limit=4)), 4)
+        self.assertEqual(len(vocabulary.search('')), 6)
+        self.assertEqual(vocabulary.search('new', limit=0), [])
+        self.assertEqual([t.value for t in vocabulary.search('n', limit=2)],
+                         [1, 3])
+
+    def test_getQueriables(self):
+        vocabulary = self._makeCities()
+        self.assertEqual(vocabulary.getQueriables(), (('', vocabulary),))
+
+    def test_tree_vocabulary_searches_nested_terms(self):
+        from zope.schema.vocabulary import SearchableTreeVocabulary
+        vocabulary = SearchableTreeVocabulary.fromDict({
+            ('eu', 'eu', 'Europe'): {
+                ('at', 'at', 'Austria'): {
+                    ('tyr', 'tyr', 'Tyrol'): {},
+                },
+            },
+            ('as', 'as', 'Asia'): {},
+        })
+        self.assertEqual([t.value for t in vocabulary.search('t')],
+                         ['tyr'])
+        self.assertEqual([t.value for t in vocabulary.search('a')],
+                         ['as', 'at'])
+
+
+class MappedVocabularyTests(unittest.TestCase):
+
+    ITEMS = [
+        ('one', 1),
+        ('two', 'deux', 'Two'),
+        ('snow', 'snow\u2603', 'Snowman \u2603'),
+        (b'bytes\xff', b'\xff'),
+        (-3, -3, None),
+    ]
+
+    def setUp(self):
+        import shutil
+        import tempfile
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = self._path('vocab')
+
+    def _path(self, name):
+        import os
+        return os.path.join(self.directory, name)
+
+    def _getTargetClass(self):
+        from zope.schema.vocabulary import MappedVocabulary
+        return MappedVocabulary
+
+    def _makeOne(self, items=None, *interfaces):
+        vocabulary = self._getTargetClass().fromItems(
+            self.ITEMS if items is None else items, self.path, *interfaces)
+        self.addCleanup(vocabulary.close)
+        return vocabulary
+
+    def _makeSimple(self, items):
+        from zope.schema.vocabulary import SimpleVocabulary
+        return SimpleVocabulary.fromItems(items)
+
+    def test_class_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyFactory
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyClass(IVocabularyTokenized, self._getTargetClass())
+        verifyClass(IVocabularyFactory, self._getTargetClass())
+
+    def test_instance_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyObject
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyObject(IVocabularyTokenized, self._makeOne())
+
+    def test_terms_match_simple_vocabulary(self):
+        vocabulary = self._makeOne()
+        simple = self._makeSimple(self.ITEMS)
+        self.assertEqual(len(vocabulary), len(simple))
+        self.assertEqual(list(vocabulary), list(simple))
+        for term in simple:
+            self.assertIn(term.value, vocabulary)
+            self.assertEqual(vocabulary.getTerm(term.value), term)
+            self.assertEqual(vocabulary.getTermByToken(term.token), term)
+
+    def test_fromValues(self):
+        vocabulary = self._getTargetClass().fromValues([1, 'b'], self.path)
+        self.addCleanup(vocabulary.close)
+        self.assertEqual(list(vocabulary),
+                         list(self._makeSimple([(1, 1), ('b', 'b')])))
+
+    def test_empty(self):
+        vocabulary = self._makeOne([])
+        self.assertEqual(len(vocabulary), 0)
+        self.assertEqual(list(vocabulary), [])
+        self.assertNotIn('a', vocabulary)
+        self.assertRaises(LookupError, vocabulary.getTermByToken, 'a')
+
+    def test_misses(self):
+        vocabulary = self._makeOne()
+        for value in ('nonesuch', 2, 1.0, True, None, [], b'\xfe'):
+            self.assertNotIn(value, vocabulary)
+            self.assertRaises(LookupError, vocabulary.getTerm, value)
+        for token in ('nonesuch', 'snow\u2603', b'one', None, 'zzz', ''):
+            self.assertRaises(LookupError, vocabulary.getTermByToken, token)
+
+    def test_unsupported_values(self):
+        for items in ([('a', 1.5)], [('a', None)], [('a', 1, b'title')]):
+            self.assertRaises(TypeError, self._makeOne, items)
+
+    def test_nonunique(self):
+        with self.assertRaises(ValueError) as exc:
+            self._makeOne([('a', 1), ('b', 1)])
+        self.assertEqual(str(exc.exception),
+                         'term values must be unique: 1')
+        with self.assertRaises(ValueError) as exc:
+            self._makeOne([(1, 1), ('1', '1')])
+        self.assertEqual(str(exc.exception),
+                         "term tokens must be unique: '1'")
+
+    def test_reopen(self):
+        self._makeOne(None)
+        vocabulary = self._getTargetClass()(self.path)
+        self.addCleanup(vocabulary.close)
+        self.assertEqual(list(vocabulary),
+                         list(self._makeSimple(self.ITEMS)))
+
+    def test_replace_keeps_open_vocabulary(self):
+        old = self._makeOne()
+        new = self._makeOne([('a', 'A')])
+        self.assertEqual(len(old), len(self.ITEMS))
+        self.assertIn(1, old)
+        self.assertEqual([term.value for term in new], ['A'])
+
+    def test_file_mode_follows_umask(self):
+        import os
+        import stat
+        for umask, mode in ((0o022, 0o644), (0o077, 0o600)):
+            old = os.umask(umask)
+            try:
+                self._makeOne()
+            finally:
+                os.umask(old)
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), mode)
+
+    def test_failed_write_leaves_no_file(self):
+        import os
+        os.mkdir(self.path)
+        self.assertRaises(OSError, self._makeOne)
+        self.assertEqual(os.listdir(self.directory), ['vocab'])
+
+    def test_not_a_vocabulary_file(self):
+        path = self._path('other')
+        for data in (b'x', b'ZSVOCAB1' + b'?' * 16):
+            with open(path, 'wb') as f:
+                f.write(data)
+            self.assertRaises(ValueError, self._getTargetClass(), path)
+
+    def test_interfaces(self):
+        from zope.interface import Interface
+
+        class IStupid(Interface):
+            pass
+        self.assertTrue(IStupid.providedBy(self._makeOne(None, IStupid)))
+
+    def test_registry_and_choice(self):
+        from zope.schema import Choice
+        from zope.schema.interfaces import ConstraintNotSatisfied
+        from zope.schema.vocabulary import VocabularyRegistry
+        from zope.schema.vocabulary import _clear
+        from zope.schema.vocabulary import setVocabularyRegistry
+        vocabulary = self._makeOne()
+        registry = VocabularyRegistry()
+        registry.register('mapped', vocabulary)
+        setVocabularyRegistry(registry)
+        self.addCleanup(_clear)
+        self.assertIs(registry.get(object(), 'mapped'), vocabulary)
+        choice = Choice(vocabulary='mapped')
+        choice.validate('deux')
+        self.assertRaises(ConstraintNotSatisfied, choice.validate, 'two')
+
+
 # Test _createTermTree via TreeVocabulary.fromDict
 
 
@@ -519,6 +1148,294 @@ class TreeVocabularyTests(unittest.TestCase):
             ]
         )
 
+    def _assertIndexesConsistent(self, vocab):
+        rebuilt = self._getTargetClass()(vocab)
+        self.assertEqual(vocab.term_by_value, rebuilt.term_by_value)
+        self.assertEqual(vocab.term_by_token, rebuilt.term_by_token)
+        self.assertEqual(vocab.path_by_value, rebuilt.path_by_value)
+
+    def test_addTerm(self):
+        from zope.schema.vocabulary import SimpleTerm
+        vocab = self.tree_vocab_3()
+        self.assertEqual(vocab.version, 0)
+        vocab.addTerm('security', SimpleTerm('firewall', 'fw'))
+        self.assertEqual(vocab.version, 1)
+        self.assertEqual(vocab.getTermPath('firewall'),
+                         ['infrastructure', 'security', 'firewall'])
+        self.assertEqual(vocab.getTermByToken('fw').value, 'firewall')
+        vocab.addTerm(vocab.ROOT, SimpleTerm('sales'))
+        self.assertEqual(vocab.getTermPath('sales'), ['sales'])
+        self.assertEqual([term.value for term in vocab][-1], 'sales')
+        self.assertEqual(vocab.version, 2)
+        self._assertIndexesConsistent(vocab)
+
+    def test_addTerm_errors(self):
+        from zope.schema.vocabulary import SimpleTerm
+        vocab = self.tree_vocab_3()
+        self.assertRaises(LookupError, vocab.addTerm,
+                          'missing', SimpleTerm('new'))
+        self.assertRaises(ValueError, vocab.addTerm,
+                          'security', SimpleTerm('database', 'new'))
+        self.assertRaises(ValueError, vocab.addTerm,
+                          'security', SimpleTerm('new', 'database'))
+        self.assertEqual(vocab.version, 0)
+        self.assertNotIn('new', vocab)
+        self._assertIndexesConsistent(vocab)
+
+    def test_removeTerm(self):
+        vocab = self.tree_vocab_3()
+        vocab.removeTerm('reservations')
+        self.assertEqual(vocab.version, 1)
+        for value in ('reservations', 'res_host', 'res_gui'):
+            self.assertNotIn(value, vocab)
+            self.assertEqual(vocab.getTermPath(value), [])
+            self.assertRaises(LookupError, vocab.getTermByToken, value)
+        self.assertIn('check_in', vocab)
+        vocab.removeTerm('infrastructure')
+        self.assertEqual([term.value for term in vocab], ['services'])
+        self._assertIndexesConsistent(vocab)
+        self.assertRaises(LookupError, vocab.removeTerm, 'infrastructure')
+        self.assertEqual(vocab.version, 2)
+
+    def test_moveTerm(self):
+        vocab = self.tree_vocab_3()
+        vocab.moveTerm('data_transaction', 'services')
+        self.assertEqual(vocab.version, 1)
+        self.assertEqual(vocab.getTermPath('database'),
+                         ['services', 'data_transaction', 'database'])
+        self.assertEqual(
+            [term.value for term in vocab[vocab.getTerm('services')]],
+            ['check_in', 'reservations', 'data_transaction'])
+        self._assertIndexesConsistent(vocab)
+        vocab.moveTerm('check_in', vocab.ROOT)
+        self.assertEqual(vocab.getTermPath('dcs_host'),
+                         ['check_in', 'dcs_host'])
+        self.assertEqual([term.value for term in vocab],
+                         ['infrastructure', 'services', 'check_in'])
+        self._assertIndexesConsistent(vocab)
+
+    def test_moveTerm_errors(self):
+        vocab = self.tree_vocab_3()
+        self.assertRaises(LookupError, vocab.moveTerm, 'missing',
+                          vocab.ROOT)
+        self.assertRaises(LookupError, vocab.moveTerm, 'security', 'missing')
+        self.assertRaises(ValueError, vocab.moveTerm, 'services', 'services')
+        self.assertRaises(ValueError, vocab.moveTerm,
+                          'services', 'res_host')
+        self.assertEqual(vocab.version, 0)
+        self._assertIndexesConsistent(vocab)
+
+    def test_search_index_follows_changes(self):
+        from zope.schema.vocabulary import SearchableTreeVocabulary
+        from zope.schema.vocabulary import SimpleTerm
+        vocab = SearchableTreeVocabulary.fromDict(self.business_tree())
+        self.assertEqual(vocab.search('fire'), [])
+        vocab.addTerm('security', SimpleTerm('firewall', title='Firewall'))
+        self.assertEqual([t.value for t in vocab.search('fire')],
+                         ['firewall'])
+        vocab.removeTerm('security')
+        self.assertEqual(vocab.search('fire'), [])
+
+    def test_search_index_built_during_change_is_stale(self):
+        # The index is published with the version seen before it was
+        # built, so a change made meanwhile causes it to be rebuilt.
+        from zope.schema.vocabulary import SearchableTreeVocabulary
+        from zope.schema.vocabulary import SimpleTerm
+
+        class Changing(SearchableTreeVocabulary):
+            def _searchTerms(self):
+                terms = list(super()._searchTerms())
+                if 'firewall' not in self:
+                    self.addTerm('security',
+                                 SimpleTerm('firewall', title='Firewall'))
+                return iter(terms)
+
+        vocab = Changing.fromDict(self.business_tree())
+        self.assertEqual(vocab.search('fire'), [])
+        self.assertEqual(vocab._search_index[0], vocab.version - 1)
+        self.assertEqual([t.value for t in vocab.search('fire')],
+                         ['firewall'])
+        self.assertEqual(vocab._search_index[0], vocab.version)
+
+    def test_parent_by_value(self):
+        vocab = self.tree_vocab_2()
+        self.assertEqual(vocab.parent_by_value, {
+            'Regions': vocab.ROOT,
+            'Austria': 'Regions',
+            'Tyrol': 'Austria',
+            'Ausserfern': 'Tyrol',
+            'Germany': 'Regions',
+            'Bavaria': 'Germany',
+        })
+
+    def test_None_valued_parent(self):
+        import pickle
+
+        from zope.schema.vocabulary import SimpleTerm
+        vocab = self._getTargetClass().fromDict(
+            {('n', None): {('c', 'c'): {}}})
+        self.assertEqual(vocab.parent_by_value, {None: vocab.ROOT,
+                                                 'c': None})
+        self.assertEqual(vocab.getTermPath('c'), [None, 'c'])
+        self.assertEqual(vocab.path_by_value['c'], [None, 'c'])
+        self.assertEqual(vocab.getTermPath(None), [None])
+        vocab.addTerm(None, SimpleTerm('d'))
+        self.assertEqual(vocab.getTermPath('d'), [None, 'd'])
+        vocab.addTerm(vocab.ROOT, SimpleTerm('e'))
+        vocab.moveTerm('e', None)
+        self.assertEqual(vocab.getTermPath('e'), [None, 'e'])
+        vocab.moveTerm('c', 'd')
+        self.assertEqual(vocab.getTermPath('c'), [None, 'd', 'c'])
+        vocab.removeTerm('d')
+        self.assertEqual(vocab.path_by_value, {None: [None],
+                                               'e': [None, 'e']})
+        clone = pickle.loads(pickle.dumps(vocab))
+        self.assertIs(clone.parent_by_value[None], vocab.ROOT)
+        self.assertEqual(repr(vocab.ROOT), 'ROOT')
+        self.assertEqual(clone.getTermPath('e'), [None, 'e'])
+
+    def test_path_by_value_is_read_only_view(self):
+        vocab = self.tree_vocab_2()
+        paths = vocab.path_by_value
+        self.assertEqual(len(paths), 6)
+        self.assertIn('Tyrol', paths)
+        self.assertNotIn('Vienna', paths)
+        self.assertNotIn([], paths)
+        self.assertEqual(paths['Tyrol'], ['Regions', 'Austria', 'Tyrol'])
+        self.assertRaises(KeyError, paths.__getitem__, 'Vienna')
+        with self.assertRaises(TypeError):
+            paths['Vienna'] = []
+
+    def test_getTermPath_returns_new_lists(self):
+        vocab = self.tree_vocab_2()
+        path = vocab.getTermPath('Bavaria')
+        path.append('Munich')
+        self.assertEqual(vocab.getTermPath('Bavaria'),
+                         ['Regions', 'Germany', 'Bavaria'])
+        self.assertEqual(vocab.getTermPath([]), [])
+
+    def test_path_cache(self):
+        vocab = self.tree_vocab_3()
+        vocab.path_cache_size = 2
+        vocab.getTermPath('database')
+        vocab.getTermPath('security')
+        vocab.getTermPath('database')
+        vocab.getTermPath('messaging')
+        self.assertEqual(list(vocab._path_cache), ['database', 'messaging'])
+        self.assertEqual(vocab._path_cache['database'],
+                         ('infrastructure', 'data_transaction', 'database'))
+        # Changes discard the cached paths.
+        vocab.moveTerm('data_transaction', 'services')
+        self.assertEqual(list(vocab._path_cache), [])
+        self.assertEqual(vocab.getTermPath('database'),
+                         ['services', 'data_transaction', 'database'])
+
+    def test_path_cache_disabled(self):
+        vocab = self.tree_vocab_3()
+        vocab.path_cache_size = 0
+        self.assertEqual(vocab.getTermPath('database'),
+                         ['infrastructure', 'data_transaction', 'database'])
+        self.assertEqual(len(vocab._path_cache), 0)
+
+    def test_pickle(self):
+        import pickle
+        vocab = self.tree_vocab_3()
+        vocab.getTermPath('database')
+        copy = pickle.loads(pickle.dumps(vocab))
+        self.assertEqual(copy.parent_by_value, vocab.parent_by_value)
+        self.assertEqual(copy.getTermPath('res_gui'),
+                         ['services', 'reservations', 'res_gui'])
+
+    def test_unpickle_path_by_value_state(self):
+        # The state of vocabularies pickled before parent_by_value was
+        # added: the tree {('a', 'A'): {('b', 'B'): {}}}.
+        import pickle
+
+        from zope.schema.vocabulary import SimpleTerm
+        data = (
+            b'\x80\x02czope.schema.vocabulary\nTreeVocabulary\nq\x00)\x81'
+            b'q\x01}q\x02(X\x06\x00\x00\x00_termsq\x03ccollections\n'
+            b'OrderedDict\nq\x04)Rq\x05czope.schema.vocabulary\nSimpleTerm'
+            b'\nq\x06)\x81q\x07}q\x08(X\x05\x00\x00\x00valueq\tX\x01\x00'
+            b'\x00\x00Aq\nX\x05\x00\x00\x00tokenq\x0bX\x01\x00\x00\x00aq'
+            b'\x0cX\x05\x00\x00\x00titleq\rNubh\x04)Rq\x0eh\x06)\x81q\x0f}'
+            b'q\x10(h\tX\x01\x00\x00\x00Bq\x11h\x0bX\x01\x00\x00\x00bq\x12'
+            b'h\rNubh\x04)Rq\x13ssX\r\x00\x00\x00path_by_valueq\x14}q\x15('
+            b'h\n]q\x16h\nah\x11]q\x17(h\nh\x11euX\r\x00\x00\x00term_by_'
+            b'valueq\x18}q\x19(h\nh\x07h\x11h\x0fuX\r\x00\x00\x00term_by_'
+            b'tokenq\x1a}q\x1b(h\x0ch\x07h\x12h\x0fuub.'
+        )
+        vocab = pickle.loads(data)
+        self.assertNotIn('path_by_value', vocab.__dict__)
+        self.assertEqual(vocab.parent_by_value, {'A': vocab.ROOT, 'B': 'A'})
+        self.assertEqual(vocab.getTermPath('B'), ['A', 'B'])
+        self.assertEqual(vocab.path_by_value['B'], ['A', 'B'])
+        self.assertEqual(vocab.getTermByToken('b').value, 'B')
+        vocab.addTerm('B', SimpleTerm('C'))
+        self.assertEqual(vocab.getTermPath('C'), ['A', 'B', 'C'])
+
+    def test_isDescendant(self):
+        vocab = self.tree_vocab_3()
+        self.assertTrue(vocab.isDescendant('database', 'infrastructure'))
+        self.assertTrue(vocab.isDescendant('database', 'data_transaction'))
+        self.assertTrue(vocab.isDescendant('security', 'infrastructure'))
+        self.assertFalse(vocab.isDescendant('database', 'database'))
+        self.assertFalse(vocab.isDescendant('infrastructure', 'database'))
+        self.assertFalse(vocab.isDescendant('database', 'services'))
+        self.assertFalse(vocab.isDescendant('messaging', 'data_transaction'))
+        self.assertFalse(vocab.isDescendant('missing', 'services'))
+        self.assertFalse(vocab.isDescendant('database', 'missing'))
+        self.assertFalse(vocab.isDescendant([], 'services'))
+
+    def test_getDescendants(self):
+        vocab = self.tree_vocab_3()
+        self.assertEqual(vocab.getDescendants('services'),
+                         ['check_in', 'dcs_host',
+                          'reservations', 'res_gui', 'res_host'])
+        self.assertEqual(vocab.getDescendants('security'), [])
+        self.assertRaises(LookupError, vocab.getDescendants, 'missing')
+
+    def test_getDepth(self):
+        vocab = self.tree_vocab_3()
+        self.assertEqual(vocab.getDepth('services'), 0)
+        self.assertEqual(vocab.getDepth('reservations'), 1)
+        self.assertEqual(vocab.getDepth('res_gui'), 2)
+        self.assertRaises(LookupError, vocab.getDepth, 'missing')
+
+    def test_intervals_follow_changes(self):
+        from zope.schema.vocabulary import SimpleTerm
+        vocab = self.tree_vocab_3()
+        self.assertFalse(vocab.isDescendant('database', 'services'))
+        vocab.moveTerm('data_transaction', 'check_in')
+        self.assertTrue(vocab.isDescendant('database', 'services'))
+        self.assertEqual(vocab.getDepth('database'), 3)
+        vocab.addTerm('database', SimpleTerm('sql'))
+        self.assertEqual(vocab.getDescendants('check_in'),
+                         ['dcs_host', 'data_transaction', 'database', 'sql'])
+        vocab.removeTerm('check_in')
+        self.assertFalse(vocab.isDescendant('sql', 'services'))
+        self.assertRaises(LookupError, vocab.getDepth, 'sql')
+
+    def test_deep_tree(self):
+        import sys
+        depth = sys.getrecursionlimit() * 2
+        dict_ = {}
+        branch = dict_
+        for i in range(depth):
+            branch[(str(i), i)] = branch = {}
+        vocab = self._getTargetClass().fromDict(dict_)
+        self.assertEqual(len(vocab.term_by_value), depth)
+        self.assertEqual(vocab.getTermPath(depth - 1), list(range(depth)))
+        self.assertEqual(vocab.getTermPath(2), [0, 1, 2])
+        self.assertEqual(vocab.getDepth(depth - 1), depth - 1)
+        self.assertTrue(vocab.isDescendant(depth - 1, 0))
+
+    def test_paths_match_tree_search(self):
+        vocab = self.tree_vocab_3()
+        for value in vocab.term_by_value:
+            self.assertEqual(vocab.getTermPath(value),
+                             vocab._getPathToTreeNode(vocab, value))
+
     def test_termpath(self):
         tv2 = self.tree_vocab_2()
         tv3 = self.tree_vocab_3()
@@ -686,6 +1603,90 @@ class TreeVocabularyTests(unittest.TestCase):
         self.assertEqual(term_path, [])
 
 
+class SubtreeVocabularyTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.schema.vocabulary import SubtreeVocabulary
+        return SubtreeVocabulary
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _makeTree(self):
+        from zope.schema.vocabulary import TreeVocabulary
+        return TreeVocabulary.fromDict({
+            ('eu', 'eu', 'Europe'): {
+                ('at', 'at', 'Austria'): {
+                    ('tyr', 'tyr', 'Tyrol'): {},
+                },
+                ('de', 'de', 'Germany'): {},
+            },
+            ('as', 'as', 'Asia'): {},
+        })
+
+    def test_class_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyClass(IVocabularyTokenized, self._getTargetClass())
+
+    def test_instance_conforms_to_IVocabularyTokenized(self):
+        from zope.interface.verify import verifyObject
+
+        from zope.schema.interfaces import IVocabularyTokenized
+        verifyObject(IVocabularyTokenized,
+                     self._makeOne(self._makeTree(), 'eu'))
+
+    def test_ctor_additional_interfaces(self):
+        from zope.interface import Interface
+
+        class IStupid(Interface):
+            pass
+
+        vocabulary = self._makeOne(self._makeTree(), 'eu', IStupid)
+        self.assertTrue(IStupid.providedBy(vocabulary))
+
+    def test_inclusive(self):
+        vocabulary = self._makeOne(self._makeTree(), 'eu')
+        for value in ('eu', 'at', 'tyr', 'de'):
+            self.assertIn(value, vocabulary)
+        self.assertNotIn('as', vocabulary)
+        self.assertNotIn('missing', vocabulary)
+        self.assertNotIn([], vocabulary)
+        self.assertEqual([t.value for t in vocabulary],
+                         ['eu', 'at', 'tyr', 'de'])
+        self.assertEqual(len(vocabulary), 4)
+        self.assertEqual(vocabulary.getTerm('tyr').title, 'Tyrol')
+        self.assertEqual(vocabulary.getTermByToken('eu').value, 'eu')
+        self.assertRaises(LookupError, vocabulary.getTerm, 'as')
+        self.assertRaises(LookupError, vocabulary.getTermByToken, 'as')
+        self.assertRaises(LookupError, vocabulary.getTermByToken, 'missing')
+
+    def test_exclusive(self):
+        vocabulary = self._makeOne(self._makeTree(), 'at', inclusive=False)
+        self.assertIn('tyr', vocabulary)
+        self.assertNotIn('at', vocabulary)
+        self.assertEqual([t.value for t in vocabulary], ['tyr'])
+        self.assertEqual(len(vocabulary), 1)
+        self.assertRaises(LookupError, vocabulary.getTerm, 'at')
+
+    def test_follows_tree_changes(self):
+        from zope.schema.vocabulary import SimpleTerm
+        tree = self._makeTree()
+        vocabulary = self._makeOne(tree, 'as')
+        self.assertEqual(len(vocabulary), 1)
+        tree.addTerm('as', SimpleTerm('jp'))
+        tree.moveTerm('de', 'as')
+        self.assertEqual([t.value for t in vocabulary], ['as', 'jp', 'de'])
+
+    def test_choice(self):
+        from zope.schema import Choice
+        from zope.schema.interfaces import ConstraintNotSatisfied
+        choice = Choice(source=self._makeOne(self._makeTree(), 'eu'))
+        choice.validate('tyr')
+        self.assertRaises(ConstraintNotSatisfied, choice.validate, 'as')
+
+
 class RegistryTests(unittest.TestCase):
     # Tests of the simple vocabulary and presentation registries.
 
@@ -713,6 +1714,251 @@ class RegistryTests(unittest.TestCase):
     # TODO: still need to test the default implementation
 
 
+class VocabularyRegistryTests(unittest.TestCase):
+
+    def _makeOne(self, *args, **kw):
+        from zope.schema.vocabulary import VocabularyRegistry
+        return VocabularyRegistry(*args, **kw)
+
+    def _register(self, registry, name='vocab'):
+        calls = []
+
+        def factory(context):
+            calls.append(context)
+            return object()
+        registry.register(name, factory)
+        return calls
+
+    def test_class_conforms_to_IVocabularyRegistry(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyRegistry
+        from zope.schema.vocabulary import VocabularyRegistry
+        verifyClass(IVocabularyRegistry, VocabularyRegistry)
+
+    def test_get_missing(self):
+        from zope.schema.vocabulary import VocabularyRegistryError
+        registry = self._makeOne(cache_size=10)
+        with self.assertRaises(VocabularyRegistryError) as exc:
+            registry.get(None, 'missing')
+        self.assertEqual(exc.exception.name, 'missing')
+
+    def test_no_cache_by_default(self):
+        registry = self._makeOne()
+        calls = self._register(registry)
+        self.assertIsNot(registry.get(None, 'vocab'),
+                         registry.get(None, 'vocab'))
+        self.assertEqual(calls, [None, None])
+
+    def test_cache_none_context(self):
+        registry = self._makeOne(cache_size=10)
+        calls = self._register(registry)
+        vocab = registry.get(None, 'vocab')
+        self.assertIs(registry.get(None, 'vocab'), vocab)
+        self.assertEqual(calls, [None])
+
+    def test_other_contexts_not_cached_by_default(self):
+        registry = self._makeOne(cache_size=10)
+        calls = self._register(registry)
+        context = object()
+        self.assertIsNot(registry.get(context, 'vocab'),
+                         registry.get(context, 'vocab'))
+        self.assertEqual(calls, [context, context])
+
+    def test_context_key(self):
+        registry = self._makeOne(
+            cache_size=10,
+            context_key=lambda context: getattr(context, 'lang', None))
+
+        class Context:
+            def __init__(self, lang=None):
+                self.lang = lang
+
+        calls = self._register(registry)
+        en = registry.get(Context('en'), 'vocab')
+        self.assertIs(registry.get(Context('en'), 'vocab'), en)
+        self.assertIsNot(registry.get(Context('fr'), 'vocab'), en)
+        registry.get(Context(), 'vocab')
+        registry.get(Context(), 'vocab')
+        self.assertEqual(len(calls), 4)
+
+    def test_lru_eviction(self):
+        registry = self._makeOne(cache_size=2)
+        calls = {name: self._register(registry, name)
+                 for name in ('a', 'b', 'c')}
+        a = registry.get(None, 'a')
+        registry.get(None, 'b')
+        self.assertIs(registry.get(None, 'a'), a)  # 'b' is now the oldest
+        registry.get(None, 'c')
+        self.assertIs(registry.get(None, 'a'), a)
+        registry.get(None, 'b')
+        self.assertEqual({name: len(c) for name, c in calls.items()},
+                         {'a': 1, 'b': 2, 'c': 1})
+
+    def test_invalidate(self):
+        registry = self._makeOne(cache_size=10)
+        a_calls = self._register(registry, 'a')
+        b_calls = self._register(registry, 'b')
+        registry.get(None, 'a')
+        registry.get(None, 'b')
+        registry.invalidate('a')
+        registry.get(None, 'a')
+        registry.get(None, 'b')
+        self.assertEqual((len(a_calls), len(b_calls)), (2, 1))
+        registry.invalidate()
+        registry.get(None, 'a')
+        registry.get(None, 'b')
+        self.assertEqual((len(a_calls), len(b_calls)), (3, 2))
+
+    def test_register_invalidates(self):
+        registry = self._makeOne(cache_size=10)
+        self._register(registry)
+        old = registry.get(None, 'vocab')
+        calls = self._register(registry)
+        self.assertIsNot(registry.get(None, 'vocab'), old)
+        self.assertEqual(calls, [None])
+
+    def test_unbound_choice_reuses_vocabulary(self):
+        from zope.schema._field import Choice
+        from zope.schema.vocabulary import SimpleVocabulary
+        from zope.schema.vocabulary import _clear
+        from zope.schema.vocabulary import setVocabularyRegistry
+        registry = self._makeOne(cache_size=10)
+        calls = []
+
+        def factory(context):
+            calls.append(context)
+            return SimpleVocabulary.fromValues([1, 2, 3])
+        registry.register('numbers', factory)
+        setVocabularyRegistry(registry)
+        self.addCleanup(_clear)
+        choice = Choice(vocabulary='numbers')
+        for value in (1, 2, 3):
+            choice.validate(value)
+        self.assertEqual(calls, [None])
+
+
+class CachingVocabularyRegistryTests(unittest.TestCase):
+
+    def _makeOne(self, *args, **kw):
+        from zope.schema.vocabulary import CachingVocabularyRegistry
+        registry = CachingVocabularyRegistry(*args, **kw)
+        self.now = 0
+        registry.clock = lambda: self.now
+        return registry
+
+    def _register(self, registry, name='vocab', **kw):
+        calls = []
+
+        def factory(context):
+            calls.append(context)
+            return object()
+        registry.register(name, factory, **kw)
+        return calls
+
+    def test_class_conforms_to_IVocabularyRegistry(self):
+        from zope.interface.verify import verifyClass
+
+        from zope.schema.interfaces import IVocabularyRegistry
+        from zope.schema.vocabulary import CachingVocabularyRegistry
+        verifyClass(IVocabularyRegistry, CachingVocabularyRegistry)
+
+    def test_cache_by_default_and_counters(self):
+        registry = self._makeOne()
+        calls = self._register(registry)
+        vocab = registry.get(None, 'vocab')
+        self.assertIs(registry.get(None, 'vocab'), vocab)
+        self.assertIs(registry.get(None, 'vocab'), vocab)
+        self.assertEqual(calls, [None])
+        self.assertEqual((registry.hits, registry.misses), (2, 1))
+
+    def test_uncached_contexts_are_misses(self):
+        registry = self._makeOne()
+        calls = self._register(registry)
+        context = object()
+        for i in range(3):
+            registry.get(context, 'vocab')
+        self.assertEqual(len(calls), 3)
+        self.assertEqual((registry.hits, registry.misses), (0, 3))
+
+    def test_bound_contexts_cached_with_context_key(self):
+        registry = self._makeOne(context_key=id)
+        calls = self._register(registry)
+        context = object()
+        vocab = registry.get(context, 'vocab')
+        self.assertIs(registry.get(context, 'vocab'), vocab)
+        self.assertIs(registry.get(context, 'vocab'), vocab)
+        self.assertEqual(calls, [context])
+        self.assertEqual((registry.hits, registry.misses), (2, 1))
+
+    def test_ttl(self):
+        registry = self._makeOne(ttl=10)
+        calls = self._register(registry)
+        vocab = registry.get(None, 'vocab')
+        self.now = 9
+        self.assertIs(registry.get(None, 'vocab'), vocab)
+        self.now = 10
+        new = registry.get(None, 'vocab')
+        self.assertIsNot(new, vocab)
+        self.now = 15
+        self.assertIs(registry.get(None, 'vocab'), new)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((registry.hits, registry.misses), (2, 2))
+
+    def test_ttl_by_name(self):
+        registry = self._makeOne(ttl=10)
+        short_calls = self._register(registry, 'short', ttl=1)
+        default_calls = self._register(registry, 'default')
+        for now in range(5):
+            self.now = now
+            registry.get(None, 'short')
+            registry.get(None, 'default')
+        self.assertEqual((len(short_calls), len(default_calls)), (5, 1))
+        # Registering again without a ttl uses the default.
+        short_calls = self._register(registry, 'short')
+        for now in range(5):
+            self.now = now
+            registry.get(None, 'short')
+        self.assertEqual(len(short_calls), 1)
+
+    def test_size_limit_and_invalidate(self):
+        registry = self._makeOne(cache_size=1)
+        a_calls = self._register(registry, 'a')
+        b_calls = self._register(registry, 'b')
+        registry.get(None, 'a')
+        registry.get(None, 'b')
+        registry.get(None, 'a')
+        self.assertEqual((len(a_calls), len(b_calls)), (2, 1))
+        registry.invalidate('a')
+        registry.get(None, 'a')
+        self.assertEqual(len(a_calls), 3)
+
+    def test_choice_bind(self):
+        from zope.schema._field import Choice
+        from zope.schema.vocabulary import SimpleVocabulary
+        from zope.schema.vocabulary import _clear
+        from zope.schema.vocabulary import setVocabularyRegistry
+
+        class Context:
+            lang = 'en'
+
+        registry = self._makeOne(context_key=lambda context: context.lang)
+        calls = []
+
+        def factory(context):
+            calls.append(context)
+            return SimpleVocabulary.fromValues([1, 2, 3])
+        registry.register('numbers', factory)
+        setVocabularyRegistry(registry)
+        self.addCleanup(_clear)
+
+        fields = [Choice(vocabulary='numbers') for _ in range(10)]
+        for field in fields:
+            field.bind(Context()).validate(1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((registry.hits, registry.misses), (9, 1))
+
+
 def _makeSampleVocabulary():
     from zope.interface import implementer
 
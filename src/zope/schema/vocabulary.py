@@ -13,15 +13,26 @@
 ##############################################################################
 """Vocabulary support for schema.
 """
+import mmap
+import os
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left
 from collections import OrderedDict
+from collections.abc import Mapping
 
 from zope.interface import directlyProvides
 from zope.interface import implementer
 from zope.interface import providedBy
 
+from zope.schema.interfaces import ISearchableVocabulary
+from zope.schema.interfaces import ISourceQueriables
 from zope.schema.interfaces import ITitledTokenizedTerm
 from zope.schema.interfaces import ITokenizedTerm
 from zope.schema.interfaces import ITreeVocabulary
+from zope.schema.interfaces import IVocabularyFactory
 from zope.schema.interfaces import IVocabularyRegistry
 from zope.schema.interfaces import IVocabularyTokenized
 
@@ -30,14 +41,49 @@ from zope.schema.interfaces import IVocabularyTokenized
 _marker = object()
 
 
+def _make_token(token):
+    # str(bytes) returns str(repr(bytes)), which is not what we want
+    # here. On the other hand, we want to try to keep the token as
+    # readable as possible. The token should be a native string
+    # (ASCIILine).
+    if isinstance(token, bytes):
+        token = token.decode('raw_unicode_escape')
+    elif not isinstance(token, str):
+        # Nothing we recognize as intended to be textual data.
+        # Get its str() as promised
+        token = str(token)
+    # Escape any non-ASCII characters.
+    if not token.isascii():
+        token = token.encode('ascii', 'backslashreplace').decode('ascii')
+    return token
+
+
 @implementer(ITokenizedTerm)
 class SimpleTerm:
     """
     Simple tokenized term used by SimpleVocabulary.
 
+    Terms store their attributes in slots. Creating a ``SimpleTerm``
+    with a title actually creates a `TitledSimpleTerm`, which
+    implements :class:`zope.schema.interfaces.ITitledTokenizedTerm`
+    without an interface declaration for each term.
+
     .. versionchanged:: 4.6.0
        Implement equality and hashing based on the value, token and title.
+    .. versionchanged:: 7.2
+       Use ``__slots__``, and create a `TitledSimpleTerm` if a title is
+       given.
     """
+    # ``__dict__`` is only created for terms that need it, such as
+    # terms with additional attributes or directly provided interfaces.
+    __slots__ = ('value', 'token', 'title', '__dict__', '__weakref__')
+
+    def __new__(cls, *args, **kwargs):
+        if cls is SimpleTerm:
+            title = args[2] if len(args) > 2 else kwargs.get('title')
+            if title is not None:
+                cls = TitledSimpleTerm
+        return object.__new__(cls)
 
     def __init__(self, value, token=None, title=None):
         """Create a term for *value* and *token*. If *token* is
@@ -48,25 +94,25 @@ class SimpleTerm:
         :class:`zope.schema.interfaces.ITitledTokenizedTerm`.
         """
         self.value = value
-        if token is None:
-            token = value
-        # str(bytes) returns str(repr(bytes)), which is not what we want
-        # here. On the other hand, we want to try to keep the token as
-        # readable as possible. self.token should be a native string
-        # (ASCIILine).
-        if isinstance(token, bytes):
-            token = token.decode('raw_unicode_escape')
-        elif not isinstance(token, str):
-            # Nothing we recognize as intended to be textual data.
-            # Get its str() as promised
-            token = str(token)
-        # Escape any non-ASCII characters.
-        token = token.encode('ascii', 'backslashreplace').decode('ascii')
-        self.token = token
+        self.token = _make_token(value if token is None else token)
         self.title = title
-        if title is not None:
+        if title is not None and not ITitledTokenizedTerm.providedBy(self):
+            # A subclass.
             directlyProvides(self, ITitledTokenizedTerm)
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['value'] = self.value
+        state['token'] = self.token
+        state['title'] = self.title
+        return state
+
+    def __setstate__(self, state):
+        # Terms pickled before ``__slots__`` were used have their
+        # instance dictionary as state, which this is compatible with.
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other):
         if other is self:
             return True
@@ -84,6 +130,19 @@ class SimpleTerm:
         return hash((self.value, self.token, self.title))
 
 
+@implementer(ITitledTokenizedTerm)
+class TitledSimpleTerm(SimpleTerm):
+    """
+    A `SimpleTerm` with a title.
+
+    This is the class of the terms created by ``SimpleTerm`` when a
+    title is given.
+
+    .. versionadded:: 7.2
+    """
+    __slots__ = ()
+
+
 @implementer(IVocabularyTokenized)
 class SimpleVocabulary:
     """
@@ -217,19 +276,556 @@ class SimpleVocabulary:
         return hash(tuple(self._terms))
 
 
+@implementer(IVocabularyTokenized)
+class ColumnarVocabulary:
+    """
+    Vocabulary storing the values, tokens and titles of its terms in
+    parallel tuples, indexed by value and by token.
+
+    Unlike `SimpleVocabulary`, no term objects are kept: a `SimpleTerm`
+    is created when one is requested by :meth:`getTerm`,
+    :meth:`getTermByToken` or iteration. This uses less memory and is
+    faster to create for large vocabularies, in exchange for creating
+    terms on demand.
+
+    .. versionadded:: 7.2
+    """
+
+    def __init__(self, values, *interfaces, tokens=None, titles=None,
+                 swallow_duplicates=False):
+        """Initialize the vocabulary given a sequence of values.
+
+        *tokens* and *titles*, if given, are sequences of the same
+        length. Tokens are made from the values (or the given tokens)
+        like `SimpleTerm` does. Terms have no title if *titles* is
+        omitted, or if their title is ``None``.
+
+        One or more interfaces may also be provided so that alternate
+        widgets may be bound without subclassing.
+
+        Like for `SimpleVocabulary`, ValueErrors are thrown if
+        duplicate values or tokens are passed in, unless
+        ``swallow_duplicates=True`` is passed, in which case the last
+        term with a given value or token is the one found.
+        """
+        self._values = values = tuple(values)
+        if tokens is None:
+            tokens = values
+        self._tokens = tokens = tuple(map(_make_token, tokens))
+        self._titles = titles = tuple(titles) if titles is not None else None
+        if (len(tokens) != len(values)
+                or (titles is not None and len(titles) != len(values))):
+            raise ValueError('values, tokens and titles must have the '
+                             'same length')
+        # The same row numbers are shared by both indexes.
+        rows = list(range(len(values)))
+        self._row_by_value = dict(zip(values, rows))
+        self._row_by_token = dict(zip(tokens, rows))
+        if not swallow_duplicates:
+            if len(self._row_by_value) != len(values):
+                raise ValueError('term values must be unique: %r'
+                                 % _first_duplicate(values))
+            if len(self._row_by_token) != len(tokens):
+                raise ValueError('term tokens must be unique: %r'
+                                 % _first_duplicate(tokens))
+        if interfaces:
+            directlyProvides(self, *interfaces)
+
+    @classmethod
+    def fromItems(cls, items, *interfaces):
+        """
+        Construct a vocabulary from a list of (token, value) pairs or
+        (token, value, title) triples, like
+        `SimpleVocabulary.fromItems`.
+        """
+        tokens = []
+        values = []
+        titles = []
+        for item in items:
+            tokens.append(item[0])
+            values.append(item[1])
+            titles.append(item[2] if len(item) > 2 else None)
+        if not any(title is not None for title in titles):
+            titles = None
+        return cls(values, *interfaces, tokens=tokens, titles=titles)
+
+    @classmethod
+    def fromValues(cls, values, *interfaces):
+        """
+        Construct a vocabulary from a simple list, like
+        `SimpleVocabulary.fromValues`.
+        """
+        return cls(values, *interfaces)
+
+    def _term(self, row):
+        titles = self._titles
+        return SimpleTerm(self._values[row], self._tokens[row],
+                          titles[row] if titles is not None else None)
+
+    def __contains__(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        try:
+            return value in self._row_by_value
+        except TypeError:
+            # sometimes values are not hashable
+            return False
+
+    def getTerm(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        try:
+            row = self._row_by_value[value]
+        except (KeyError, TypeError):
+            raise LookupError(value)
+        return self._term(row)
+
+    def getTermByToken(self, token):
+        """See zope.schema.interfaces.IVocabularyTokenized"""
+        try:
+            row = self._row_by_token[token]
+        except (KeyError, TypeError):
+            raise LookupError(token)
+        return self._term(row)
+
+    def __iter__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return map(self._term, range(len(self._values)))
+
+    def __len__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return len(self._row_by_value)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+
+        if not isinstance(other, ColumnarVocabulary):
+            return False
+
+        return (self._values == other._values
+                and self._tokens == other._tokens
+                and self._titles == other._titles
+                and providedBy(self) == providedBy(other))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._tokens)
+
+
+@implementer(IVocabularyTokenized)
+class LazyVocabulary:
+    """
+    Vocabulary whose terms are only created when they are needed.
+
+    *terms* is a callable returning an iterable of
+    :class:`~zope.schema.interfaces.ITokenizedTerm` objects, such as a
+    generator function. It is called the first time all the terms are
+    needed (to iterate over them, count them, or to look up a value or
+    token that the following callables cannot), and the terms are then
+    kept in a `SimpleVocabulary`.
+
+    Until then, single values are checked and looked up with the
+    optional callables:
+
+    - *contains*, taking a value and returning whether it is in the
+      vocabulary;
+    - *lookup*, taking a value and returning its term, or raising a
+      `LookupError`;
+    - *lookup_token*, the same for a token.
+
+    The terms that *lookup* and *lookup_token* return are kept, so that
+    they are only created once.
+
+    .. versionadded:: 7.2
+    """
+
+    def __init__(self, terms, *interfaces, contains=None, lookup=None,
+                 lookup_token=None):
+        """Initialize the vocabulary given a callable returning its
+        terms.
+
+        One or more interfaces may also be provided so that alternate
+        widgets may be bound without subclassing.
+        """
+        self._terms = terms
+        self._contains = contains
+        self._lookup = lookup
+        self._lookup_token = lookup_token
+        self._vocabulary = None
+        self._by_value = {}
+        self._by_token = {}
+        if interfaces:
+            directlyProvides(self, *interfaces)
+
+    @classmethod
+    def fromValues(cls, values, *interfaces):
+        """
+        Construct a vocabulary from a collection of values, whose terms
+        are created by `SimpleVocabulary.createTerm`.
+
+        If *values* supports ``in`` (a `set` or a `range`, for example),
+        values are checked and looked up using it. Otherwise, and to
+        look up tokens, all the terms are created.
+        """
+        def terms():
+            return map(SimpleVocabulary.createTerm, values)
+
+        if not hasattr(values, '__contains__'):
+            return cls(terms, *interfaces)
+
+        def lookup(value):
+            if value not in values:
+                raise LookupError(value)
+            return SimpleVocabulary.createTerm(value)
+
+        return cls(terms, *interfaces,
+                   contains=values.__contains__, lookup=lookup)
+
+    def _all_terms(self):
+        # The SimpleVocabulary of all the terms, created if needed.
+        vocabulary = self._vocabulary
+        if vocabulary is None:
+            # The terms looked up so far are kept: other threads may
+            # still be using them.
+            vocabulary = self._vocabulary = SimpleVocabulary(
+                list(self._terms()))
+        return vocabulary
+
+    def __contains__(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        if self._vocabulary is None:
+            try:
+                if self._contains is not None:
+                    return bool(self._contains(value))
+                if self._lookup is not None:
+                    self.getTerm(value)
+                    return True
+            except TypeError:
+                # sometimes values are not hashable
+                return False
+            except LookupError:
+                return False
+        return value in self._all_terms()
+
+    def getTerm(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        if self._vocabulary is None:
+            try:
+                return self._by_value[value]
+            except KeyError:
+                pass
+            if self._lookup is not None:
+                term = self._lookup(value)
+                self._by_value[value] = term
+                self._by_token[term.token] = term
+                return term
+        return self._all_terms().getTerm(value)
+
+    def getTermByToken(self, token):
+        """See zope.schema.interfaces.IVocabularyTokenized"""
+        if self._vocabulary is None:
+            try:
+                return self._by_token[token]
+            except KeyError:
+                pass
+            if self._lookup_token is not None:
+                term = self._lookup_token(token)
+                self._by_value[term.value] = term
+                self._by_token[token] = term
+                return term
+        return self._all_terms().getTermByToken(token)
+
+    def __iter__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return iter(self._all_terms())
+
+    def __len__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return len(self._all_terms())
+
+
+# The header of MappedVocabulary files: a magic string, the byte
+# order of the numbers that follow, and the number of terms.
+_MAPPED_MAGIC = b'ZSVOCAB1'
+_MAPPED_BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+_MAPPED_HEADER_SIZE = 24
+
+
+def _encode_mapped(value):
+    # Encode a value or title of a MappedVocabulary, prefixing it with
+    # its type.
+    if value is None:
+        return b''
+    kind = type(value)
+    if kind is str:
+        return b's' + value.encode('utf-8', 'surrogatepass')
+    if kind is bytes:
+        return b'b' + value
+    if kind is int:
+        return b'i' + str(value).encode('ascii')
+    raise TypeError(value)
+
+
+def _decode_mapped(data):
+    if not data:
+        return None
+    kind = data[:1]
+    if kind == b's':
+        return data[1:].decode('utf-8', 'surrogatepass')
+    if kind == b'b':
+        return data[1:]
+    return int(data[1:])
+
+
+@implementer(IVocabularyTokenized, IVocabularyFactory)
+class MappedVocabulary:
+    """
+    Vocabulary stored in an index file that is read through `mmap`.
+
+    The file is created once (see :meth:`fromItems`) and can then be
+    opened by any number of processes, which share its pages instead
+    of each building the vocabulary in memory. Terms are read from the
+    file when requested: values and tokens are found by binary search
+    in sorted indexes, and iteration follows the original order of the
+    terms.
+
+    Values must be `str`, `bytes` or `int`, and titles `str` (stored
+    as plain text, so that message ids lose their domain) or ``None``.
+    Values are compared by type and content, so that, unlike in a
+    `SimpleVocabulary`, ``True`` or ``1.0`` are not found for a value
+    of ``1``.
+
+    The vocabulary is its own factory: it can be registered with a
+    `VocabularyRegistry` for any context.
+
+    .. versionadded:: 7.2
+    """
+
+    def __init__(self, path, *interfaces):
+        """Open the vocabulary file at *path*.
+
+        One or more interfaces may also be provided so that alternate
+        widgets may be bound without subclassing.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._mmap[:_MAPPED_HEADER_SIZE]
+        if (len(header) != _MAPPED_HEADER_SIZE
+                or header[:8] != _MAPPED_MAGIC
+                or header[8:9] != _MAPPED_BYTEORDER):
+            self._mmap.close()
+            raise ValueError('not a vocabulary file: %r' % (path,))
+        self._count = count = int.from_bytes(header[16:], sys.byteorder)
+        # For each term, the offsets of its token, value and title,
+        # and of the end of the term; then the rows sorted by token,
+        # and by value.
+        self._data_start = _MAPPED_HEADER_SIZE + 6 * 8 * count
+        with memoryview(self._mmap) as view:
+            numbers = view[_MAPPED_HEADER_SIZE:self._data_start].cast('Q')
+        self._offsets = numbers[:4 * count]
+        self._rows_by_token = numbers[4 * count:5 * count]
+        self._rows_by_value = numbers[5 * count:]
+        numbers.release()
+        if interfaces:
+            directlyProvides(self, *interfaces)
+
+    @classmethod
+    def fromItems(cls, items, path, *interfaces):
+        """
+        Write a vocabulary file at *path* for a list of (token, value)
+        pairs or (token, value, title) triples, as accepted by
+        `SimpleVocabulary.fromItems`, and open it.
+
+        The file is replaced atomically, so that processes that already
+        opened the previous version keep using it. Its permissions are
+        those of a new file, according to the umask of the process.
+        """
+        _write_mapped_vocabulary(path, items)
+        return cls(path, *interfaces)
+
+    @classmethod
+    def fromValues(cls, values, path, *interfaces):
+        """
+        Write a vocabulary file at *path* for a list of values, like
+        `SimpleVocabulary.fromValues`, and open it.
+        """
+        return cls.fromItems([(value, value) for value in values], path,
+                             *interfaces)
+
+    def __call__(self, context):
+        """See zope.schema.interfaces.IVocabularyFactory"""
+        return self
+
+    def close(self):
+        """Close the vocabulary file."""
+        self._offsets.release()
+        self._rows_by_token.release()
+        self._rows_by_value.release()
+        self._mmap.close()
+
+    def _field(self, row, column):
+        offsets = self._offsets
+        start = self._data_start
+        index = 4 * row + column
+        return self._mmap[start + offsets[index]:start + offsets[index + 1]]
+
+    def _find(self, rows, column, key):
+        # Binary search *rows*, sorted by *column*, for the row of *key*.
+        field = self._field
+        lo = 0
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if field(rows[mid], column) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and field(rows[lo], column) == key:
+            return rows[lo]
+        return None
+
+    def _find_value(self, value):
+        try:
+            key = _encode_mapped(value)
+        except TypeError:
+            return None
+        if not key:
+            return None
+        return self._find(self._rows_by_value, 1, key)
+
+    def _term(self, row):
+        return SimpleTerm(_decode_mapped(self._field(row, 1)),
+                          self._field(row, 0).decode('ascii'),
+                          _decode_mapped(self._field(row, 2)))
+
+    def __contains__(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        return self._find_value(value) is not None
+
+    def getTerm(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        row = self._find_value(value)
+        if row is None:
+            raise LookupError(value)
+        return self._term(row)
+
+    def getTermByToken(self, token):
+        """See zope.schema.interfaces.IVocabularyTokenized"""
+        if not isinstance(token, str) or not token.isascii():
+            raise LookupError(token)
+        row = self._find(self._rows_by_token, 0, token.encode('ascii'))
+        if row is None:
+            raise LookupError(token)
+        return self._term(row)
+
+    def __iter__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return map(self._term, range(self._count))
+
+    def __len__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return self._count
+
+
+def _write_mapped_vocabulary(path, items):
+    tokens = []
+    values = []
+    offsets = array('Q')
+    data = bytearray()
+    for item in items:
+        token = _make_token(item[0]).encode('ascii')
+        if item[1] is None:
+            raise TypeError(item[1])
+        value = _encode_mapped(item[1])
+        title = item[2] if len(item) > 2 else None
+        if isinstance(title, str):
+            # Not a subclass, such as a message id.
+            title = str(title)
+        elif title is not None:
+            raise TypeError(title)
+        title = _encode_mapped(title)
+        tokens.append(token)
+        values.append(value)
+        offsets.append(len(data))
+        data += token
+        offsets.append(len(data))
+        data += value
+        offsets.append(len(data))
+        data += title
+        offsets.append(len(data))
+    if len(set(values)) != len(values):
+        raise ValueError('term values must be unique: %r'
+                         % _decode_mapped(_first_duplicate(values)))
+    if len(set(tokens)) != len(tokens):
+        raise ValueError('term tokens must be unique: %r'
+                         % _first_duplicate(tokens).decode('ascii'))
+
+    rows = range(len(values))
+    header = (_MAPPED_MAGIC + _MAPPED_BYTEORDER.ljust(8, b'\0')
+              + array('Q', [len(values)]).tobytes())
+    # Create the file like open() would, with the permissions allowed
+    # by the umask, under a unique name next to *path*.
+    temp_path = '{}.{}.tmp'.format(os.path.abspath(path), os.urandom(8).hex())
+    fd = os.open(temp_path,
+                 os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                 | getattr(os, 'O_BINARY', 0),
+                 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(offsets.tobytes())
+            f.write(array('Q', sorted(rows, key=tokens.__getitem__)))
+            f.write(array('Q', sorted(rows, key=values.__getitem__)))
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _first_duplicate(items):
+    # Only called when *items* has duplicates.
+    seen = set()
+    for item in items:  # pragma: no branch
+        if item in seen:
+            return item
+        seen.add(item)
+
+
 def _createTermTree(ttree, dict_):
     """ Helper method that creates a tree-like dict with ITokenizedTerm
     objects as keys from a similar tree with tuples as keys.
 
     See fromDict for more details.
     """
-    for key in sorted(dict_.keys()):
-        term = SimpleTerm(key[1], key[0], *key[2:])
-        ttree[term] = TreeVocabulary.terms_factory()
-        _createTermTree(ttree[term], dict_[key])
+    # Use an explicit stack rather than recursion so that deep trees don't
+    # exceed the recursion limit.
+    stack = [(ttree, dict_)]
+    while stack:
+        branch, branch_dict = stack.pop()
+        for key in sorted(branch_dict.keys()):
+            term = SimpleTerm(key[1], key[0], *key[2:])
+            branch[term] = TreeVocabulary.terms_factory()
+            stack.append((branch[term], branch_dict[key]))
     return ttree
 
 
+class _Root:
+    # The type of TreeVocabulary.ROOT.
+
+    def __repr__(self):
+        return 'ROOT'
+
+    def __reduce__(self):
+        # Pickle by reference, so that there is only ever one.
+        return '_ROOT'
+
+
+_ROOT = _Root()
+
+
 @implementer(ITreeVocabulary)
 class TreeVocabulary:
     """ Vocabulary that relies on a tree (i.e nested) structure.
@@ -239,6 +835,31 @@ class TreeVocabulary:
     # compliant object type. Python 2.7's OrderedDict for example.
     terms_factory = OrderedDict
 
+    #: The parent of the terms at the root of the tree, in
+    #: ``parent_by_value``, `addTerm` and `moveTerm`. (``None`` can't be
+    #: used, since it may be the value of a term.)
+    #:
+    #: .. versionadded:: 7.2
+    ROOT = _ROOT
+
+    #: Incremented each time the tree is changed with `addTerm`,
+    #: `removeTerm` or `moveTerm`, so that information derived from
+    #: the tree can be recomputed when needed.
+    #:
+    #: .. versionadded:: 7.2
+    version = 0
+
+    #: The number of paths that `getTermPath` keeps, most recently used
+    #: first, instead of computing them from ``parent_by_value`` again.
+    #:
+    #: .. versionadded:: 7.2
+    path_cache_size = 128
+
+    # (version, intervals, order) where intervals maps each value to its
+    # (pre-order number, last pre-order number of its subtree, depth) and
+    # order lists the values in pre-order. Built when first needed.
+    _intervals = None
+
     def __init__(self, terms, *interfaces):
         """Initialize the vocabulary given a recursive dict (i.e a tree) with
         ITokenizedTerm objects for keys and self-similar dicts representing the
@@ -255,14 +876,30 @@ class TreeVocabulary:
         self._terms = self.terms_factory()
         self._terms.update(terms)
 
-        self.path_by_value = {}
+        self.parent_by_value = {}
         self.term_by_value = {}
         self.term_by_token = {}
+        self._path_cache = OrderedDict()
         self._populateIndexes(terms)
 
         if interfaces:
             directlyProvides(self, *interfaces)
 
+    def __setstate__(self, state):
+        # Vocabularies pickled before ``parent_by_value`` was added have
+        # a ``path_by_value`` index instead, now a read-only property.
+        state = dict(state)
+        rebuild = 'parent_by_value' not in state
+        state.pop('path_by_value', None)
+        self.__dict__.update(state)
+        if '_path_cache' not in state:
+            self._path_cache = OrderedDict()
+        if rebuild:
+            self.parent_by_value = {}
+            self.term_by_value = {}
+            self.term_by_token = {}
+            self._populateIndexes(self._terms)
+
     def __contains__(self, value):
         """ See zope.schema.interfaces.IBaseVocabulary
 
@@ -347,15 +984,44 @@ class TreeVocabulary:
         """
         return cls(_createTermTree(cls.terms_factory(), dict_), *interfaces)
 
+    @property
+    def path_by_value(self):
+        """A read-only mapping from values to the lists returned by
+        `getTermPath`.
+
+        .. versionchanged:: 7.2
+           The paths are computed from ``parent_by_value`` when they are
+           needed instead of being stored for every term.
+        """
+        return _PathsByValue(self)
+
     def _populateIndexes(self, tree):
         """ The TreeVocabulary contains three helper indexes for quick lookups.
-        They are: term_by_value, term_by_token and path_by_value
+        They are: term_by_value, term_by_token and parent_by_value, which
+        maps each value to the value of its parent term (or `ROOT` for
+        terms at the root).
 
-        This method recurses through the tree and populates these indexes.
+        This method walks the tree depth first in a single pass and
+        populates these indexes.
 
         tree:  The tree (a nested/recursive dictionary).
+
+        .. versionchanged:: 7.2
+           Walk the tree once, without recursion so that deep trees can
+           be indexed, and store the parent of each term instead of its
+           full path.
         """
-        for term in tree.keys():
+        # Each stack entry is an iterator over the items of a branch along
+        # with the value of the term owning that branch.
+        stack = [(iter(tree.items()), _ROOT)]
+        while stack:
+            items, parent_value = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                continue
+
+            term, branch = item
             value = getattr(term, 'value')
             token = getattr(term, 'token')
 
@@ -368,10 +1034,8 @@ class TreeVocabulary:
             self.term_by_value[value] = term
             self.term_by_token[token] = term
 
-            if value not in self.path_by_value:  # pragma: no branch
-                self.path_by_value[value] = self._getPathToTreeNode(
-                    self, value)
-            self._populateIndexes(tree[term])
+            self.parent_by_value[value] = parent_value
+            stack.append((iter(branch.items()), value))
 
     def getTerm(self, value):
         """See zope.schema.interfaces.IBaseVocabulary"""
@@ -408,8 +1072,385 @@ class TreeVocabulary:
         to the node with the given value in the tree.
 
         Returns an empty string if no node has that value.
+
+        .. versionchanged:: 7.2
+           The path is computed from ``parent_by_value``, and a new list
+           is returned each time.
+        """
+        try:
+            return list(self._getPath(value))
+        except KeyError:
+            return []
+
+    def _getPath(self, value):
+        # Return the path to the value as a tuple, raising KeyError if
+        # there is no such value.
+        cache = self._path_cache
+        try:
+            path = cache[value]
+        except KeyError:
+            pass
+        except TypeError:
+            # sometimes values are not hashable
+            raise KeyError(value)
+        else:
+            try:
+                cache.move_to_end(value)
+            except KeyError:  # pragma: no cover
+                # Removed by another thread.
+                pass
+            return path
+
+        parent_by_value = self.parent_by_value
+        path = [value]
+        parent_value = parent_by_value[value]
+        while parent_value is not _ROOT:
+            path.append(parent_value)
+            parent_value = parent_by_value[parent_value]
+        path.reverse()
+        path = tuple(path)
+
+        if self.path_cache_size > 0:
+            cache[value] = path
+            while len(cache) > self.path_cache_size:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:  # pragma: no cover
+                    # Emptied by another thread.
+                    break
+        return path
+
+    def _getIntervals(self):
+        index = self._intervals
+        if index is not None and index[0] == self.version:
+            return index[1], index[2]
+
+        intervals = {}
+        order = []
+        stack = [(iter(self._terms.items()), None, -1)]
+        while stack:
+            items, owner, depth = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                if stack:
+                    start, _, owner_depth = intervals[owner]
+                    intervals[owner] = (start, len(order) - 1, owner_depth)
+                continue
+            term, branch = item
+            intervals[term.value] = (len(order), None, depth + 1)
+            order.append(term.value)
+            stack.append((iter(branch.items()), term.value, depth + 1))
+
+        self._intervals = (self.version, intervals, order)
+        return intervals, order
+
+    def isDescendant(self, value, ancestor_value):
+        """Return whether the term with the given value is below the term
+        with the value *ancestor_value*.
+
+        A term is not its own descendant. False is returned if either
+        value is not in the vocabulary.
+
+        .. versionadded:: 7.2
+        """
+        intervals, _ = self._getIntervals()
+        try:
+            start, _, _ = intervals[value]
+            ancestor_start, ancestor_end, _ = intervals[ancestor_value]
+        except (KeyError, TypeError):
+            return False
+        return ancestor_start < start <= ancestor_end
+
+    def getDescendants(self, value):
+        """Return the list of the values of all the terms below the term
+        with the given value, in depth first order.
+
+        A `LookupError` is raised if there is no term with the value.
+
+        .. versionadded:: 7.2
+        """
+        intervals, order = self._getIntervals()
+        try:
+            start, end, _ = intervals[value]
+        except KeyError:
+            raise LookupError(value)
+        return order[start + 1:end + 1]
+
+    def getDepth(self, value):
+        """Return the depth of the term with the given value, 0 for terms
+        at the root of the tree.
+
+        A `LookupError` is raised if there is no term with the value.
+
+        .. versionadded:: 7.2
+        """
+        intervals, _ = self._getIntervals()
+        try:
+            return intervals[value][2]
+        except KeyError:
+            raise LookupError(value)
+
+    def _changed(self):
+        self._path_cache.clear()
+        self.version += 1
+
+    def _getBranch(self, value):
+        # Return the mapping holding the children of the term with the
+        # given value, or the root mapping if the value is ROOT.
+        branch = self._terms
+        if value is not _ROOT:
+            for step in self._getPath(value):
+                branch = branch[self.term_by_value[step]]
+        return branch
+
+    def _walk(self, term, branch):
+        # Iterate over a term and all the terms below it, along with
+        # their branches.
+        stack = [(term, branch)]
+        while stack:
+            term, branch = stack.pop()
+            yield term, branch
+            stack.extend(branch.items())
+
+    def addTerm(self, parent_value, term):
+        """Add *term* as the last child of the term with the value
+        *parent_value*, or at the root of the tree if it is `ROOT`.
+
+        A `LookupError` is raised if there is no term with the parent
+        value, and a `ValueError` if the value or the token of *term*
+        are already used.
+
+        The branches of the tree are changed in place, so they should
+        not be shared with other vocabularies.
+
+        .. versionadded:: 7.2
+        """
+        if parent_value is not _ROOT and parent_value not in self:
+            raise LookupError(parent_value)
+        if term.value in self.term_by_value:
+            raise ValueError(
+                "Term values must be unique: '%s'" % term.value)
+        if term.token in self.term_by_token:
+            raise ValueError(
+                "Term tokens must be unique: '%s'" % term.token)
+
+        self._getBranch(parent_value)[term] = self.terms_factory()
+        self.term_by_value[term.value] = term
+        self.term_by_token[term.token] = term
+        self.parent_by_value[term.value] = parent_value
+        self._changed()
+
+    def removeTerm(self, value):
+        """Remove the term with the given value and all the terms below
+        it.
+
+        A `LookupError` is raised if there is no term with the value.
+
+        .. versionadded:: 7.2
         """
-        return self.path_by_value.get(value, [])
+        term = self.getTerm(value)
+        parent = self._getBranch(self.parent_by_value[value])
+        branch = parent.pop(term)
+        for removed, _ in self._walk(term, branch):
+            del self.term_by_value[removed.value]
+            del self.term_by_token[removed.token]
+            del self.parent_by_value[removed.value]
+        self._changed()
+
+    def moveTerm(self, value, new_parent_value):
+        """Move the term with the given value, along with all the terms
+        below it, to be the last child of the term with the value
+        *new_parent_value*, or to the root of the tree if it is `ROOT`.
+
+        A `LookupError` is raised if either term doesn't exist, and a
+        `ValueError` if the new parent is the term itself or is below it.
+
+        .. versionadded:: 7.2
+        """
+        term = self.getTerm(value)
+        if new_parent_value is not _ROOT:
+            if new_parent_value not in self:
+                raise LookupError(new_parent_value)
+            if value in self._getPath(new_parent_value):
+                raise ValueError(
+                    "Cannot move a term below itself: '%s'" % value)
+
+        parent = self._getBranch(self.parent_by_value[value])
+        branch = parent.pop(term)
+        self._getBranch(new_parent_value)[term] = branch
+        self.parent_by_value[value] = new_parent_value
+        self._changed()
+
+
+_WORD = re.compile(r'\w+')
+
+
+@implementer(ISearchableVocabulary, ISourceQueriables)
+class SearchableVocabularyMixin:
+    """
+    Mixin for tokenized vocabularies that adds prefix search.
+
+    The first search builds a sorted index of the case folded tokens,
+    titles and title words of the terms, so that a search takes
+    logarithmic time plus the time to collect the results, instead of
+    scanning all the terms.
+
+    Subclasses may override ``_searchTerms`` to choose the terms that
+    are indexed; the default is to iterate over the vocabulary. If the
+    vocabulary has a ``version`` attribute, like `TreeVocabulary`, the
+    index is rebuilt when it changes.
+
+    .. versionadded:: 7.2
+    """
+
+    # (version, keys, terms), with the casefolded search keys sorted
+    # and the term of each key. Built when first needed, and replaced
+    # at once so that concurrent searches see a consistent index.
+    _search_index = None
+
+    def _searchTerms(self):
+        return iter(self)
+
+    def _buildSearchIndex(self):
+        version = getattr(self, 'version', None)
+        entries = []
+        for term in self._searchTerms():
+            keys = {term.token.casefold()}
+            title = getattr(term, 'title', None)
+            if isinstance(title, str):
+                title = title.casefold()
+                keys.add(title)
+                keys.update(title[match.start():]
+                            for match in _WORD.finditer(title))
+            entries.extend((key, term) for key in keys)
+        entries.sort(key=lambda entry: entry[0])
+        search_index = self._search_index = (
+            version,
+            [key for key, _ in entries],
+            [term for _, term in entries],
+        )
+        return search_index
+
+    def search(self, query, limit=None):
+        """See zope.schema.interfaces.ISearchableVocabulary"""
+        search_index = self._search_index
+        if (search_index is None
+                or search_index[0] != getattr(self, 'version', None)):
+            search_index = self._buildSearchIndex()
+        _, keys, terms = search_index
+        query = query.casefold()
+        found = []
+        seen = set()
+        index = bisect_left(keys, query)
+        while index < len(keys) and keys[index].startswith(query):
+            if limit is not None and len(found) >= limit:
+                break
+            term = terms[index]
+            if id(term) not in seen:
+                seen.add(id(term))
+                found.append(term)
+            index += 1
+        return found
+
+    def getQueriables(self):
+        """See zope.schema.interfaces.ISourceQueriables"""
+        return (('', self),)
+
+
+class SearchableVocabulary(SearchableVocabularyMixin, SimpleVocabulary):
+    """
+    `SimpleVocabulary` supporting prefix search.
+
+    .. versionadded:: 7.2
+    """
+
+
+class SearchableTreeVocabulary(SearchableVocabularyMixin, TreeVocabulary):
+    """
+    `TreeVocabulary` supporting prefix search of all its terms,
+    including nested ones.
+
+    .. versionadded:: 7.2
+    """
+
+    def _searchTerms(self):
+        return iter(self.term_by_value.values())
+
+
+@implementer(IVocabularyTokenized)
+class SubtreeVocabulary:
+    """
+    Vocabulary of the terms below a term of a `TreeVocabulary`.
+
+    The tree is not copied; membership is checked with
+    `TreeVocabulary.isDescendant`, so the vocabulary follows changes
+    to the tree. If *inclusive* is true, the term with the value *value*
+    is part of the vocabulary too.
+
+    .. versionadded:: 7.2
+    """
+
+    def __init__(self, tree, value, *interfaces, inclusive=True):
+        self.tree = tree
+        self.value = value
+        self.inclusive = inclusive
+        if interfaces:
+            directlyProvides(self, *interfaces)
+
+    def __contains__(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        if self.inclusive and value in self.tree and value == self.value:
+            return True
+        return self.tree.isDescendant(value, self.value)
+
+    def getTerm(self, value):
+        """See zope.schema.interfaces.IBaseVocabulary"""
+        if value not in self:
+            raise LookupError(value)
+        return self.tree.getTerm(value)
+
+    def getTermByToken(self, token):
+        """See zope.schema.interfaces.IVocabularyTokenized"""
+        term = self.tree.getTermByToken(token)
+        if term.value not in self:
+            raise LookupError(token)
+        return term
+
+    def _values(self):
+        values = self.tree.getDescendants(self.value)
+        if self.inclusive:
+            values.insert(0, self.value)
+        return values
+
+    def __iter__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return map(self.tree.getTerm, self._values())
+
+    def __len__(self):
+        """See zope.schema.interfaces.IIterableVocabulary"""
+        return len(self._values())
+
+
+class _PathsByValue(Mapping):
+    # The read-only path_by_value mapping of a TreeVocabulary.
+
+    __slots__ = ('_vocabulary',)
+
+    def __init__(self, vocabulary):
+        self._vocabulary = vocabulary
+
+    def __getitem__(self, value):
+        return list(self._vocabulary._getPath(value))
+
+    def __contains__(self, value):
+        return value in self._vocabulary
+
+    def __iter__(self):
+        return iter(self._vocabulary.parent_by_value)
+
+    def __len__(self):
+        return len(self._vocabulary.parent_by_value)
 
 
 # registry code
@@ -446,23 +1487,172 @@ class VocabularyRegistry:
     An alternative to this is to use the :mod:`zope.component` registry via
     `zope.vocabularyregistry
     <https://pypi.org/project/zope.vocabularyregistry/>`_.
+
+    Vocabularies created by the factories can be cached, so that
+    validating a :class:`~.Choice` field that was not bound does not
+    create its vocabulary again for each value. The cache is disabled
+    unless *cache_size*, the number of vocabularies kept, is positive;
+    the least recently used vocabularies are discarded first.
+
+    Vocabularies are cached by name and by the key that the
+    *context_key* callable returns for the context. If it returns
+    ``None``, the vocabulary for that context is not cached. By
+    default, only vocabularies for a ``None`` context (as used by
+    unbound fields) are cached.
+
+    Use :meth:`invalidate` when cached vocabularies become out of date;
+    registering a factory invalidates the vocabularies of that name.
+
+    .. versionchanged:: 7.2
+       Add *cache_size*, *context_key* and :meth:`invalidate`.
     """
-    __slots__ = ('_map', )
+    __slots__ = ('_map', '_cache', 'cache_size', 'context_key')
 
-    def __init__(self):
+    def __init__(self, cache_size=0, context_key=None):
         self._map = {}
+        self._cache = OrderedDict()
+        self.cache_size = cache_size
+        self.context_key = (
+            context_key if context_key is not None else _none_context_key)
 
     def get(self, context, name):
         """See zope.schema.interfaces.IVocabularyRegistry"""
+        key = self._cache_key(context, name)
+        if key is not None:
+            try:
+                return self._cached_vocabulary(key)
+            except KeyError:
+                pass
         try:
             vtype = self._map[name]
         except KeyError:
             raise VocabularyRegistryError(name)
-        return vtype(context)
+        vocabulary = vtype(context)
+        if key is not None:
+            self._cache_vocabulary(key, vocabulary)
+        return vocabulary
 
     def register(self, name, factory):
         """Register a *factory* for the vocabulary with the given *name*."""
         self._map[name] = factory
+        self.invalidate(name)
+
+    def invalidate(self, name=None):
+        """
+        Discard the cached vocabularies with the given *name*, or all
+        of them.
+
+        .. versionadded:: 7.2
+        """
+        if name is None:
+            self._cache.clear()
+            return
+        for key in [key for key in list(self._cache) if key[0] == name]:
+            self._cache.pop(key, None)
+
+    def _cache_key(self, context, name):
+        if self.cache_size <= 0:
+            return None
+        context_key = self.context_key(context)
+        if context_key is None:
+            return None
+        return (name, context_key)
+
+    def _cached_vocabulary(self, key):
+        # Return the cached vocabulary, or raise KeyError.
+        cache = self._cache
+        vocabulary = cache[key]
+        cache.move_to_end(key)
+        return vocabulary
+
+    def _cache_vocabulary(self, key, vocabulary):
+        cache = self._cache
+        cache[key] = vocabulary
+        while len(cache) > self.cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:  # pragma: no cover
+                # Emptied by another thread.
+                break
+
+
+class CachingVocabularyRegistry(VocabularyRegistry):
+    """
+    A `VocabularyRegistry` that caches vocabularies by default, and can
+    expire them.
+
+    Up to *cache_size* vocabularies are cached; see
+    `VocabularyRegistry` for *context_key*. Without it, only the
+    vocabularies of unbound fields (a ``None`` context) are cached: to
+    cache the vocabularies of bound `~.Choice` fields, give a
+    *context_key* returning the same key for contexts whose
+    vocabularies are the same (for example the language they use, or
+    a version of the data they hold). Cached vocabularies are
+    created again once they are older than *ttl* seconds, or never if
+    it is None. A different time to live can be given to
+    :meth:`register` for each vocabulary name.
+
+    The number of vocabularies found in the cache and of the ones that
+    had to be created (including those for contexts that are not
+    cached) are counted in :attr:`hits` and :attr:`misses`.
+
+    Install it with `setVocabularyRegistry`.
+
+    .. versionadded:: 7.2
+    """
+    __slots__ = ('_ttl_by_name', 'ttl', 'hits', 'misses', 'clock')
+
+    def __init__(self, cache_size=128, context_key=None, ttl=None):
+        super().__init__(cache_size, context_key)
+        self._ttl_by_name = {}
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        #: The function returning the current time, in seconds.
+        self.clock = time.monotonic
+
+    def register(self, name, factory, ttl=None):
+        """
+        Register a *factory* for the vocabulary with the given *name*.
+
+        If *ttl* is given, it replaces the registry's time to live for
+        the vocabularies of this name.
+        """
+        if ttl is None:
+            self._ttl_by_name.pop(name, None)
+        else:
+            self._ttl_by_name[name] = ttl
+        super().register(name, factory)
+
+    def _cache_key(self, context, name):
+        key = super()._cache_key(context, name)
+        if key is None:
+            # The vocabulary is created each time.
+            self.misses += 1
+        return key
+
+    def _cached_vocabulary(self, key):
+        try:
+            vocabulary, expires = super()._cached_vocabulary(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        if expires is not None and self.clock() >= expires:
+            self._cache.pop(key, None)
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        return vocabulary
+
+    def _cache_vocabulary(self, key, vocabulary):
+        ttl = self._ttl_by_name.get(key[0], self.ttl)
+        expires = None if ttl is None else self.clock() + ttl
+        super()._cache_vocabulary(key, (vocabulary, expires))
+
+
+def _none_context_key(context):
+    # Vocabularies for other contexts may depend on their state.
+    return () if context is None else None
 
 
 _vocabularies = None